@@ -3,9 +3,17 @@ Game 001: Breakout (打磚塊) - Version 3
 Ultra smooth with minimal redraw
 """
 import curses
-import time
+import os
+import sys
 import random
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.game_loop import GameLoop
+
+UPDATE_STEP = 0.08  # seconds per ball step (the old 30 ms sleep + 50 ms input wait)
+SERVE_DELAY = 0.5   # seconds the ball waits after a life is lost
+
 class Breakout:
     def __init__(self, stdscr):
         self.stdscr = stdscr
@@ -23,6 +31,7 @@ class Breakout:
         self.game_over = False
         self.won = False
         self.running = True
+        self.serve_timer = 0.0
         
         # Store previous positions
         self.prev_ball_x = int(self.ball_x)
@@ -39,7 +48,7 @@ class Breakout:
         """Initialize curses settings"""
         curses.curs_set(0)
         self.stdscr.nodelay(1)
-        self.stdscr.timeout(50)
+        self.stdscr.timeout(0)
         
         curses.start_color()
         curses.init_pair(1, curses.COLOR_RED, curses.COLOR_BLACK)
@@ -178,7 +187,7 @@ class Breakout:
                 self.ball_y = float(self.height - 5)
                 self.ball_dx = random.choice([-1, 1]) * 0.5
                 self.ball_dy = -1.0
-                time.sleep(0.5)
+                self.serve_timer = SERVE_DELAY
         
         # Brick collision
         for row in self.bricks:
@@ -211,46 +220,46 @@ class Breakout:
         elif key == curses.KEY_RIGHT or key == ord('d') or key == ord('D'):
             self.paddle_pos = min(self.width - self.paddle_width - 1, self.paddle_pos + 3)
     
+    def fixed_update(self, dt):
+        """One ball step, held back briefly after a lost life"""
+        if self.serve_timer > 0:
+            self.serve_timer -= dt
+            return
+        self.update()
+    
     def run(self):
         """Main game loop"""
-        while self.running:
-            self.draw()
-            
-            if self.game_over:
-                try:
-                    msg_y = self.height // 2
-                    self.stdscr.addstr(msg_y, self.width // 2 - 10, 
-                                     "💥 GAME OVER! 💥", curses.color_pair(1) | curses.A_BOLD)
-                    self.stdscr.addstr(msg_y + 2, self.width // 2 - 10, 
-                                     f"Final Score: {self.score}", curses.color_pair(6))
-                    self.stdscr.addstr(msg_y + 4, self.width // 2 - 15, 
-                                     "Press any key...", curses.color_pair(6))
-                    self.stdscr.refresh()
-                except curses.error:
-                    pass
-                self.stdscr.nodelay(0)
-                self.stdscr.getch()
-                break
-            
-            if self.won:
-                try:
-                    msg_y = self.height // 2
-                    self.stdscr.addstr(msg_y, self.width // 2 - 8, 
-                                     "🎉 YOU WIN! 🎉", curses.color_pair(3) | curses.A_BOLD)
-                    self.stdscr.addstr(msg_y + 2, self.width // 2 - 10, 
-                                     f"Final Score: {self.score}", curses.color_pair(6))
-                    self.stdscr.addstr(msg_y + 4, self.width // 2 - 15, 
-                                     "Press any key...", curses.color_pair(6))
-                    self.stdscr.refresh()
-                except curses.error:
-                    pass
-                self.stdscr.nodelay(0)
-                self.stdscr.getch()
-                break
-            
-            self.handle_input()
-            self.update()
-            time.sleep(0.03)  # ~33 FPS
+        loop = GameLoop(self.fixed_update, self.draw, self.handle_input, step=UPDATE_STEP)
+        loop.run(until=lambda: self.game_over or self.won or not self.running)
+        
+        if self.game_over:
+            try:
+                msg_y = self.height // 2
+                self.stdscr.addstr(msg_y, self.width // 2 - 10, 
+                                 "💥 GAME OVER! 💥", curses.color_pair(1) | curses.A_BOLD)
+                self.stdscr.addstr(msg_y + 2, self.width // 2 - 10, 
+                                 f"Final Score: {self.score}", curses.color_pair(6))
+                self.stdscr.addstr(msg_y + 4, self.width // 2 - 15, 
+                                 "Press any key...", curses.color_pair(6))
+                self.stdscr.refresh()
+            except curses.error:
+                pass
+            self.stdscr.nodelay(0)
+            self.stdscr.getch()
+        elif self.won:
+            try:
+                msg_y = self.height // 2
+                self.stdscr.addstr(msg_y, self.width // 2 - 8, 
+                                 "🎉 YOU WIN! 🎉", curses.color_pair(3) | curses.A_BOLD)
+                self.stdscr.addstr(msg_y + 2, self.width // 2 - 10, 
+                                 f"Final Score: {self.score}", curses.color_pair(6))
+                self.stdscr.addstr(msg_y + 4, self.width // 2 - 15, 
+                                 "Press any key...", curses.color_pair(6))
+                self.stdscr.refresh()
+            except curses.error:
+                pass
+            self.stdscr.nodelay(0)
+            self.stdscr.getch()
 
 def game_main(stdscr):
     """Main game function"""
@@ -3,10 +3,15 @@ Game 002: Snake (貪吃蛇)
 Classic snake game with smooth curses rendering
 """
 import curses
-import time
+import os
+import sys
 import random
 from collections import deque
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.game_loop import GameLoop
+
 class Snake:
     def __init__(self, stdscr):
         self.stdscr = stdscr
@@ -191,45 +196,37 @@ class Snake:
             self.snake.appendleft(new_head)
             self.snake.pop()
     
+    def fixed_update(self, dt):
+        """One snake step; the loop step follows the current speed"""
+        if not self.paused:
+            self.update()
+        self.loop.step = self.speed
+    
     def run(self):
         """Main game loop"""
-        last_update = time.time()
+        self.loop = GameLoop(self.fixed_update, self.draw, self.handle_input, step=self.speed)
+        self.loop.run(until=lambda: self.game_over or not self.running)
         
-        while self.running:
-            current_time = time.time()
-            
-            self.handle_input()
-            
-            # Update game at appropriate speed
-            if not self.paused and current_time - last_update >= self.speed:
-                self.update()
-                last_update = current_time
-            
-            self.draw()
-            
-            if self.game_over:
-                try:
-                    msg_y = self.height // 2
-                    self.stdscr.addstr(msg_y, self.width // 2 - 10,
-                                     "🐍 GAME OVER! 🐍", 
-                                     curses.color_pair(2) | curses.A_BOLD)
-                    self.stdscr.addstr(msg_y + 2, self.width // 2 - 10,
-                                     f"Final Score: {self.score}",
-                                     curses.color_pair(5))
-                    self.stdscr.addstr(msg_y + 3, self.width // 2 - 10,
-                                     f"Length: {len(self.snake)}",
-                                     curses.color_pair(5))
-                    self.stdscr.addstr(msg_y + 5, self.width // 2 - 15,
-                                     "Press any key...",
-                                     curses.color_pair(5))
-                    self.stdscr.refresh()
-                except curses.error:
-                    pass
-                self.stdscr.nodelay(0)
-                self.stdscr.getch()
-                break
-            
-            time.sleep(0.01)  # Small delay to reduce CPU usage
+        if self.game_over:
+            try:
+                msg_y = self.height // 2
+                self.stdscr.addstr(msg_y, self.width // 2 - 10,
+                                 "🐍 GAME OVER! 🐍", 
+                                 curses.color_pair(2) | curses.A_BOLD)
+                self.stdscr.addstr(msg_y + 2, self.width // 2 - 10,
+                                 f"Final Score: {self.score}",
+                                 curses.color_pair(5))
+                self.stdscr.addstr(msg_y + 3, self.width // 2 - 10,
+                                 f"Length: {len(self.snake)}",
+                                 curses.color_pair(5))
+                self.stdscr.addstr(msg_y + 5, self.width // 2 - 15,
+                                 "Press any key...",
+                                 curses.color_pair(5))
+                self.stdscr.refresh()
+            except curses.error:
+                pass
+            self.stdscr.nodelay(0)
+            self.stdscr.getch()
 
 def game_main(stdscr):
     """Main game function for curses wrapper"""
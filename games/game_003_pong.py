@@ -3,9 +3,16 @@ Game 003: Pong (乒乓球)
 Classic two-player paddle game with smooth curses rendering
 """
 import curses
-import time
+import os
+import sys
 import random
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.game_loop import GameLoop
+
+SERVE_DELAY = 0.5  # seconds the ball waits after a point
+
 class Pong:
     def __init__(self, stdscr):
         self.stdscr = stdscr
@@ -34,8 +41,9 @@ class Pong:
         self.paused = False
         self.running = True
         
-        # Speed
+        # Speed (seconds per ball step) and pause after a point
         self.ball_speed = 0.05
+        self.serve_timer = 0.0
         
         # Previous positions for erasing
         self.prev_ball_x = int(self.ball_x)
@@ -229,7 +237,7 @@ class Pong:
                 self.winner = 2
             else:
                 self.reset_ball()
-                time.sleep(0.5)
+                self.serve_timer = SERVE_DELAY
         elif self.ball_x >= self.width - 2:
             # Player 1 scores
             self.score1 += 1
@@ -238,47 +246,40 @@ class Pong:
                 self.winner = 1
             else:
                 self.reset_ball()
-                time.sleep(0.5)
+                self.serve_timer = SERVE_DELAY
+    
+    def fixed_update(self, dt):
+        """One ball step, held back briefly after each point"""
+        if self.serve_timer > 0:
+            self.serve_timer -= dt
+            return
+        self.update()
     
     def run(self):
         """Main game loop"""
-        last_update = time.time()
+        loop = GameLoop(self.fixed_update, self.draw, self.handle_input, step=self.ball_speed)
+        loop.run(until=lambda: self.game_over or not self.running)
         
-        while self.running:
-            current_time = time.time()
-            
-            self.handle_input()
-            
-            # Update game at appropriate speed
-            if not self.paused and current_time - last_update >= self.ball_speed:
-                self.update()
-                last_update = current_time
-            
-            self.draw()
-            
-            if self.game_over:
-                try:
-                    msg_y = self.height // 2
-                    win_msg = f"🏓 PLAYER {self.winner} WINS! 🏓"
-                    self.stdscr.addstr(msg_y, self.width // 2 - len(win_msg) // 2,
-                                     win_msg, 
-                                     curses.color_pair(5) | curses.A_BOLD)
-                    score_msg = f"Final Score: {self.score1} - {self.score2}"
-                    self.stdscr.addstr(msg_y + 2, self.width // 2 - len(score_msg) // 2,
-                                     score_msg,
-                                     curses.color_pair(4))
-                    continue_msg = "Press any key..."
-                    self.stdscr.addstr(msg_y + 4, self.width // 2 - len(continue_msg) // 2,
-                                     continue_msg,
-                                     curses.color_pair(4))
-                    self.stdscr.refresh()
-                except curses.error:
-                    pass
-                self.stdscr.nodelay(0)
-                self.stdscr.getch()
-                break
-            
-            time.sleep(0.01)
+        if self.game_over:
+            try:
+                msg_y = self.height // 2
+                win_msg = f"🏓 PLAYER {self.winner} WINS! 🏓"
+                self.stdscr.addstr(msg_y, self.width // 2 - len(win_msg) // 2,
+                                 win_msg, 
+                                 curses.color_pair(5) | curses.A_BOLD)
+                score_msg = f"Final Score: {self.score1} - {self.score2}"
+                self.stdscr.addstr(msg_y + 2, self.width // 2 - len(score_msg) // 2,
+                                 score_msg,
+                                 curses.color_pair(4))
+                continue_msg = "Press any key..."
+                self.stdscr.addstr(msg_y + 4, self.width // 2 - len(continue_msg) // 2,
+                                 continue_msg,
+                                 curses.color_pair(4))
+                self.stdscr.refresh()
+            except curses.error:
+                pass
+            self.stdscr.nodelay(0)
+            self.stdscr.getch()
 
 def game_main(stdscr):
     """Main game function for curses wrapper"""
@@ -5,10 +5,16 @@ Game 004: Space Invaders
 """
 
 import curses
-import time
+import os
+import sys
 import random
 from typing import List, Tuple, Optional
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.game_loop import GameLoop
+from utils.screen_buffer import ScreenBuffer
+
 # 遊戲常數
 SCREEN_WIDTH = 80
 SCREEN_HEIGHT = 30
@@ -155,7 +161,9 @@ class SpaceInvaders:
     
     def __init__(self, stdscr):
         self.stdscr = stdscr
+        self.screen = ScreenBuffer(stdscr)  # 畫面緩衝: 只輸出與上一幀不同的格子
         self.setup_colors()
+        self.screen.add_static_layer(self.draw_static)  # 邊框只畫一次
         
         # 遊戲狀態
         self.player_x = PLAYER_START_X
@@ -395,7 +403,7 @@ class SpaceInvaders:
         self.level += 1
         self.init_game()
     
-    def handle_input(self, dt: float) -> bool:
+    def handle_input(self) -> bool:
         """處理輸入"""
         key = self.stdscr.getch()
         
@@ -439,24 +447,19 @@ class SpaceInvaders:
         if self.score > self.high_score:
             self.high_score = self.score
     
+    def draw_static(self, canvas):
+        """繪製靜態圖層: 邊框 (上下邊整行一次寫入)"""
+        border = curses.color_pair(6)
+        canvas.addstr(0, 0, "┌" + "─" * (SCREEN_WIDTH - 2) + "┐", border)
+        for y in range(1, SCREEN_HEIGHT - 1):
+            canvas.addstr(y, 0, "│", border)
+            canvas.addstr(y, SCREEN_WIDTH - 1, "│", border)
+        canvas.addstr(SCREEN_HEIGHT - 1, 0, "└" + "─" * (SCREEN_WIDTH - 2) + "┘", border)
+    
     def render(self):
-        """渲染遊戲畫面"""
-        # 使用 erase() 而不是 clear() 來減少閃爍
-        self.stdscr.erase()
-        
-        # 繪製邊框
-        for y in range(SCREEN_HEIGHT):
-            self.stdscr.addstr(y, 0, "│", curses.color_pair(6))
-            self.stdscr.addstr(y, SCREEN_WIDTH - 1, "│", curses.color_pair(6))
-        
-        for x in range(SCREEN_WIDTH):
-            self.stdscr.addstr(0, x, "─", curses.color_pair(6))
-            self.stdscr.addstr(SCREEN_HEIGHT - 1, x, "─", curses.color_pair(6))
-        
-        self.stdscr.addstr(0, 0, "┌", curses.color_pair(6))
-        self.stdscr.addstr(0, SCREEN_WIDTH - 1, "┐", curses.color_pair(6))
-        self.stdscr.addstr(SCREEN_HEIGHT - 1, 0, "└", curses.color_pair(6))
-        self.stdscr.addstr(SCREEN_HEIGHT - 1, SCREEN_WIDTH - 1, "┘", curses.color_pair(6))
+        """渲染遊戲畫面 (邊框在靜態圖層中)"""
+        # 從靜態圖層開始畫，而不是 clear()，減少閃爍
+        self.screen.erase()
         
         # 繪製 UI
         score_str = f"SCORE: {self.score:05d}"
@@ -464,22 +467,22 @@ class SpaceInvaders:
         hi_str = f"HI: {self.high_score:05d}"
         level_str = f"LEVEL: {self.level}"
         
-        self.stdscr.addstr(1, 3, score_str, curses.color_pair(6))
-        self.stdscr.addstr(1, 25, lives_str, curses.color_pair(1))
-        self.stdscr.addstr(1, 45, hi_str, curses.color_pair(6))
-        self.stdscr.addstr(1, 60, level_str, curses.color_pair(6))
+        self.screen.addstr(1, 3, score_str, curses.color_pair(6))
+        self.screen.addstr(1, 25, lives_str, curses.color_pair(1))
+        self.screen.addstr(1, 45, hi_str, curses.color_pair(6))
+        self.screen.addstr(1, 60, level_str, curses.color_pair(6))
         
         # 繪製外星人
         for row in self.aliens:
             for alien in row:
                 if alien and alien.alive:
                     char = alien.get_char()
-                    self.stdscr.addstr(alien.y, alien.x, char, curses.color_pair(2))
+                    self.screen.addstr(alien.y, alien.x, char, curses.color_pair(2))
         
         # 繪製 UFO
         if self.ufo.active:
             char = self.ufo.get_char()
-            self.stdscr.addstr(self.ufo.y, max(0, self.ufo.x), char[:min(len(char), SCREEN_WIDTH - self.ufo.x)], curses.color_pair(5))
+            self.screen.addstr(self.ufo.y, max(0, self.ufo.x), char[:min(len(char), SCREEN_WIDTH - self.ufo.x)], curses.color_pair(5))
         
         # 繪製掩體
         for shield in self.shields:
@@ -487,32 +490,32 @@ class SpaceInvaders:
                 for dx in range(SHIELD_WIDTH):
                     char = shield.get_char(shield.x + dx, shield.y + dy)
                     if char != " ":
-                        self.stdscr.addstr(shield.y + dy, shield.x + dx, char, curses.color_pair(4))
+                        self.screen.addstr(shield.y + dy, shield.x + dx, char, curses.color_pair(4))
         
         # 繪製子彈
         for bullet in self.player_bullets:
-            self.stdscr.addstr(bullet.y, bullet.x, bullet.get_char(), curses.color_pair(3))
+            self.screen.addstr(bullet.y, bullet.x, bullet.get_char(), curses.color_pair(3))
         
         for bullet in self.alien_bullets:
-            self.stdscr.addstr(bullet.y, bullet.x, bullet.get_char(), curses.color_pair(3))
+            self.screen.addstr(bullet.y, bullet.x, bullet.get_char(), curses.color_pair(3))
         
         # 繪製玩家
         if not self.game_over:
-            self.stdscr.addstr(PLAYER_Y, self.player_x, "▲", curses.color_pair(1))
+            self.screen.addstr(PLAYER_Y, self.player_x, "▲", curses.color_pair(1))
         
         # 繪製控制說明
         controls = "← → Move | SPACE Shoot | P Pause | Q Quit"
-        self.stdscr.addstr(SCREEN_HEIGHT - 2, (SCREEN_WIDTH - len(controls)) // 2, controls, curses.color_pair(6))
+        self.screen.addstr(SCREEN_HEIGHT - 2, (SCREEN_WIDTH - len(controls)) // 2, controls, curses.color_pair(6))
         
         # 遊戲狀態訊息
         if self.game_over:
             msg = "GAME OVER! Press Q to quit"
-            self.stdscr.addstr(SCREEN_HEIGHT // 2, (SCREEN_WIDTH - len(msg)) // 2, msg, curses.color_pair(2) | curses.A_BOLD)
+            self.screen.addstr(SCREEN_HEIGHT // 2, (SCREEN_WIDTH - len(msg)) // 2, msg, curses.color_pair(2) | curses.A_BOLD)
         elif self.paused:
             msg = "PAUSED - Press P to continue"
-            self.stdscr.addstr(SCREEN_HEIGHT // 2, (SCREEN_WIDTH - len(msg)) // 2, msg, curses.color_pair(6) | curses.A_BOLD)
+            self.screen.addstr(SCREEN_HEIGHT // 2, (SCREEN_WIDTH - len(msg)) // 2, msg, curses.color_pair(6) | curses.A_BOLD)
         
-        self.stdscr.refresh()
+        self.screen.refresh()
     
     def run(self):
         """遊戲主迴圈"""
@@ -527,28 +530,8 @@ class SpaceInvaders:
         except:
             pass
         
-        last_time = time.time()
-        
-        while True:
-            current_time = time.time()
-            dt = current_time - last_time
-            last_time = current_time
-            
-            # 處理輸入
-            if not self.handle_input(dt):
-                break
-            
-            # 更新遊戲
-            self.update(dt)
-            
-            # 渲染
-            self.render()
-            
-            # 控制幀率
-            elapsed = time.time() - current_time
-            sleep_time = FRAME_TIME - elapsed
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+        # 固定時間步長: 每次 update 都是 FRAME_TIME 秒，與渲染耗時無關
+        GameLoop(self.update, self.render, self.handle_input, step=FRAME_TIME, fps=FPS).run()
 
 
 def main():
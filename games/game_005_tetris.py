@@ -4,11 +4,19 @@ Game 005: Tetris
 控制: ← → 移動, ↑ 旋轉, ↓ 軟下落, 空格 硬下落, C 暫存, P 暫停, Q 退出
 """
 
+import argparse
 import curses
+import os
+import sys
 import time
-import random
-import copy
-from typing import List, Tuple, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from games.game_005_tetris_engine import BOARD_WIDTH, BOARD_HEIGHT, SHAPES, TetrisEngine
+from games.game_005_tetris_ai import TetrisAI, load_weights
+from games.game_005_tetris_pieces import DEFAULT_GENERATOR, GENERATORS
+from utils.game_loop import GameLoop
+from utils.screen_buffer import ScreenBuffer
 
 # 遊戲常數
 SCREEN_WIDTH = 80
@@ -16,169 +24,40 @@ SCREEN_HEIGHT = 30
 FPS = 30
 FRAME_TIME = 1.0 / FPS
 
-# 遊戲板設定
-BOARD_WIDTH = 10
-BOARD_HEIGHT = 20
+# 遊戲板位置
 BOARD_LEFT = 5
 BOARD_TOP = 3
 
-# 方塊形狀定義 (旋轉狀態)
-SHAPES = {
-    'I': [
-        [[1, 1, 1, 1]],
-        [[1], [1], [1], [1]]
-    ],
-    'O': [
-        [[1, 1], [1, 1]]
-    ],
-    'T': [
-        [[0, 1, 0], [1, 1, 1]],
-        [[1, 0], [1, 1], [1, 0]],
-        [[1, 1, 1], [0, 1, 0]],
-        [[0, 1], [1, 1], [0, 1]]
-    ],
-    'S': [
-        [[0, 1, 1], [1, 1, 0]],
-        [[1, 0], [1, 1], [0, 1]]
-    ],
-    'Z': [
-        [[1, 1, 0], [0, 1, 1]],
-        [[0, 1], [1, 1], [1, 0]]
-    ],
-    'J': [
-        [[1, 0, 0], [1, 1, 1]],
-        [[1, 1], [1, 0], [1, 0]],
-        [[1, 1, 1], [0, 0, 1]],
-        [[0, 1], [0, 1], [1, 1]]
-    ],
-    'L': [
-        [[0, 0, 1], [1, 1, 1]],
-        [[1, 0], [1, 0], [1, 1]],
-        [[1, 1, 1], [1, 0, 0]],
-        [[1, 1], [0, 1], [0, 1]]
-    ]
-}
-
-# 計分規則
-SCORE_LINES = {
-    1: 100,
-    2: 300,
-    3: 500,
-    4: 800
-}
-
-
-class Piece:
-    """方塊類別"""
-    
-    def __init__(self, shape_type: str):
-        self.type = shape_type
-        self.rotation = 0
-        self.shape = SHAPES[shape_type][0]
-        self.x = BOARD_WIDTH // 2 - len(self.shape[0]) // 2
-        self.y = 0
-    
-    def rotate(self, clockwise: bool = True):
-        """旋轉方塊"""
-        rotations = SHAPES[self.type]
-        if clockwise:
-            self.rotation = (self.rotation + 1) % len(rotations)
-        else:
-            self.rotation = (self.rotation - 1) % len(rotations)
-        self.shape = rotations[self.rotation]
-    
-    def get_blocks(self) -> List[Tuple[int, int]]:
-        """獲取方塊佔據的座標"""
-        blocks = []
-        for y, row in enumerate(self.shape):
-            for x, cell in enumerate(row):
-                if cell:
-                    blocks.append((self.x + x, self.y + y))
-        return blocks
-    
-    def copy(self):
-        """複製方塊"""
-        return copy.deepcopy(self)
-
-
-class Board:
-    """遊戲板類別"""
-    
-    def __init__(self):
-        self.width = BOARD_WIDTH
-        self.height = BOARD_HEIGHT
-        self.grid = [[None for _ in range(self.width)] for _ in range(self.height)]
-    
-    def is_valid_position(self, piece: Piece) -> bool:
-        """檢查方塊位置是否有效"""
-        for x, y in piece.get_blocks():
-            # 檢查邊界
-            if x < 0 or x >= self.width:
-                return False
-            if y >= self.height:
-                return False
-            
-            # 檢查是否與已固定方塊重疊
-            if y >= 0 and self.grid[y][x] is not None:
-                return False
-        
-        return True
-    
-    def lock_piece(self, piece: Piece):
-        """固定方塊到遊戲板"""
-        for x, y in piece.get_blocks():
-            if 0 <= y < self.height:
-                self.grid[y][x] = piece.type
-    
-    def clear_lines(self) -> int:
-        """清除完整的行，返回清除的行數"""
-        lines_cleared = 0
-        y = self.height - 1
-        
-        while y >= 0:
-            if all(cell is not None for cell in self.grid[y]):
-                # 刪除這一行
-                del self.grid[y]
-                # 在頂部插入新的空行
-                self.grid.insert(0, [None for _ in range(self.width)])
-                lines_cleared += 1
-            else:
-                y -= 1
-        
-        return lines_cleared
-    
-    def is_game_over(self) -> bool:
-        """檢查遊戲是否結束（頂部有方塊）"""
-        return any(cell is not None for cell in self.grid[0])
+# AI 自動玩家設定
+AI_MOVE_DELAY = 0.1                # 每個落點之間的秒數 (0 = 全速)
+AI_MAX_PLACEMENTS_PER_FRAME = 200  # 全速時每幀最多放幾塊
 
 
-class Tetris:
-    """Tetris 遊戲主類別"""
+class Tetris(TetrisEngine):
+    """Tetris 遊戲主類別 (curses 介面，遊戲規則在 TetrisEngine)"""
     
-    def __init__(self, stdscr):
+    def __init__(self, stdscr, auto: bool = False, lookahead: bool = False,
+                 ai_delay: float = AI_MOVE_DELAY, weights=None, seed=None,
+                 generator: str = DEFAULT_GENERATOR):
         self.stdscr = stdscr
+        self.screen = ScreenBuffer(stdscr)  # 畫面緩衝: 只輸出與上一幀不同的格子
         self.setup_colors()
+        self.screen.add_static_layer(self.draw_static)  # 邊框與說明只畫一次
         
-        # 遊戲狀態
-        self.board = Board()
-        self.current_piece = None
-        self.next_piece = None
-        self.hold_piece = None
-        self.can_hold = True
+        # AI 自動玩家 (A 鍵切換); 自動模式下遊戲結束會自動重新開始
+        self.ai = TetrisAI(weights, lookahead=lookahead)
+        self.auto = auto
+        self.ai_delay = ai_delay
+        self.ai_timer = 0.0
+        self.games_played = 0
         
-        self.score = 0
-        self.lines = 0
-        self.level = 1
-        self.game_over = False
+        super().__init__(seed, generator)
+    
+    def reset(self):
+        """開始新的一局"""
+        super().reset()
         self.paused = False
-        
-        # 計時器
         self.drop_timer = 0
-        self.drop_delay = 1.0
-        
-        # 生成第一個方塊
-        self.spawn_piece()
-        self.next_piece = self.create_random_piece()
     
     def setup_colors(self):
         """設定顏色"""
@@ -201,136 +80,22 @@ class Tetris:
         }
         return curses.color_pair(color_map.get(shape_type, 8))
     
-    def create_random_piece(self) -> Piece:
-        """創建隨機方塊"""
-        shape_type = random.choice(list(SHAPES.keys()))
-        return Piece(shape_type)
-    
-    def spawn_piece(self):
-        """生成新方塊"""
-        if self.next_piece:
-            self.current_piece = self.next_piece
-            self.next_piece = self.create_random_piece()
-        else:
-            self.current_piece = self.create_random_piece()
-        
-        self.can_hold = True
-        
-        # 檢查是否能放置新方塊
-        if not self.board.is_valid_position(self.current_piece):
-            self.game_over = True
-    
-    def get_drop_delay(self) -> float:
-        """根據等級計算下落延遲"""
-        return max(0.1, 1.0 - (self.level - 1) * 0.05)
-    
-    def move_piece(self, dx: int, dy: int) -> bool:
-        """移動方塊"""
-        self.current_piece.x += dx
-        self.current_piece.y += dy
-        
-        if not self.board.is_valid_position(self.current_piece):
-            self.current_piece.x -= dx
-            self.current_piece.y -= dy
-            return False
-        
-        return True
-    
-    def rotate_piece(self, clockwise: bool = True):
-        """旋轉方塊（包含 wall kick）"""
-        original_x = self.current_piece.x
-        original_y = self.current_piece.y
-        original_rotation = self.current_piece.rotation
-        original_shape = self.current_piece.shape
-        
-        # 嘗試旋轉
-        self.current_piece.rotate(clockwise)
-        
-        # 如果位置無效，嘗試 wall kick
-        if not self.board.is_valid_position(self.current_piece):
-            # 嘗試各種偏移
-            offsets = [(0, 0), (-1, 0), (1, 0), (0, -1), (-1, -1), (1, -1)]
-            success = False
-            
-            for dx, dy in offsets:
-                self.current_piece.x = original_x + dx
-                self.current_piece.y = original_y + dy
-                
-                if self.board.is_valid_position(self.current_piece):
-                    success = True
-                    break
-            
-            if not success:
-                # 恢復原狀
-                self.current_piece.x = original_x
-                self.current_piece.y = original_y
-                self.current_piece.rotation = original_rotation
-                self.current_piece.shape = original_shape
-    
-    def soft_drop(self) -> int:
-        """軟下落（加速下落）"""
-        if self.move_piece(0, 1):
-            return 1  # 每格 1 分
-        return 0
-    
-    def hard_drop(self):
-        """硬下落（瞬間落到底部）"""
-        drop_distance = 0
-        while self.move_piece(0, 1):
-            drop_distance += 1
-        
-        self.score += drop_distance * 2  # 每格 2 分
-        self.lock_and_spawn()
-    
-    def hold_current_piece(self):
-        """暫存當前方塊"""
-        if not self.can_hold:
-            return
-        
-        if self.hold_piece is None:
-            # 第一次暫存
-            self.hold_piece = Piece(self.current_piece.type)
-            self.spawn_piece()
-        else:
-            # 交換暫存方塊
-            temp_type = self.current_piece.type
-            self.current_piece = Piece(self.hold_piece.type)
-            self.hold_piece = Piece(temp_type)
-        
-        self.can_hold = False
-    
-    def lock_and_spawn(self):
-        """固定方塊並生成新方塊"""
-        self.board.lock_piece(self.current_piece)
-        
-        # 清除完整的行
-        lines_cleared = self.board.clear_lines()
-        if lines_cleared > 0:
-            self.lines += lines_cleared
-            self.score += SCORE_LINES.get(lines_cleared, 0) * self.level
-            
-            # 每 10 行升一級
-            self.level = self.lines // 10 + 1
-            self.drop_delay = self.get_drop_delay()
-        
-        # 生成新方塊
-        self.spawn_piece()
-        
-        # 檢查遊戲是否結束
-        if self.board.is_game_over():
-            self.game_over = True
-    
-    def get_ghost_piece(self) -> Optional[Piece]:
-        """獲取幽靈方塊（顯示落點）"""
-        if not self.current_piece:
-            return None
-        
-        ghost = self.current_piece.copy()
-        while self.board.is_valid_position(ghost):
-            ghost.y += 1
-        ghost.y -= 1
-        
-        return ghost
+    def update_ai(self, dt: float):
+        """自動模式: 依 ai_delay 放置方塊，結束時自動開新局"""
+        if self.game_over:
+            self.games_played += 1
+            self.reset()
+        
+        self.ai_timer += dt
+        placed = 0
+        # 全速時也只用一幀的時間 (多看一塊時每個落點要幾十毫秒)
+        deadline = time.perf_counter() + FRAME_TIME
+        while (self.ai_timer >= self.ai_delay and not self.game_over
+               and placed < AI_MAX_PLACEMENTS_PER_FRAME and time.perf_counter() < deadline):
+            self.ai_timer -= self.ai_delay
+            self.ai.play(self)
+            placed += 1
+        self.ai_timer = min(self.ai_timer, self.ai_delay)
     
     def handle_input(self) -> bool:
         """處理輸入"""
@@ -343,7 +108,13 @@ class Tetris:
             self.paused = not self.paused
             return True
         
-        if self.paused or self.game_over:
+        if key == ord('a') or key == ord('A'):
+            self.auto = not self.auto
+            self.ai_timer = 0.0
+            return True
+        
+        # 自動模式下方塊只由 AI 控制
+        if self.paused or self.game_over or self.auto:
             return True
         
         # 移動控制
@@ -372,7 +143,14 @@ class Tetris:
     
     def update(self, dt: float):
         """更新遊戲狀態"""
-        if self.paused or self.game_over:
+        if self.paused:
+            return
+        
+        if self.auto:
+            self.update_ai(dt)
+            return
+        
+        if self.game_over:
             return
         
         # 自動下落
@@ -384,25 +162,47 @@ class Tetris:
                 # 無法下落，固定方塊
                 self.lock_and_spawn()
     
-    def render(self):
-        """渲染遊戲畫面"""
-        self.stdscr.erase()
-        
-        # 繪製標題
+    def draw_static(self, canvas):
+        """繪製靜態圖層: 標題、遊戲板邊框、資訊欄標籤與控制說明"""
         title = "T E T R I S"
-        self.stdscr.addstr(1, (SCREEN_WIDTH - len(title)) // 2, title, 
-                          curses.color_pair(8) | curses.A_BOLD)
+        canvas.addstr(1, (SCREEN_WIDTH - len(title)) // 2, title,
+                      curses.color_pair(8) | curses.A_BOLD)
         
-        # 繪製遊戲板邊框
-        for y in range(BOARD_HEIGHT + 1):
-            self.stdscr.addstr(BOARD_TOP + y, BOARD_LEFT - 1, "│", curses.color_pair(8))
-            self.stdscr.addstr(BOARD_TOP + y, BOARD_LEFT + BOARD_WIDTH * 2, "│", curses.color_pair(8))
+        # 遊戲板邊框
+        for y in range(BOARD_HEIGHT):
+            canvas.addstr(BOARD_TOP + y, BOARD_LEFT - 1, "│", curses.color_pair(8))
+            canvas.addstr(BOARD_TOP + y, BOARD_LEFT + BOARD_WIDTH * 2, "│", curses.color_pair(8))
+        canvas.addstr(BOARD_TOP + BOARD_HEIGHT, BOARD_LEFT - 1,
+                      "└" + "─" * (BOARD_WIDTH * 2) + "┘", curses.color_pair(8))
         
-        for x in range(BOARD_WIDTH * 2 + 1):
-            self.stdscr.addstr(BOARD_TOP + BOARD_HEIGHT, BOARD_LEFT - 1 + x, "─", curses.color_pair(8))
+        info_x = BOARD_LEFT + BOARD_WIDTH * 2 + 4
+        canvas.addstr(BOARD_TOP, info_x, "NEXT:", curses.color_pair(8) | curses.A_BOLD)
+        canvas.addstr(BOARD_TOP, info_x + 12, "HOLD:", curses.color_pair(8) | curses.A_BOLD)
         
-        self.stdscr.addstr(BOARD_TOP + BOARD_HEIGHT, BOARD_LEFT - 1, "└", curses.color_pair(8))
-        self.stdscr.addstr(BOARD_TOP + BOARD_HEIGHT, BOARD_LEFT + BOARD_WIDTH * 2, "┘", curses.color_pair(8))
+        # 控制說明
+        controls_y = BOARD_TOP + 9
+        controls = [
+            "CONTROLS:",
+            "← → : Move",
+            "↑   : Rotate CW",
+            "Z   : Rotate CCW",
+            "↓   : Soft Drop",
+            "Space: Hard Drop",
+            "C   : Hold",
+            "A   : Autoplay",
+            "P   : Pause",
+            "Q   : Quit"
+        ]
+        
+        for i, text in enumerate(controls):
+            if i == 0:
+                canvas.addstr(controls_y + i, info_x, text, curses.color_pair(8) | curses.A_BOLD)
+            else:
+                canvas.addstr(controls_y + i, info_x, text, curses.color_pair(8))
+    
+    def render(self):
+        """渲染遊戲畫面 (靜態圖層已在緩衝中，只畫會變動的部分)"""
+        self.screen.erase()
         
         # 繪製已固定的方塊
         for y in range(BOARD_HEIGHT):
@@ -411,7 +211,7 @@ class Tetris:
                     shape_type = self.board.grid[y][x]
                     screen_x = BOARD_LEFT + x * 2
                     screen_y = BOARD_TOP + y
-                    self.stdscr.addstr(screen_y, screen_x, "██", self.get_color_pair(shape_type))
+                    self.screen.addstr(screen_y, screen_x, "██", self.get_color_pair(shape_type))
         
         # 繪製幽靈方塊（使用空心方塊字元）
         ghost = self.get_ghost_piece()
@@ -432,7 +232,7 @@ class Tetris:
                     # ░░ - 淺色陰影（25%）
                     # ▒▒ - 中等陰影（50%）
                     # 目前使用: 冒號（簡單清晰）
-                    self.stdscr.addstr(screen_y, screen_x, "::", curses.color_pair(9) | curses.A_DIM)
+                    self.screen.addstr(screen_y, screen_x, "::", curses.color_pair(9) | curses.A_DIM)
         
         # 繪製當前方塊
         if self.current_piece:
@@ -440,68 +240,48 @@ class Tetris:
                 if 0 <= y < BOARD_HEIGHT:
                     screen_x = BOARD_LEFT + x * 2
                     screen_y = BOARD_TOP + y
-                    self.stdscr.addstr(screen_y, screen_x, "██", 
+                    self.screen.addstr(screen_y, screen_x, "██", 
                                      self.get_color_pair(self.current_piece.type))
         
         # 右側資訊欄
         info_x = BOARD_LEFT + BOARD_WIDTH * 2 + 4
         
         # Next piece
-        self.stdscr.addstr(BOARD_TOP, info_x, "NEXT:", curses.color_pair(8) | curses.A_BOLD)
         if self.next_piece:
             for dy, row in enumerate(self.next_piece.shape):
                 for dx, cell in enumerate(row):
                     if cell:
-                        self.stdscr.addstr(BOARD_TOP + 1 + dy, info_x + dx * 2, "██",
+                        self.screen.addstr(BOARD_TOP + 1 + dy, info_x + dx * 2, "██",
                                          self.get_color_pair(self.next_piece.type))
         
         # Hold piece
-        self.stdscr.addstr(BOARD_TOP, info_x + 12, "HOLD:", curses.color_pair(8) | curses.A_BOLD)
         if self.hold_piece:
             for dy, row in enumerate(SHAPES[self.hold_piece.type][0]):
                 for dx, cell in enumerate(row):
                     if cell:
-                        self.stdscr.addstr(BOARD_TOP + 1 + dy, info_x + 12 + dx * 2, "██",
+                        self.screen.addstr(BOARD_TOP + 1 + dy, info_x + 12 + dx * 2, "██",
                                          self.get_color_pair(self.hold_piece.type))
         
         # 分數資訊
         info_y = BOARD_TOP + 5
-        self.stdscr.addstr(info_y, info_x, f"SCORE: {self.score:06d}", curses.color_pair(8))
-        self.stdscr.addstr(info_y + 1, info_x, f"LINES: {self.lines:03d}", curses.color_pair(8))
-        self.stdscr.addstr(info_y + 2, info_x, f"LEVEL: {self.level:02d}", curses.color_pair(8))
-        
-        # 控制說明
-        controls_y = BOARD_TOP + 9
-        controls = [
-            "CONTROLS:",
-            "← → : Move",
-            "↑   : Rotate CW",
-            "Z   : Rotate CCW",
-            "↓   : Soft Drop",
-            "Space: Hard Drop",
-            "C   : Hold",
-            "P   : Pause",
-            "Q   : Quit"
-        ]
-        
-        for i, text in enumerate(controls):
-            if i == 0:
-                self.stdscr.addstr(controls_y + i, info_x, text, 
-                                 curses.color_pair(8) | curses.A_BOLD)
-            else:
-                self.stdscr.addstr(controls_y + i, info_x, text, curses.color_pair(8))
+        self.screen.addstr(info_y, info_x, f"SCORE: {self.score:06d}", curses.color_pair(8))
+        self.screen.addstr(info_y + 1, info_x, f"LINES: {self.lines:03d}", curses.color_pair(8))
+        self.screen.addstr(info_y + 2, info_x, f"LEVEL: {self.level:02d}", curses.color_pair(8))
+        if self.auto:
+            self.screen.addstr(info_y + 3, info_x, f"AI: ON  GAMES: {self.games_played}",
+                             curses.color_pair(4) | curses.A_BOLD)
         
         # 遊戲狀態訊息
         if self.game_over:
             msg = "GAME OVER! Press Q to quit"
-            self.stdscr.addstr(SCREEN_HEIGHT // 2, (SCREEN_WIDTH - len(msg)) // 2, msg,
+            self.screen.addstr(SCREEN_HEIGHT // 2, (SCREEN_WIDTH - len(msg)) // 2, msg,
                              curses.color_pair(5) | curses.A_BOLD)
         elif self.paused:
             msg = "PAUSED - Press P to continue"
-            self.stdscr.addstr(SCREEN_HEIGHT // 2, (SCREEN_WIDTH - len(msg)) // 2, msg,
+            self.screen.addstr(SCREEN_HEIGHT // 2, (SCREEN_WIDTH - len(msg)) // 2, msg,
                              curses.color_pair(8) | curses.A_BOLD)
         
-        self.stdscr.refresh()
+        self.screen.refresh()
     
     def run(self):
         """遊戲主迴圈"""
@@ -515,34 +295,36 @@ class Tetris:
         except:
             pass
         
-        last_time = time.time()
-        
-        while True:
-            current_time = time.time()
-            dt = current_time - last_time
-            last_time = current_time
-            
-            # 處理輸入
-            if not self.handle_input():
-                break
-            
-            # 更新遊戲
-            self.update(dt)
-            
-            # 渲染
-            self.render()
-            
-            # 控制幀率
-            elapsed = time.time() - current_time
-            sleep_time = FRAME_TIME - elapsed
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+        # 固定時間步長: 每次 update 都是 FRAME_TIME 秒，與渲染耗時無關
+        GameLoop(self.update, self.render, self.handle_input, step=FRAME_TIME, fps=FPS).run()
+
+
+def parse_args(argv=None):
+    """解析命令列參數"""
+    parser = argparse.ArgumentParser(description="Tetris")
+    parser.add_argument("--ai", action="store_true",
+                        help="let the AI autoplayer play (restarts after game over)")
+    parser.add_argument("--lookahead", action="store_true",
+                        help="AI also considers the next piece (about 40x slower: "
+                             "roughly 30-50 placements/s instead of 1000+)")
+    parser.add_argument("--ai-delay", type=float, default=AI_MOVE_DELAY,
+                        help="seconds between AI placements (0 = full speed)")
+    parser.add_argument("--randomizer", choices=sorted(GENERATORS), default=DEFAULT_GENERATOR,
+                        help="piece generator: uniform, 7-bag or history")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="seed for a reproducible piece stream")
+    parser.add_argument("--weights", metavar="FILE",
+                        help="AI weights JSON (e.g. a game_005_tetris_tune.py checkpoint)")
+    return parser.parse_args(argv)
 
 
-def main():
+def main(argv=None):
     """遊戲入口"""
+    args = parse_args(argv)
+    weights = load_weights(args.weights) if args.weights else None
     try:
-        curses.wrapper(lambda stdscr: Tetris(stdscr).run())
+        curses.wrapper(lambda stdscr: Tetris(stdscr, args.ai, args.lookahead, args.ai_delay,
+                                             weights, args.seed, args.randomizer).run())
     except KeyboardInterrupt:
         pass
 
@@ -0,0 +1,254 @@
+"""
+Game 005: Tetris - AI
+自動玩家: 列舉每個可到達的旋轉/欄位落點，依特徵加權評分後選出最佳落點
+
+特徵 (皆在消行之後計算):
+- height: 各欄高度總和
+- lines: 消除的行數
+- holes: 上方有方塊的空格數
+- bumpiness: 相鄰欄高度差的總和
+- wells: 兩側都比自己高的欄 (井) 的深度總和
+"""
+
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from games.game_005_tetris_engine import PIECE_MASKS, SHAPES, Piece, TetrisEngine
+from games.game_005_tetris_pieces import DEFAULT_GENERATOR
+
+FEATURES = ('height', 'lines', 'holes', 'bumpiness', 'wells')
+
+# 預設權重 (常見的四特徵線性評估，wells 預設不計)
+DEFAULT_WEIGHTS = {
+    'height': -0.510066,
+    'lines': 0.760666,
+    'holes': -0.35663,
+    'bumpiness': -0.184483,
+    'wells': 0.0,
+}
+
+TOP_OUT_SCORE = float('-inf')
+
+
+def board_features(rows, width, lines=0):
+    """由列位元遮罩計算特徵 (height, lines, holes, bumpiness, wells)"""
+    height = len(rows)
+    heights = [0] * width
+    seen = 0
+    holes = 0
+    top = 0
+    while top < height and not rows[top]:
+        top += 1  # 上方的空列不影響任何特徵
+    for y in range(top, height):
+        row = rows[y]
+        new = row & ~seen
+        while new:
+            bit = new & -new
+            heights[bit.bit_length() - 1] = height - y
+            new ^= bit
+        seen |= row
+        gaps = seen & ~row
+        if gaps:
+            holes += bin(gaps).count('1')
+
+    bumpiness = 0
+    wells = 0
+    for x in range(width):
+        left = heights[x - 1] if x > 0 else height
+        right = heights[x + 1] if x < width - 1 else height
+        if x < width - 1:
+            bumpiness += abs(heights[x] - right)
+        depth = min(left, right) - heights[x]
+        if depth > 0:
+            wells += depth
+    return (sum(heights), lines, holes, bumpiness, wells)
+
+
+def weight_vector(weights=None):
+    """權重 dict -> 與 FEATURES 同順序的 tuple"""
+    weights = DEFAULT_WEIGHTS if weights is None else weights
+    return tuple(weights.get(name, 0.0) for name in FEATURES)
+
+
+def load_weights(path):
+    """從 JSON 檔讀取權重 ({"height": ..., ...} 或調校器的 checkpoint)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if 'best' in data:
+        data = data['best']['weights']
+    return {name: float(data.get(name, 0.0)) for name in FEATURES}
+
+
+def evaluate(rows, width, lines, vector):
+    """落點評分 (越大越好)"""
+    return sum(w * f for w, f in zip(vector, board_features(rows, width, lines)))
+
+
+def landing_y(rows, row_masks, x, y):
+    """方塊從 (x, y) 直落後的 y"""
+    shifted = [mask << x for mask in row_masks]
+    limit = len(rows) - len(row_masks)
+    while y < limit:
+        below = y + 1
+        for dy, mask in enumerate(shifted):
+            if below + dy >= 0 and rows[below + dy] & mask:
+                return y
+        y = below
+    return y
+
+
+def fits(rows, masks, x, y, width):
+    """方塊 (row_masks, 最左欄, 最右欄) 放在 (x, y) 是否有效"""
+    row_masks, left, right = masks
+    if x + left < 0 or x + right >= width or y + len(row_masks) > len(rows):
+        return False
+    for dy, mask in enumerate(row_masks):
+        if y + dy >= 0 and rows[y + dy] & (mask << x):
+            return False
+    return True
+
+
+def place(rows, row_masks, x, y, full_row):
+    """固定方塊並消行，回傳 (新的列遮罩, 消除行數)"""
+    new_rows = list(rows)
+    for dy, mask in enumerate(row_masks):
+        if y + dy >= 0:
+            new_rows[y + dy] |= mask << x
+    kept = [row for row in new_rows if row != full_row]
+    lines = len(new_rows) - len(kept)
+    if lines:
+        new_rows = [0] * lines + kept
+    return new_rows, lines
+
+
+def placements(rows, shape_type, width):
+    """列舉可到達的落點: 產生 (rotation, x, 新的列遮罩, 消除行數)
+
+    可到達 = 在出生位置旋轉後，沿出生列左右平移再直落。
+    """
+    full_row = (1 << width) - 1
+    spawn = Piece(shape_type)
+    for rotation, masks in enumerate(PIECE_MASKS[shape_type]):
+        if not fits(rows, masks, spawn.x, spawn.y, width):
+            continue
+        columns = [spawn.x]
+        for step in (-1, 1):
+            x = spawn.x + step
+            while fits(rows, masks, x, spawn.y, width):
+                columns.append(x)
+                x += step
+        for x in columns:
+            y = landing_y(rows, masks[0], x, spawn.y)
+            new_rows, lines = place(rows, masks[0], x, y, full_row)
+            yield rotation, x, new_rows, lines
+
+
+class Placement:
+    """AI 選出的落點"""
+
+    def __init__(self, use_hold, rotation, x, score):
+        self.use_hold = use_hold
+        self.rotation = rotation
+        self.x = x
+        self.score = score
+
+    def apply(self, piece):
+        """把方塊放回出生列，套用旋轉與欄位 (之後直接硬下落)
+
+        落點是以「從出生列直落」列舉的，所以不能沿用玩家移動過的 y。
+        """
+        piece.y = Piece(piece.type).y
+        piece.rotation = self.rotation
+        piece.shape = SHAPES[piece.type][self.rotation]
+        piece.x = self.x
+
+
+class TetrisAI:
+    """特徵加權評估的落點搜尋，可選擇多看一個方塊 (next piece)"""
+
+    def __init__(self, weights=None, lookahead=False):
+        self.vector = weight_vector(weights)
+        self.lookahead = lookahead
+        self.evaluated = 0
+
+    def score_rows(self, rows, width, lines, next_type):
+        """落點分數; 有 next_type 時取下一塊最佳落點的分數"""
+        if rows[0]:
+            return TOP_OUT_SCORE
+        if not next_type:
+            self.evaluated += 1
+            return evaluate(rows, width, lines, self.vector)
+
+        best = TOP_OUT_SCORE
+        for _, _, next_rows, next_lines in placements(rows, next_type, width):
+            if next_rows[0]:
+                continue
+            self.evaluated += 1
+            score = evaluate(next_rows, width, lines + next_lines, self.vector)
+            if score > best:
+                best = score
+        return best
+
+    def best_for(self, rows, width, shape_type, next_type):
+        best = None
+        for rotation, x, new_rows, lines in placements(rows, shape_type, width):
+            score = self.score_rows(new_rows, width, lines, next_type)
+            if best is None or score > best[0]:
+                best = (score, rotation, x)
+        return best
+
+    def choose(self, board, current_type, next_type=None, hold_type=None, can_hold=True):
+        """為目前方塊 (或暫存方塊) 選出最佳落點，無落點時回傳 None
+
+        hold_type 為 None 時，暫存會換出 next_type，此時無法多看一塊。
+        """
+        rows = board.rows
+        width = board.width
+        lookahead_type = next_type if self.lookahead else None
+
+        candidates = [(False, current_type, lookahead_type)]
+        if can_hold:
+            if hold_type is not None:
+                if hold_type != current_type:
+                    candidates.append((True, hold_type, lookahead_type))
+            elif next_type is not None and next_type != current_type:
+                candidates.append((True, next_type, None))
+
+        best = None
+        for use_hold, shape_type, peek in candidates:
+            found = self.best_for(rows, width, shape_type, peek)
+            if found and (best is None or found[0] > best.score):
+                best = Placement(use_hold, found[1], found[2], found[0])
+        return best
+
+    def play(self, engine):
+        """為 engine 目前的方塊選落點並硬下落，無落點時結束遊戲"""
+        piece = engine.current_piece
+        placement = self.choose(
+            engine.board, piece.type,
+            engine.next_piece.type if engine.next_piece else None,
+            engine.hold_piece.type if engine.hold_piece else None,
+            engine.can_hold)
+        if placement is None:
+            engine.game_over = True
+            return None
+
+        if placement.use_hold:
+            engine.hold_current_piece()
+        placement.apply(engine.current_piece)
+        if not engine.board.is_valid_position(engine.current_piece):
+            engine.game_over = True  # 不應發生: 落點都在出生列檢查過
+            return None
+        engine.hard_drop()
+        return placement
+
+
+def play_game(ai, seed=None, max_pieces=None, generator=DEFAULT_GENERATOR):
+    """無頭玩一局直到結束 (或放滿 max_pieces 塊)，回傳 TetrisEngine"""
+    engine = TetrisEngine(seed, generator)
+    while not engine.game_over and (max_pieces is None or engine.pieces < max_pieces):
+        ai.play(engine)
+    return engine
@@ -0,0 +1,363 @@
+"""
+Game 005: Tetris - Engine
+方塊、遊戲板與位元遮罩碰撞（不依賴 curses，可供 AI 與無頭模擬使用）
+"""
+
+import random
+from typing import List, Optional, Tuple
+
+from games.game_005_tetris_pieces import DEFAULT_GENERATOR, PieceQueue, make_generator
+
+# 遊戲板設定
+BOARD_WIDTH = 10
+BOARD_HEIGHT = 20
+
+# 方塊形狀定義 (旋轉狀態)
+SHAPES = {
+    'I': [
+        [[1, 1, 1, 1]],
+        [[1], [1], [1], [1]]
+    ],
+    'O': [
+        [[1, 1], [1, 1]]
+    ],
+    'T': [
+        [[0, 1, 0], [1, 1, 1]],
+        [[1, 0], [1, 1], [1, 0]],
+        [[1, 1, 1], [0, 1, 0]],
+        [[0, 1], [1, 1], [0, 1]]
+    ],
+    'S': [
+        [[0, 1, 1], [1, 1, 0]],
+        [[1, 0], [1, 1], [0, 1]]
+    ],
+    'Z': [
+        [[1, 1, 0], [0, 1, 1]],
+        [[0, 1], [1, 1], [1, 0]]
+    ],
+    'J': [
+        [[1, 0, 0], [1, 1, 1]],
+        [[1, 1], [1, 0], [1, 0]],
+        [[1, 1, 1], [0, 0, 1]],
+        [[0, 1], [0, 1], [1, 1]]
+    ],
+    'L': [
+        [[0, 0, 1], [1, 1, 1]],
+        [[1, 0], [1, 0], [1, 1]],
+        [[1, 1, 1], [1, 0, 0]],
+        [[1, 1], [0, 1], [0, 1]]
+    ]
+}
+
+
+def build_piece_masks():
+    """預先計算每個旋轉狀態的列位元遮罩: (row_masks, 最左欄, 最右欄)"""
+    masks = {}
+    for shape_type, rotations in SHAPES.items():
+        masks[shape_type] = []
+        for shape in rotations:
+            rows = tuple(sum(1 << x for x, cell in enumerate(row) if cell) for row in shape)
+            columns = [x for row in shape for x, cell in enumerate(row) if cell]
+            masks[shape_type].append((rows, min(columns), max(columns)))
+    return masks
+
+
+# 列位元遮罩: 第 x 欄 = bit x
+PIECE_MASKS = build_piece_masks()
+
+# 預覽佇列長度
+PREVIEW_SIZE = 5
+
+# 計分規則
+SCORE_LINES = {
+    1: 100,
+    2: 300,
+    3: 500,
+    4: 800
+}
+
+
+class Piece:
+    """方塊類別"""
+    
+    def __init__(self, shape_type: str):
+        self.type = shape_type
+        self.rotation = 0
+        self.shape = SHAPES[shape_type][0]
+        self.x = BOARD_WIDTH // 2 - len(self.shape[0]) // 2
+        self.y = 0
+    
+    def rotate(self, clockwise: bool = True):
+        """旋轉方塊"""
+        rotations = SHAPES[self.type]
+        if clockwise:
+            self.rotation = (self.rotation + 1) % len(rotations)
+        else:
+            self.rotation = (self.rotation - 1) % len(rotations)
+        self.shape = rotations[self.rotation]
+    
+    def get_blocks(self) -> List[Tuple[int, int]]:
+        """獲取方塊佔據的座標"""
+        blocks = []
+        for y, row in enumerate(self.shape):
+            for x, cell in enumerate(row):
+                if cell:
+                    blocks.append((self.x + x, self.y + y))
+        return blocks
+    
+    @property
+    def masks(self):
+        """目前旋轉狀態的 (row_masks, 最左欄, 最右欄)"""
+        return PIECE_MASKS[self.type][self.rotation]
+    
+    def copy(self):
+        """複製方塊"""
+        piece = Piece.__new__(Piece)
+        piece.type = self.type
+        piece.rotation = self.rotation
+        piece.shape = self.shape
+        piece.x = self.x
+        piece.y = self.y
+        return piece
+
+
+class Board:
+    """遊戲板類別"""
+    
+    def __init__(self):
+        self.width = BOARD_WIDTH
+        self.height = BOARD_HEIGHT
+        self.full_row = (1 << self.width) - 1
+        self.grid = [[None for _ in range(self.width)] for _ in range(self.height)]
+        # grid 的位元鏡像: rows[y] 的第 x 位元 = grid[y][x] 已佔用
+        self.rows = [0] * self.height
+    
+    def fits(self, masks, x: int, y: int) -> bool:
+        """以位元遮罩檢查 (row_masks, 最左欄, 最右欄) 放在 (x, y) 是否有效"""
+        row_masks, left, right = masks
+        if x + left < 0 or x + right >= self.width:
+            return False
+        if y + len(row_masks) > self.height:
+            return False
+        rows = self.rows
+        for dy, mask in enumerate(row_masks):
+            # 頂部以上的列不檢查重疊
+            if y + dy >= 0 and rows[y + dy] & (mask << x):
+                return False
+        return True
+    
+    def is_valid_position(self, piece: Piece) -> bool:
+        """檢查方塊位置是否有效"""
+        return self.fits(piece.masks, piece.x, piece.y)
+    
+    def drop_distance(self, piece: Piece) -> int:
+        """方塊還能往下落幾格"""
+        row_masks, left, right = piece.masks
+        if piece.x + left < 0 or piece.x + right >= self.width:
+            return 0
+        shifted = [mask << piece.x for mask in row_masks]
+        rows = self.rows
+        limit = self.height - len(row_masks) - piece.y
+        distance = 0
+        while distance < limit:
+            y = piece.y + distance + 1
+            for dy, mask in enumerate(shifted):
+                if y + dy >= 0 and rows[y + dy] & mask:
+                    return distance
+            distance += 1
+        return distance
+    
+    def lock_piece(self, piece: Piece):
+        """固定方塊到遊戲板"""
+        row_masks = piece.masks[0]
+        for dy, mask in enumerate(row_masks):
+            y = piece.y + dy
+            if 0 <= y < self.height:
+                self.rows[y] |= mask << piece.x
+                row = self.grid[y]
+                for dx, cell in enumerate(piece.shape[dy]):
+                    if cell:
+                        row[piece.x + dx] = piece.type
+    
+    def clear_lines(self) -> int:
+        """清除完整的行，返回清除的行數"""
+        full = self.full_row
+        kept = [y for y in range(self.height) if self.rows[y] != full]
+        lines_cleared = self.height - len(kept)
+        if lines_cleared:
+            # 在頂部補上新的空行
+            self.grid = ([[None] * self.width for _ in range(lines_cleared)]
+                         + [self.grid[y] for y in kept])
+            self.rows = [0] * lines_cleared + [self.rows[y] for y in kept]
+        
+        return lines_cleared
+    
+    def is_game_over(self) -> bool:
+        """檢查遊戲是否結束（頂部有方塊）"""
+        return self.rows[0] != 0
+
+
+class TetrisEngine:
+    """無頭 Tetris 遊戲規則 (不依賴 curses 與時間，可用種子重現)"""
+    
+    def __init__(self, seed=None, generator: str = DEFAULT_GENERATOR):
+        self.rng = random.Random(seed)
+        self.generator = generator
+        self.reset()
+    
+    def reset(self):
+        """開始新的一局"""
+        # 遊戲狀態
+        self.board = Board()
+        self.current_piece = None
+        self.next_piece = None
+        self.hold_piece = None
+        self.can_hold = True
+        
+        self.score = 0
+        self.lines = 0
+        self.level = 1
+        self.pieces = 0
+        self.game_over = False
+        
+        # 下落延遲 (由介面端計時)
+        self.drop_delay = 1.0
+        
+        # 方塊產生器 (每局重新開始，同一個 rng 串流)
+        self.queue = PieceQueue(make_generator(self.generator, self.rng), PREVIEW_SIZE)
+        
+        # 生成第一個方塊
+        self.spawn_piece()
+        self.next_piece = self.create_random_piece()
+    
+    def create_random_piece(self) -> Piece:
+        """從產生器取出下一個方塊"""
+        return Piece(self.queue.pop())
+    
+    def preview(self, count: int = PREVIEW_SIZE) -> List[str]:
+        """next_piece 之後的 count 個方塊種類"""
+        return self.queue.peek(count)
+    
+    def spawn_piece(self):
+        """生成新方塊"""
+        if self.next_piece:
+            self.current_piece = self.next_piece
+            self.next_piece = self.create_random_piece()
+        else:
+            self.current_piece = self.create_random_piece()
+        
+        self.can_hold = True
+        
+        # 檢查是否能放置新方塊
+        if not self.board.is_valid_position(self.current_piece):
+            self.game_over = True
+    
+    def get_drop_delay(self) -> float:
+        """根據等級計算下落延遲"""
+        return max(0.1, 1.0 - (self.level - 1) * 0.05)
+    
+    def move_piece(self, dx: int, dy: int) -> bool:
+        """移動方塊"""
+        self.current_piece.x += dx
+        self.current_piece.y += dy
+        
+        if not self.board.is_valid_position(self.current_piece):
+            self.current_piece.x -= dx
+            self.current_piece.y -= dy
+            return False
+        
+        return True
+    
+    def rotate_piece(self, clockwise: bool = True):
+        """旋轉方塊（包含 wall kick）"""
+        original_x = self.current_piece.x
+        original_y = self.current_piece.y
+        original_rotation = self.current_piece.rotation
+        original_shape = self.current_piece.shape
+        
+        # 嘗試旋轉
+        self.current_piece.rotate(clockwise)
+        
+        # 如果位置無效，嘗試 wall kick
+        if not self.board.is_valid_position(self.current_piece):
+            # 嘗試各種偏移
+            offsets = [(0, 0), (-1, 0), (1, 0), (0, -1), (-1, -1), (1, -1)]
+            success = False
+            
+            for dx, dy in offsets:
+                self.current_piece.x = original_x + dx
+                self.current_piece.y = original_y + dy
+                
+                if self.board.is_valid_position(self.current_piece):
+                    success = True
+                    break
+            
+            if not success:
+                # 恢復原狀
+                self.current_piece.x = original_x
+                self.current_piece.y = original_y
+                self.current_piece.rotation = original_rotation
+                self.current_piece.shape = original_shape
+    
+    def soft_drop(self) -> int:
+        """軟下落（加速下落）"""
+        if self.move_piece(0, 1):
+            return 1  # 每格 1 分
+        return 0
+    
+    def hard_drop(self):
+        """硬下落（瞬間落到底部）"""
+        drop_distance = self.board.drop_distance(self.current_piece)
+        self.current_piece.y += drop_distance
+        
+        self.score += drop_distance * 2  # 每格 2 分
+        self.lock_and_spawn()
+    
+    def hold_current_piece(self):
+        """暫存當前方塊"""
+        if not self.can_hold:
+            return
+        
+        if self.hold_piece is None:
+            # 第一次暫存
+            self.hold_piece = Piece(self.current_piece.type)
+            self.spawn_piece()
+        else:
+            # 交換暫存方塊
+            temp_type = self.current_piece.type
+            self.current_piece = Piece(self.hold_piece.type)
+            self.hold_piece = Piece(temp_type)
+        
+        self.can_hold = False
+    
+    def lock_and_spawn(self):
+        """固定方塊並生成新方塊"""
+        self.board.lock_piece(self.current_piece)
+        self.pieces += 1
+        
+        # 清除完整的行
+        lines_cleared = self.board.clear_lines()
+        if lines_cleared > 0:
+            self.lines += lines_cleared
+            self.score += SCORE_LINES.get(lines_cleared, 0) * self.level
+            
+            # 每 10 行升一級
+            self.level = self.lines // 10 + 1
+            self.drop_delay = self.get_drop_delay()
+        
+        # 生成新方塊
+        self.spawn_piece()
+        
+        # 檢查遊戲是否結束
+        if self.board.is_game_over():
+            self.game_over = True
+    
+    def get_ghost_piece(self) -> Optional[Piece]:
+        """獲取幽靈方塊（顯示落點）"""
+        if not self.current_piece:
+            return None
+        
+        ghost = self.current_piece.copy()
+        ghost.y += self.board.drop_distance(ghost)
+        
+        return ghost
@@ -0,0 +1,103 @@
+"""
+Game 005: Tetris - Piece Generators
+可替換的方塊產生器，全部由傳入的 random.Random 驅動 (同一種子 = 同一串方塊)
+
+- uniform: 每次獨立均勻抽選
+- bag: 7-bag，每 7 塊為一組，組內為 7 種方塊的隨機排列
+- history: 記住最近 4 塊，最多重抽 4 次以避開重複 (TGM 風格)
+PieceQueue 在產生器前面提供 N 塊的預覽佇列。
+"""
+
+import random
+from collections import deque
+
+# 方塊種類 (與 SHAPES 的順序相同)
+PIECE_TYPES = ('I', 'O', 'T', 'S', 'Z', 'J', 'L')
+
+DEFAULT_GENERATOR = 'uniform'
+HISTORY_SIZE = 4
+HISTORY_ROLLS = 4
+
+
+class UniformGenerator:
+    """每塊都從 7 種中均勻抽選"""
+
+    def __init__(self, rng):
+        self.rng = rng
+
+    def next_type(self):
+        return self.rng.choice(PIECE_TYPES)
+
+
+class BagGenerator:
+    """7-bag: 每組 7 塊各出現一次"""
+
+    def __init__(self, rng):
+        self.rng = rng
+        self.bag = []
+
+    def next_type(self):
+        if not self.bag:
+            self.bag = list(PIECE_TYPES)
+            self.rng.shuffle(self.bag)
+        return self.bag.pop()
+
+
+class HistoryGenerator:
+    """避開最近出現過的方塊 (最多重抽 HISTORY_ROLLS 次)，第一塊不會是 S/Z/O"""
+
+    def __init__(self, rng, size=HISTORY_SIZE, rolls=HISTORY_ROLLS):
+        self.rng = rng
+        self.rolls = rolls
+        self.history = deque(('Z', 'S', 'S', 'Z')[:size], maxlen=size)
+        self.first = True
+
+    def next_type(self):
+        if self.first:
+            self.first = False
+            shape_type = self.rng.choice(('I', 'T', 'J', 'L'))
+        else:
+            for _ in range(self.rolls):
+                shape_type = self.rng.choice(PIECE_TYPES)
+                if shape_type not in self.history:
+                    break
+        self.history.append(shape_type)
+        return shape_type
+
+
+GENERATORS = {
+    'uniform': UniformGenerator,
+    'bag': BagGenerator,
+    'history': HistoryGenerator,
+}
+
+
+def make_generator(name=DEFAULT_GENERATOR, rng=None):
+    """依名稱建立產生器; rng 可為 random.Random、種子或 None"""
+    if not isinstance(rng, random.Random):
+        rng = random.Random(rng)
+    try:
+        return GENERATORS[name](rng)
+    except KeyError:
+        raise ValueError(f"Unknown piece generator: {name}") from None
+
+
+class PieceQueue:
+    """產生器前的預覽佇列: 永遠預先備好 size 塊"""
+
+    def __init__(self, generator, size=5):
+        self.generator = generator
+        self.size = size
+        self.queue = deque(generator.next_type() for _ in range(size))
+
+    def pop(self):
+        """取出下一塊並補滿佇列"""
+        self.queue.append(self.generator.next_type())
+        return self.queue.popleft()
+
+    def peek(self, count=None):
+        """接下來的 count 塊 (預設整個佇列)，不會消耗方塊"""
+        count = self.size if count is None else count
+        while len(self.queue) < count:
+            self.queue.append(self.generator.next_type())
+        return [self.queue[i] for i in range(count)]
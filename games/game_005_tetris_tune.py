@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Game 005: Tetris - Weight Tuner
+以演化策略調整 AI 評估權重 (height, lines, holes, bumpiness, wells)
+
+每一代從目前的分佈 (平均值 + 各維標準差) 抽出一群候選權重，
+每個候選以相同的一組種子玩數局無頭 Tetris，取平均消行數為適應度。
+取前幾名 (精英) 的加權平均與離散程度更新分佈 (對角 CMA / cross-entropy 風格)。
+候選在 process pool 中平行評估，每一代結束後把族群與分佈寫入 checkpoint，
+中斷後以同一個 checkpoint 重新執行即可接續。
+
+Usage:
+    python games/game_005_tetris_tune.py --generations 20 --population 24 --games 4
+    python games/game_005_tetris.py --ai --weights .cache/tetris/tune.json
+"""
+
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from games.game_005_tetris_ai import FEATURES, DEFAULT_WEIGHTS, TetrisAI, play_game
+from games.game_005_tetris_pieces import DEFAULT_GENERATOR, GENERATORS
+from utils.cache import cache_file, write_atomic
+
+CHECKPOINT_VERSION = 1
+DEFAULT_MAX_PIECES = 500
+INITIAL_SIGMA = 0.5
+MIN_SIGMA = 0.02
+
+
+def normalize(vector):
+    """權重只有相對大小有意義，統一縮放為單位長度"""
+    length = math.sqrt(sum(w * w for w in vector)) or 1.0
+    return [w / length for w in vector]
+
+
+def as_weights(vector):
+    return dict(zip(FEATURES, vector))
+
+
+def play_candidate(task):
+    """評估一個候選在一個種子上的表現: 回傳 (候選編號, 消行數)"""
+    index, vector, seed, max_pieces, generator = task
+    engine = play_game(TetrisAI(as_weights(vector)), seed, max_pieces, generator)
+    return index, engine.lines
+
+
+def evaluate_population(population, seeds, max_pieces, pool=None, generator=DEFAULT_GENERATOR):
+    """每個候選在所有種子上的平均消行數"""
+    tasks = [(i, vector, seed, max_pieces, generator)
+             for i, vector in enumerate(population) for seed in seeds]
+    results = pool.imap_unordered(play_candidate, tasks) if pool else map(play_candidate, tasks)
+    totals = [0] * len(population)
+    for index, lines in results:
+        totals[index] += lines
+    return [total / len(seeds) for total in totals]
+
+
+class Tuner:
+    """對角共變異數的演化策略，狀態可存成 JSON checkpoint"""
+
+    def __init__(self, population=24, elite=6, games=4, max_pieces=DEFAULT_MAX_PIECES, seed=0,
+                 generator=DEFAULT_GENERATOR):
+        self.population_size = population
+        self.elite = min(elite, population)
+        self.games = games
+        self.max_pieces = max_pieces
+        self.seed = seed
+        self.generator = generator
+        self.generation = 0
+        self.mean = normalize([DEFAULT_WEIGHTS[name] for name in FEATURES])
+        self.sigma = [INITIAL_SIGMA] * len(FEATURES)
+        self.population = []
+        self.fitness = []
+        self.best = None
+        self.history = []
+
+    def sample(self):
+        """抽出這一代的族群 (第一個候選固定為目前的平均值)"""
+        rng = random.Random(self.seed * 1000003 + self.generation)
+        population = [list(self.mean)]
+        while len(population) < self.population_size:
+            population.append(normalize([rng.gauss(m, s) for m, s in zip(self.mean, self.sigma)]))
+        return population
+
+    def seeds(self):
+        """這一代所有候選共用的遊戲種子"""
+        start = self.seed * 1000003 + self.generation * self.games
+        return [start + i for i in range(self.games)]
+
+    def step(self, pool=None):
+        """跑完一代並更新分佈，回傳這一代最佳的 (適應度, 權重向量)"""
+        self.population = self.sample()
+        self.fitness = evaluate_population(self.population, self.seeds(), self.max_pieces, pool,
+                                           self.generator)
+
+        ranked = sorted(zip(self.fitness, self.population), key=lambda item: -item[0])
+        elites = ranked[:self.elite]
+        # 對數遞減的精英權重 (CMA-ES 的 recombination weights)
+        raw = [math.log(self.elite + 0.5) - math.log(rank + 1) for rank in range(len(elites))]
+        total = sum(raw)
+        rec = [w / total for w in raw]
+
+        dims = len(self.mean)
+        mean = [sum(r * vector[d] for r, (_, vector) in zip(rec, elites)) for d in range(dims)]
+        sigma = [max(MIN_SIGMA, math.sqrt(sum(r * (vector[d] - mean[d]) ** 2
+                                              for r, (_, vector) in zip(rec, elites))))
+                 for d in range(dims)]
+        self.mean = normalize(mean)
+        # 平滑更新，避免標準差一次塌縮
+        self.sigma = [0.5 * old + 0.5 * new for old, new in zip(self.sigma, sigma)]
+
+        best_fitness, best_vector = ranked[0]
+        if self.best is None or best_fitness > self.best['fitness']:
+            self.best = {'fitness': best_fitness, 'generation': self.generation,
+                         'weights': as_weights(best_vector)}
+        self.history.append({'generation': self.generation, 'best': best_fitness,
+                             'mean': sum(self.fitness) / len(self.fitness)})
+        self.generation += 1
+        return best_fitness, best_vector
+
+    # ----- checkpoint --------------------------------------------------
+
+    def settings(self):
+        """建構參數 (存進 checkpoint，恢復時沿用)"""
+        return {'population': self.population_size, 'elite': self.elite, 'games': self.games,
+                'max_pieces': self.max_pieces, 'seed': self.seed, 'generator': self.generator}
+
+    def to_dict(self):
+        return {
+            'version': CHECKPOINT_VERSION,
+            'settings': self.settings(),
+            'generation': self.generation,
+            'mean': self.mean,
+            'sigma': self.sigma,
+            'population': [{'weights': as_weights(vector), 'fitness': fitness}
+                           for vector, fitness in zip(self.population, self.fitness)],
+            'best': self.best,
+            'history': self.history,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        tuner = cls(**data['settings'])
+        tuner.generation = data['generation']
+        tuner.mean = data['mean']
+        tuner.sigma = data['sigma']
+        tuner.population = [[entry['weights'][name] for name in FEATURES]
+                            for entry in data['population']]
+        tuner.fitness = [entry['fitness'] for entry in data['population']]
+        tuner.best = data['best']
+        tuner.history = data['history']
+        return tuner
+
+    def save(self, path):
+        write_atomic(path, json.dumps(self.to_dict(), indent=2).encode('utf-8'))
+
+
+def load_checkpoint(path):
+    """讀取 checkpoint，不存在或版本不符時回傳 None"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if data.get('version') != CHECKPOINT_VERSION:
+        return None
+    return Tuner.from_dict(data)
+
+
+# 命令列選項 -> Tuner 參數; 這些設定存在 checkpoint 裡，恢復時不能更改
+SETTING_OPTIONS = (('population', 'population'), ('elite', 'elite'), ('games', 'games'),
+                   ('max_pieces', 'max_pieces'), ('seed', 'seed'), ('randomizer', 'generator'))
+
+
+def settings_conflicts(tuner, given):
+    """明確指定但與 checkpoint 不同的設定，例如 ['--population 48 (checkpoint: 24)']"""
+    settings = tuner.settings()
+    conflicts = []
+    for option, name in SETTING_OPTIONS:
+        if name in given and given[name] != settings[name]:
+            flag = '--' + option.replace('_', '-')
+            conflicts.append(f"{flag} {given[name]} (checkpoint: {settings[name]})")
+    return conflicts
+
+
+def parse_args(argv=None):
+    # 設定類選項預設為 None，才分辨得出使用者是否明確指定
+    parser = argparse.ArgumentParser(description="Evolve Tetris AI evaluation weights")
+    parser.add_argument("-g", "--generations", type=int, default=20,
+                        help="generations to run in this session")
+    parser.add_argument("-p", "--population", type=int, default=None,
+                        help="candidates per generation (default: 24)")
+    parser.add_argument("--elite", type=int, default=None,
+                        help="candidates kept per generation (default: 6)")
+    parser.add_argument("-n", "--games", type=int, default=None,
+                        help="seeded games per candidate (default: 4)")
+    parser.add_argument("--max-pieces", type=int, default=None,
+                        help=f"stop each game after N pieces (default: {DEFAULT_MAX_PIECES})")
+    parser.add_argument("--seed", type=int, default=None, help="base seed (default: 0)")
+    parser.add_argument("--randomizer", choices=sorted(GENERATORS), default=None,
+                        help=f"piece generator used by the training games (default: {DEFAULT_GENERATOR})")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="worker processes (default: CPU count, 1 = no pool)")
+    parser.add_argument("-c", "--checkpoint", default=None,
+                        help="checkpoint JSON (default: .cache/tetris/tune.json)")
+    parser.add_argument("--fresh", action="store_true", help="ignore an existing checkpoint")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    path = args.checkpoint or cache_file('tetris', 'tune.json')
+    if path is None:
+        sys.exit("Cannot create the cache directory; pass --checkpoint PATH")
+
+    given = {name: getattr(args, option) for option, name in SETTING_OPTIONS
+             if getattr(args, option) is not None}
+    tuner = None if args.fresh else load_checkpoint(path)
+    if tuner is None:
+        tuner = Tuner(**given)
+    else:
+        conflicts = settings_conflicts(tuner, given)
+        if conflicts:
+            sys.exit(f"{path} was started with different settings: {', '.join(conflicts)}\n"
+                     "Drop these options to resume it, or pass --fresh to start over.")
+        print(f"Resuming {path} at generation {tuner.generation}")
+
+    workers = args.workers or os.cpu_count() or 1
+    pool = multiprocessing.Pool(workers) if workers > 1 else None
+    try:
+        for _ in range(args.generations):
+            start = time.perf_counter()
+            best_fitness, best_vector = tuner.step(pool)
+            tuner.save(path)
+            mean_fitness = sum(tuner.fitness) / len(tuner.fitness)
+            weights = "  ".join(f"{name} {w:+.3f}" for name, w in zip(FEATURES, best_vector))
+            print(f"gen {tuner.generation - 1:3d}  best {best_fitness:7.1f}  mean {mean_fitness:7.1f}  "
+                  f"{time.perf_counter() - start:5.1f}s  {weights}")
+    except KeyboardInterrupt:
+        print("Interrupted; the last finished generation is saved")
+    finally:
+        if pool:
+            pool.terminate()
+
+    if tuner.best:
+        print(f"Best so far: {tuner.best['fitness']:.1f} lines (generation {tuner.best['generation']})")
+        print(json.dumps(tuner.best['weights'], indent=2))
+        print(f"Checkpoint: {path}")
+
+
+if __name__ == "__main__":
+    main()
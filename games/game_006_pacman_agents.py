@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Game 006: Pac-Man - Agents
+可替換的自動玩家，以及一次推進多個無頭模擬的批次執行器
+
+代理人只需要 act(sim) -> 動作名稱 (ACTIONS 之一) 或 None:
+- random: 隨機方向 (基準線)
+- greedy: 走向最近的豆子 (查距離表)，不理會幽靈
+- safe: 從 Pac-Man 做 BFS，避開幽靈能先到 (或同時到) 的格子，
+  找最近的豆子或可吃的幽靈；無安全路徑時往離幽靈最遠的方向逃
+決策只在 Pac-Man 或幽靈換格時重算，其餘幀沿用上一個動作。
+
+VectorSim 每次呼叫推進一整批 PacManSim (逐一呼叫各模擬的 step，不是陣列運算)；
+run_episodes 把批次分給 process pool，每局結果以一行 JSON 輸出，
+最後在 stderr 印出摘要。
+
+Usage:
+    python games/game_006_pacman_agents.py --agent safe -n 1000
+    python games/game_006_pacman.py --agent safe
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import sys
+import time
+from collections import deque
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from games.game_006_pacman_sim import ACTIONS, DIRECTIONS, PacManSim
+from games.game_006_pacman_mazes import load_mazes
+
+DIRECTION_NAMES = {DIRECTIONS[name]: name for name in ACTIONS}
+
+SAFETY_MARGIN = 1  # 幽靈比 Pac-Man 晚到的步數少於這個值就算危險
+DEFAULT_MAX_STEPS = 5000  # 每局最多幀數 (約 5.5 分鐘遊戲時間)
+DEFAULT_BATCH = 32
+
+
+def dangerous_ghosts(sim):
+    """會吃掉 Pac-Man 的幽靈所在格的距離表列"""
+    maze = sim.maze
+    return [maze.distances[maze.cell_index(ghost.x, ghost.y)]
+            for ghost in sim.ghosts if not ghost.frightened and not ghost.eaten]
+
+
+class RandomAgent:
+    """到路口時隨機選一個可走的方向"""
+
+    def __init__(self, rng=None):
+        self.rng = rng or random.Random()
+        self.cell = None
+        self.action = None
+
+    def act(self, sim):
+        maze = sim.maze
+        cell = maze.cell_index(sim.pacman.x, sim.pacman.y)
+        if cell != self.cell:
+            self.cell = cell
+            moves = maze.neighbors[cell]
+            if moves:
+                self.action = DIRECTION_NAMES[self.rng.choice(moves)[0]]
+        return self.action
+
+
+class GreedyDotAgent:
+    """走向最近的豆子 (Pac-Man 所在格的距離表列 + 剩餘豆子位元集合)"""
+
+    def __init__(self, rng=None):
+        self.key = None
+        self.action = None
+
+    def act(self, sim):
+        maze = sim.maze
+        key = (sim.pacman.x, sim.pacman.y, maze.dots)
+        if key == self.key:
+            return self.action
+        self.key = key
+
+        dist = maze.distances[maze.cell_index(sim.pacman.x, sim.pacman.y)]
+        best = None
+        best_distance = None
+        dots = maze.dots
+        while dots:
+            bit = dots & -dots
+            index = bit.bit_length() - 1
+            if best_distance is None or dist[index] < best_distance:
+                best, best_distance = index, dist[index]
+            dots ^= bit
+
+        self.action = None
+        if best is not None:
+            direction = maze.next_direction(sim.pacman.x, sim.pacman.y,
+                                            best % maze.width, best // maze.width)
+            if direction:
+                self.action = DIRECTION_NAMES[direction]
+        return self.action
+
+
+class SafeAgent:
+    """避開幽靈的 BFS: 找最近的安全豆子 (或可吃的幽靈)"""
+
+    def __init__(self, rng=None, margin=SAFETY_MARGIN):
+        self.margin = margin
+        self.key = None
+        self.action = None
+
+    def act(self, sim):
+        maze = sim.maze
+        key = (sim.pacman.x, sim.pacman.y, maze.dots,
+               tuple((g.x, g.y, g.frightened, g.eaten) for g in sim.ghosts))
+        if key == self.key:
+            return self.action
+        self.key = key
+        self.action = self.choose(sim)
+        return self.action
+
+    def choose(self, sim):
+        maze = sim.maze
+        start = maze.cell_index(sim.pacman.x, sim.pacman.y)
+        dangers = dangerous_ghosts(sim)
+        targets = {maze.cell_index(g.x, g.y) for g in sim.ghosts if g.frightened}
+        dots = maze.dots
+        margin = self.margin
+
+        # BFS，只走幽靈來不及先到的格子；first[cell] 是走到該格的第一步
+        depth = {start: 0}
+        first = {start: None}
+        queue = deque([start])
+        while queue:
+            cell = queue.popleft()
+            if cell != start and (dots >> cell & 1 or cell in targets):
+                return DIRECTION_NAMES[first[cell]]
+            step = depth[cell] + 1
+            for direction, other in maze.neighbors[cell]:
+                if other in depth:
+                    continue
+                if any(row[other] <= step + margin - 1 for row in dangers):
+                    continue
+                depth[other] = step
+                first[other] = first[cell] or direction
+                queue.append(other)
+
+        # 沒有安全的目標: 往離最近幽靈最遠的鄰格逃
+        best = None
+        best_distance = -1
+        for direction, other in maze.neighbors[start]:
+            distance = min((row[other] for row in dangers), default=0)
+            if distance > best_distance:
+                best, best_distance = direction, distance
+        return DIRECTION_NAMES[best] if best else None
+
+
+AGENTS = {
+    'random': RandomAgent,
+    'greedy': GreedyDotAgent,
+    'safe': SafeAgent,
+}
+
+
+def make_agent(name, seed=None):
+    """依名稱建立代理人"""
+    try:
+        return AGENTS[name](random.Random(seed))
+    except KeyError:
+        raise ValueError(f"Unknown agent: {name}") from None
+
+
+class VectorSim:
+    """一批獨立的 PacManSim，每次 step() 全部推進一幀
+
+    這只是批次介面: step() 在 Python 迴圈裡逐一推進每個模擬，沒有用 NumPy 向量化。
+    吞吐量來自 run_episodes 的多行程，而不是陣列運算。
+    """
+
+    def __init__(self, count, mazes=None, seed=0, max_steps=DEFAULT_MAX_STEPS):
+        self.sims = [PacManSim(mazes, seed=seed + i) for i in range(count)]
+        self.max_steps = max_steps
+
+    def finished(self, sim):
+        return sim.game_over or (self.max_steps is not None and sim.steps >= self.max_steps)
+
+    def all_finished(self):
+        return all(self.finished(sim) for sim in self.sims)
+
+    def step(self, actions):
+        """每個模擬套用對應的動作並推進一幀 (已結束的不動)，回傳觀測值 list"""
+        observations = []
+        for sim, action in zip(self.sims, actions):
+            if self.finished(sim):
+                observations.append(sim.observe())
+            else:
+                observations.append(sim.step(action))
+        return observations
+
+
+def play_batch(task):
+    """跑完一批 episode，回傳結果 dict 的 list"""
+    first, count, agent_name, seed, max_steps, mazes = task
+    start = time.perf_counter()
+    vec = VectorSim(count, mazes, seed + first, max_steps)
+    agents = [make_agent(agent_name, seed + first + i) for i in range(count)]
+    while not vec.all_finished():
+        vec.step([None if vec.finished(sim) else agent.act(sim)
+                  for agent, sim in zip(agents, vec.sims)])
+
+    wall_time = (time.perf_counter() - start) / count
+    return [{
+        'episode': first + i,
+        'seed': seed + first + i,
+        'agent': agent_name,
+        'score': sim.score,
+        'level': sim.level,
+        'lives': sim.lives,
+        'steps': sim.steps,
+        'game_over': sim.game_over,
+        'wall_time': round(wall_time, 6),
+    } for i, sim in enumerate(vec.sims)]
+
+
+def run_episodes(episodes, agent='safe', seed=0, workers=None, batch=DEFAULT_BATCH,
+                 max_steps=DEFAULT_MAX_STEPS, mazes=None):
+    """Yield 每局的結果 dict (依批次完成順序)"""
+    tasks = [(first, min(batch, episodes - first), agent, seed, max_steps, mazes)
+             for first in range(0, episodes, batch)]
+    if workers == 1:
+        for task in tasks:
+            yield from play_batch(task)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    with multiprocessing.Pool(workers) as pool:
+        for results in pool.imap_unordered(play_batch, tasks):
+            yield from results
+
+
+def summarize(results, elapsed):
+    """批次結果的簡短摘要"""
+    count = len(results)
+    if not count:
+        return "No episodes played"
+    scores = [r['score'] for r in results]
+    lines = [
+        f"Episodes: {count}  Time: {elapsed:.2f}s  ({count / elapsed:.1f} episodes/s)",
+        f"Score: mean {sum(scores) / count:.1f}  min {min(scores)}  max {max(scores)}",
+        f"Level: mean {sum(r['level'] for r in results) / count:.2f}  "
+        f"Steps: mean {sum(r['steps'] for r in results) / count:.0f}  "
+        f"Survived: {sum(not r['game_over'] for r in results) / count:.1%}",
+    ]
+    return "\n".join(lines)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Evaluate Pac-Man agents on headless simulations")
+    parser.add_argument("-n", "--episodes", type=int, default=100, help="number of episodes")
+    parser.add_argument("--agent", choices=sorted(AGENTS), default='safe', help="agent to run")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first episode")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="worker processes (default: CPU count, 1 = no pool)")
+    parser.add_argument("--batch", type=int, default=DEFAULT_BATCH,
+                        help="simulations stepped together per worker task")
+    parser.add_argument("--max-steps", type=int, default=DEFAULT_MAX_STEPS,
+                        help="stop each episode after N frames")
+    parser.add_argument("--mazes", metavar="FILE", help="maze file (default: built-in levels)")
+    parser.add_argument("-o", "--output", default=None, help="write JSON lines here instead of stdout")
+    parser.add_argument("-q", "--quiet", action="store_true", help="don't print the summary")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    mazes = load_mazes(args.mazes) if args.mazes else None
+    out = open(args.output, 'w') if args.output else sys.stdout
+    results = []
+    start = time.perf_counter()
+    try:
+        for result in run_episodes(args.episodes, args.agent, args.seed, args.workers,
+                                   args.batch, args.max_steps, mazes):
+            out.write(json.dumps(result) + "\n")
+            out.flush()
+            results.append(result)
+    except (KeyboardInterrupt, BrokenPipeError):
+        pass
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    if not args.quiet:
+        print(summarize(results, time.perf_counter() - start), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Game 006: Pac-Man - Ghost Behaviour
+每隻幽靈的目標格策略，以及全域的 scatter / chase / frightened 階段計時器
+
+- Blinky: 直接以 Pac-Man 所在格為目標
+- Pinky: Pac-Man 前方 4 格
+- Inky: 從 Blinky 指向「Pac-Man 前方 2 格」的向量延長一倍
+- Clyde: 離 Pac-Man 超過 8 步時追擊，太近時退回自己的角落
+scatter 階段每隻幽靈回到各自的角落；frightened 期間階段計時暫停。
+目標格可能落在牆上或迷宮外，一律以 Maze.snap() 對應到最近的可通行格，
+之後每一步只需查 Maze 的距離表 (常數時間)。
+"""
+
+SCATTER = 'scatter'
+CHASE = 'chase'
+FRIGHTENED = 'frightened'
+
+# (階段, 秒數)，最後一段 None 表示持續到關卡結束
+MODE_SCHEDULE = [
+    (SCATTER, 7.0), (CHASE, 20.0),
+    (SCATTER, 7.0), (CHASE, 20.0),
+    (SCATTER, 5.0), (CHASE, 20.0),
+    (SCATTER, 5.0), (CHASE, None),
+]
+
+PINKY_AHEAD = 4
+INKY_AHEAD = 2
+CLYDE_SHY_DISTANCE = 8
+
+# scatter 角落 (以迷宮寬高的比例表示，0 = 左/上，1 = 右/下)
+SCATTER_CORNERS = {
+    'Blinky': (1, 0),
+    'Pinky': (0, 0),
+    'Inky': (1, 1),
+    'Clyde': (0, 1),
+}
+
+
+def scatter_target(ghost, maze):
+    """幽靈自己的角落"""
+    corner_x, corner_y = SCATTER_CORNERS.get(ghost.name, (1, 0))
+    return corner_x * (maze.width - 1), corner_y * (maze.height - 1)
+
+
+def ahead(pacman, tiles):
+    """Pac-Man 面向方向前方 tiles 格"""
+    dx, dy = pacman.direction
+    return pacman.x + dx * tiles, pacman.y + dy * tiles
+
+
+def target_blinky(ghost, pacman, maze, blinky):
+    return pacman.x, pacman.y
+
+
+def target_pinky(ghost, pacman, maze, blinky):
+    return ahead(pacman, PINKY_AHEAD)
+
+
+def target_inky(ghost, pacman, maze, blinky):
+    pivot_x, pivot_y = ahead(pacman, INKY_AHEAD)
+    if blinky is None:
+        return pivot_x, pivot_y
+    return 2 * pivot_x - blinky.x, 2 * pivot_y - blinky.y
+
+
+def target_clyde(ghost, pacman, maze, blinky):
+    if maze.distance(ghost.x, ghost.y, pacman.x, pacman.y) > CLYDE_SHY_DISTANCE:
+        return pacman.x, pacman.y
+    return scatter_target(ghost, maze)
+
+
+CHASE_TARGETS = {
+    'Blinky': target_blinky,
+    'Pinky': target_pinky,
+    'Inky': target_inky,
+    'Clyde': target_clyde,
+}
+
+
+def target_tile(ghost, mode, pacman, maze, blinky=None):
+    """目前階段下幽靈的目標格 (已對應到可通行格)"""
+    if mode == SCATTER:
+        x, y = scatter_target(ghost, maze)
+    else:
+        x, y = CHASE_TARGETS.get(ghost.name, target_blinky)(ghost, pacman, maze, blinky)
+    return maze.snap(x, y)
+
+
+class ModeScheduler:
+    """全域的 scatter / chase 計時，frightened 期間暫停"""
+
+    def __init__(self, schedule=None):
+        self.schedule = MODE_SCHEDULE if schedule is None else schedule
+        self.reset()
+
+    def reset(self):
+        """回到第一個階段 (新關卡或失去一條命)"""
+        self.phase = 0
+        self.timer = 0.0
+        self.frightened_timer = 0.0
+
+    @property
+    def base_mode(self):
+        """目前的 scatter / chase 階段 (不考慮 frightened)"""
+        return self.schedule[self.phase][0]
+
+    @property
+    def mode(self):
+        return FRIGHTENED if self.frightened_timer > 0 else self.base_mode
+
+    def frighten(self, duration):
+        self.frightened_timer = duration
+
+    def update(self, dt):
+        """推進計時器，階段改變時回傳新的階段 (否則 None)"""
+        if self.frightened_timer > 0:
+            self.frightened_timer -= dt
+            if self.frightened_timer <= 0:
+                self.frightened_timer = 0.0
+                return self.base_mode
+            return None
+
+        duration = self.schedule[self.phase][1]
+        if duration is None:
+            return None
+        self.timer += dt
+        if self.timer < duration:
+            return None
+        self.timer -= duration
+        self.phase = min(self.phase + 1, len(self.schedule) - 1)
+        return self.base_mode
@@ -0,0 +1,239 @@
+"""
+Game 006: Pac-Man - Mazes
+內建關卡、迷宮檔讀取器，以及載入時的迷宮編譯
+
+迷宮檔格式: 純文字，每個迷宮之間以空行分隔，';' 開頭的行為註解
+    # 牆    . 豆子    O 能量豆    - 幽靈屋的門
+    P Pac-Man 起點 (恰好一個)    G 幽靈起點 (1 到 4 個)
+    左右兩端都可通行的列是隧道
+
+編譯後的迷宮 (CompiledMaze) 以 y * width + x 為格子編號:
+- walkable: bytearray，1 = 可通行
+- neighbors: 每格的 [(方向, 鄰格編號), ...] (含隧道)
+- dots / power: 豆子與能量豆的位元集合 (int)
+- distances / nearest: 全點對 BFS 距離表 (每列一個 array('H')) 與「最近的可通行格」表
+同一佈局只編譯一次。
+"""
+
+from array import array
+from collections import deque
+from typing import List, Tuple
+
+MAX_GHOSTS = 4  # 每個迷宮最多的幽靈起點 (Blinky, Pinky, Inky, Clyde)
+UNREACHABLE = 0xFFFF  # 距離表中無法到達的值 (距離以 16 位元儲存，長走廊也不會溢位)
+
+# 上下左右 (與遊戲的 DIRECTIONS 相同)
+MOVE_DIRECTIONS = [(0, -1), (0, 1), (-1, 0), (1, 0)]
+
+# 內建關卡，依序循環
+MAZES = [
+    [
+        "####################",
+        "#........##........#",
+        "#.##.###.##.###.##.#",
+        "#O##.###.##.###.##O#",
+        "#..................#",
+        "#.##.#.######.#.##.#",
+        "#....#...##...#....#",
+        "####.###.##.###.####",
+        "####.#..........####",
+        "####.#.##--##.#.####",
+        "####.#.#    #.#.####",
+        "       # GG #       ",
+        "####.#.#    #.#.####",
+        "####.#.######.#.####",
+        "####.#...##...#.####",
+        "#........##........#",
+        "#.##.###.##.###.##.#",
+        "#O.#.....P.....#.O.#",
+        "##.#.#.######.#.#.##",
+        "#....#...##...#....#",
+        "#.######.##.######.#",
+        "#..................#",
+        "####################"
+    ],
+    [
+        "####################",
+        "#O.......##.......O#",
+        "#.##.###.##.###.##.#",
+        "#.##.###.##.###.##.#",
+        "#..................#",
+        "###.#.########.#.###",
+        "###.#...####...#.###",
+        "###.###......###.###",
+        "###.####----####.###",
+        "......#  GG  #......",
+        "###.#.########.#.###",
+        "###.#..........#.###",
+        "###.#.########.#.###",
+        "#........##........#",
+        "#.##.###.##.###.##.#",
+        "#O.#.....P......#.O#",
+        "##.#.#.######.#.#.##",
+        "#....#...##...#....#",
+        "#.####.#....#.####.#",
+        "#..................#",
+        "####################"
+    ],
+    [
+        "####################",
+        "#O................O#",
+        "#.##.####..####.##.#",
+        "#.##.#........#.##.#",
+        "#....#.######.#....#",
+        "####.#........#.####",
+        "####.###....###.####",
+        "####.####--####.####",
+        "    .##  GG  ##.    ",
+        "####.##########.####",
+        "####.#........#.####",
+        "#......#.##.#......#",
+        "#.####.#.##.#.####.#",
+        "#O...#........#...O#",
+        "####.#.######.#.####",
+        "#........P.........#",
+        "#.####.#.##.#.####.#",
+        "#......#....#......#",
+        "####################"
+    ],
+]
+
+
+def parse_mazes(text: str) -> List[List[str]]:
+    """解析迷宮檔內容，回傳迷宮列表 (每個迷宮是一組字串列)"""
+    mazes = []
+    rows = []
+    for line in text.splitlines() + ['']:
+        if line.lstrip().startswith(';'):
+            continue
+        if line.strip():
+            rows.append(line)
+        elif rows:
+            mazes.append(rows)
+            rows = []
+
+    for number, maze in enumerate(mazes, 1):
+        width = max(len(row) for row in maze)
+        # 較短的列以牆補齊 (行尾空白會被編輯器吃掉，不能當隧道)
+        maze[:] = [row.ljust(width, '#') for row in maze]
+        markers = ''.join(maze)
+        if markers.count('P') != 1:
+            raise ValueError(f"maze {number}: expected exactly one 'P'")
+        if 'G' not in markers:
+            raise ValueError(f"maze {number}: no ghost start 'G'")
+        if markers.count('G') > MAX_GHOSTS:
+            raise ValueError(f"maze {number}: {markers.count('G')} ghost starts 'G', "
+                             f"at most {MAX_GHOSTS} allowed")
+    return mazes
+
+
+def load_mazes(path: str) -> List[List[str]]:
+    """讀取迷宮檔"""
+    with open(path, 'r', encoding='utf-8') as f:
+        mazes = parse_mazes(f.read())
+    if not mazes:
+        raise ValueError(f"{path}: no mazes found")
+    return mazes
+
+
+def build_distance_table(walls: Tuple[str, ...]):
+    """對每個可通行格子做 BFS，建立全點對最短距離表 (含左右隧道)
+
+    回傳 (neighbors, distances, nearest):
+    neighbors[i] 是 [(方向, 鄰格編號), ...]，
+    distances[target][i] 是 i 到 target 的步數 (UNREACHABLE = 到不了)，
+    nearest[i] 是離格子 i (可以是牆) 最近的可通行格編號。
+    """
+    height = len(walls)
+    width = len(walls[0]) if walls else 0
+    size = width * height
+
+    neighbors = [[] for _ in range(size)]
+    for y in range(height):
+        for x in range(width):
+            if walls[y][x] == '#':
+                continue
+            for direction in MOVE_DIRECTIONS:
+                nx = (x + direction[0]) % width  # 隧道: 左右邊界相連
+                ny = y + direction[1]
+                if 0 <= ny < height and walls[ny][nx] != '#':
+                    neighbors[y * width + x].append((direction, ny * width + nx))
+
+    distances = [None] * size
+    for target in range(size):
+        if not neighbors[target]:
+            continue
+        dist = array('H', [UNREACHABLE]) * size
+        dist[target] = 0
+        queue = deque([target])
+        while queue:
+            cell = queue.popleft()
+            step = dist[cell] + 1
+            for _, other in neighbors[cell]:
+                if dist[other] == UNREACHABLE:
+                    dist[other] = step
+                    queue.append(other)
+        distances[target] = dist
+
+    # 從所有可通行格同時 BFS (穿過牆)，找出每一格最近的可通行格
+    nearest = [-1] * size
+    queue = deque(i for i in range(size) if neighbors[i])
+    for i in queue:
+        nearest[i] = i
+    while queue:
+        cell = queue.popleft()
+        x, y = cell % width, cell // width
+        for dx, dy in MOVE_DIRECTIONS:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < width and 0 <= ny < height and nearest[ny * width + nx] < 0:
+                nearest[ny * width + nx] = nearest[cell]
+                queue.append(ny * width + nx)
+    return neighbors, distances, nearest
+
+
+class CompiledMaze:
+    """載入時編譯好的迷宮 (唯讀，可被多個 Maze 共用)"""
+
+    def __init__(self, layout: List[str]):
+        self.height = len(layout)
+        self.width = max(len(row) for row in layout) if layout else 0
+        layout = [row.ljust(self.width, '#') for row in layout]
+
+        self.pacman_start = (0, 0)
+        self.ghost_starts = []
+        self.walkable = bytearray(self.width * self.height)
+        self.dots = 0
+        self.power = 0
+        rows = []
+        for y, row in enumerate(layout):
+            for x, cell in enumerate(row):
+                index = y * self.width + x
+                if cell == 'P':
+                    self.pacman_start = (x, y)
+                elif cell == 'G':
+                    self.ghost_starts.append((x, y))
+                elif cell == '.':
+                    self.dots |= 1 << index
+                elif cell == 'O':
+                    self.dots |= 1 << index
+                    self.power |= 1 << index
+                self.walkable[index] = cell != '#'
+            # 畫面用的列: 去掉起點標記與豆子 (豆子每幀另外畫)
+            rows.append(''.join(cell if cell in '#-' else ' ' for cell in row))
+        self.rows = tuple(rows)
+        self.dot_count = bin(self.dots).count('1')
+
+        walls = tuple(''.join('#' if cell == '#' else ' ' for cell in row) for row in layout)
+        self.neighbors, self.distances, self.nearest = build_distance_table(walls)
+
+
+# 依佈局快取的編譯結果
+_compiled = {}
+
+
+def compile_maze(layout: List[str]) -> CompiledMaze:
+    """編譯迷宮 (同一佈局只做一次)"""
+    key = tuple(layout)
+    if key not in _compiled:
+        _compiled[key] = CompiledMaze(layout)
+    return _compiled[key]
@@ -0,0 +1,507 @@
+"""
+Game 006: Pac-Man - Simulation
+不依賴 curses 的遊戲核心: 迷宮、Pac-Man、幽靈、分數與生命
+
+PacManSim.step(action) 推進一幀並回傳觀測值 (dict)，
+可供無頭測試、自動玩家與批次評估使用；curses 版的 PacManGame 是它的子類別。
+動作為 ACTIONS 中的方向名稱，None 表示維持目前方向。
+"""
+
+import os
+import random
+import sys
+from typing import List, Tuple, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from games.game_006_pacman_mazes import MAZES, UNREACHABLE, compile_maze
+from games.game_006_pacman_ghosts import CHASE, FRIGHTENED, ModeScheduler, target_tile
+
+# 遊戲常數
+FPS = 15  # 幀率
+FRAME_TIME = 1.0 / FPS
+PACMAN_MOVE_DELAY = 0.15  # Pac-Man 移動延遲（秒）
+GHOST_MOVE_DELAY = 0.18  # 幽靈移動延遲（秒）
+
+# 方向常數
+DIRECTIONS = {
+    'UP': (0, -1),
+    'DOWN': (0, 1),
+    'LEFT': (-1, 0),
+    'RIGHT': (1, 0),
+    'NONE': (0, 0)
+}
+
+# 代理人可用的動作 (None = 維持目前方向)
+ACTIONS = ('UP', 'DOWN', 'LEFT', 'RIGHT')
+
+LEVEL_CLEAR_DELAY = 2.0  # 過關後進入下一關前的停留時間（秒）
+
+# 能量豆效果持續時間
+POWER_DURATION = 8.0
+GHOST_EATEN_SCORES = [200, 400, 800, 1600]
+GHOST_FRIGHTENED_DELAY = 0.25  # 幽靈逃跑時的移動延遲（變慢）
+
+
+class PacMan:
+    """Pac-Man 類別"""
+    
+    def __init__(self, x: int, y: int):
+        self.start_x = x
+        self.start_y = y
+        self.x = x
+        self.y = y
+        self.direction = DIRECTIONS['NONE']
+        self.next_direction = DIRECTIONS['NONE']
+        self.move_timer = 0  # 移動計時器
+    
+    def set_next_direction(self, direction: Tuple[int, int]):
+        """設定下一個移動方向"""
+        self.next_direction = direction
+    
+    def can_move(self, dx: int, dy: int, maze) -> bool:
+        """檢查是否可以移動到指定方向"""
+        new_x = self.x + dx
+        new_y = self.y + dy
+        return maze.is_walkable(new_x, new_y)
+    
+    def move(self, maze, dt: float):
+        """移動 Pac-Man"""
+        self.move_timer += dt
+        
+        # 控制移動速度
+        if self.move_timer < PACMAN_MOVE_DELAY:
+            return
+        
+        self.move_timer = 0
+        
+        # 嘗試轉向
+        if self.next_direction != DIRECTIONS['NONE']:
+            if self.can_move(self.next_direction[0], self.next_direction[1], maze):
+                self.direction = self.next_direction
+        
+        # 移動
+        if self.direction != DIRECTIONS['NONE']:
+            dx, dy = self.direction
+            if self.can_move(dx, dy, maze):
+                self.x += dx
+                self.y += dy
+                
+                # 隧道傳送（左右邊界）
+                if self.x < 0:
+                    self.x = maze.width - 1
+                elif self.x >= maze.width:
+                    self.x = 0
+    
+    def get_char(self) -> str:
+        """根據方向返回顯示字元"""
+        if self.direction == DIRECTIONS['RIGHT']:
+            return "C"  # 改用 ASCII
+        elif self.direction == DIRECTIONS['LEFT']:
+            return "C"
+        elif self.direction == DIRECTIONS['UP']:
+            return "C"
+        elif self.direction == DIRECTIONS['DOWN']:
+            return "C"
+        return "C"
+    
+    def reset(self):
+        """重置到起始位置"""
+        self.x = self.start_x
+        self.y = self.start_y
+        self.direction = DIRECTIONS['NONE']
+        self.next_direction = DIRECTIONS['NONE']
+        self.move_timer = 0
+
+
+class Ghost:
+    """幽靈類別"""
+    
+    def __init__(self, name: str, color: int, home_x: int, home_y: int, rng=None):
+        self.name = name
+        self.rng = rng or random  # 逃跑時的隨機方向 (模擬時傳入有種子的 Random)
+        self.color = color
+        self.home_x = home_x
+        self.home_y = home_y
+        self.x = home_x
+        self.y = home_y
+        self.direction = DIRECTIONS['UP']
+        self.frightened = False
+        self.eaten = False
+        self.move_timer = 0
+    
+    def reset(self):
+        """重置到起始位置"""
+        self.x = self.home_x
+        self.y = self.home_y
+        self.direction = DIRECTIONS['UP']
+        self.frightened = False
+        self.eaten = False
+    
+    def update(self, pacman, maze, dt: float, mode: str = CHASE, blinky=None):
+        """更新幽靈狀態 (mode 為全域的 scatter / chase 階段)"""
+        self.move_timer += dt
+        
+        # 控制移動速度（逃跑時變慢）
+        delay = GHOST_FRIGHTENED_DELAY if self.frightened else GHOST_MOVE_DELAY
+        if self.move_timer < delay:
+            return
+        
+        self.move_timer = 0
+        
+        if self.eaten:
+            # 被吃掉，回家（快速）
+            self.move_to_home(maze)
+        elif self.frightened:
+            # 逃跑模式（變慢）
+            self.move_random(maze)
+        else:
+            # scatter / chase: 依各自的策略決定目標格
+            target = target_tile(self, mode, pacman, maze, blinky)
+            self.move_toward(target, maze)
+    
+    def chase(self, pacman, maze):
+        """直接追逐 Pac-Man (Blinky 的策略)"""
+        self.move_toward((pacman.x, pacman.y), maze)
+    
+    def move_toward(self, target: Tuple[int, int], maze):
+        """沿最短路徑往目標格前進 (查距離表)，不做 180 度轉向"""
+        reverse_dir = (-self.direction[0], -self.direction[1])
+        direction = maze.next_direction(self.x, self.y, target[0], target[1], avoid=reverse_dir)
+        if direction:
+            self.step(direction, maze)
+    
+    def reverse(self):
+        """階段切換時掉頭 (下一步允許往回走)"""
+        self.direction = (-self.direction[0], -self.direction[1])
+    
+    def step(self, direction: Tuple[int, int], maze):
+        """往 direction 走一格 (含隧道傳送)"""
+        self.x = (self.x + direction[0]) % maze.width
+        self.y += direction[1]
+        self.direction = direction
+    
+    def move_random(self, maze):
+        """隨機移動（逃跑模式）"""
+        possible_moves = []
+        
+        for direction in [DIRECTIONS['UP'], DIRECTIONS['DOWN'], 
+                         DIRECTIONS['LEFT'], DIRECTIONS['RIGHT']]:
+            dx, dy = direction
+            new_x = self.x + dx
+            new_y = self.y + dy
+            
+            # 隧道傳送處理
+            if new_x < 0:
+                new_x = maze.width - 1
+            elif new_x >= maze.width:
+                new_x = 0
+            
+            if maze.is_walkable(new_x, new_y):
+                # 避免 180 度轉向
+                reverse_dir = (-self.direction[0], -self.direction[1])
+                if direction != reverse_dir:
+                    possible_moves.append(direction)
+        
+        if possible_moves:
+            direction = self.rng.choice(possible_moves)
+            dx, dy = direction
+            self.x += dx
+            self.y += dy
+            
+            # 隧道傳送
+            if self.x < 0:
+                self.x = maze.width - 1
+            elif self.x >= maze.width:
+                self.x = 0
+            
+            self.direction = direction
+    
+    def move_to_home(self, maze):
+        """沿最短路徑回到起始位置"""
+        if self.x == self.home_x and self.y == self.home_y:
+            self.eaten = False
+            self.frightened = False
+            return
+        
+        direction = maze.next_direction(self.x, self.y, self.home_x, self.home_y)
+        if direction:
+            self.step(direction, maze)
+    
+    def get_char(self) -> str:
+        """返回顯示字元"""
+        if self.eaten:
+            return "EE"  # 眼睛 (兩個字元)
+        elif self.frightened:
+            return "B"   # Blue ghost (可被吃)
+        else:
+            return "G"   # Ghost (正常幽靈)
+
+
+class Maze:
+    """迷宮類別: 編譯好的佈局 (共用) + 本局剩下的豆子"""
+    
+    def __init__(self, layout: List[str]):
+        compiled = compile_maze(layout)
+        self.compiled = compiled
+        self.rows = compiled.rows
+        self.height = compiled.height
+        self.width = compiled.width
+        self.walkable = compiled.walkable
+        self.neighbors = compiled.neighbors
+        self.distances = compiled.distances
+        self.nearest = compiled.nearest
+        self.power = compiled.power
+        
+        # 剩下的豆子 (位元集合)
+        self.dots = compiled.dots
+        self.dots_total = compiled.dot_count
+        self.dots_remaining = compiled.dot_count
+    
+    def get_cell(self, x: int, y: int) -> str:
+        """獲取指定位置的格子內容"""
+        if not 0 <= y < self.height:
+            return '#'
+        x %= self.width  # 隧道（水平方向）
+        bit = 1 << (y * self.width + x)
+        if self.dots & bit:
+            return 'O' if self.power & bit else '.'
+        return self.rows[y][x]
+    
+    def is_walkable(self, x: int, y: int) -> bool:
+        """檢查是否可通行（含隧道）"""
+        return 0 <= y < self.height and self.walkable[y * self.width + x % self.width] == 1
+    
+    def eat_dot(self, x: int, y: int) -> Tuple[int, bool]:
+        """吃豆子，返回 (得分, 是否是能量豆)"""
+        bit = 1 << self.cell_index(x, y)
+        if not self.dots & bit:
+            return (0, False)
+        
+        self.dots ^= bit
+        self.dots_remaining -= 1
+        if self.power & bit:
+            return (50, True)
+        return (10, False)
+    
+    def dot_cells(self):
+        """剩下的豆子: 產生 (x, y, 是否是能量豆)"""
+        dots = self.dots
+        while dots:
+            bit = dots & -dots
+            index = bit.bit_length() - 1
+            yield index % self.width, index // self.width, bool(self.power & bit)
+            dots ^= bit
+    
+    def cell_index(self, x: int, y: int) -> int:
+        """格子編號 (距離表的索引)"""
+        return y * self.width + x % self.width
+    
+    def distance(self, x: int, y: int, target_x: int, target_y: int) -> int:
+        """(x, y) 走到 (target_x, target_y) 的最短步數，到不了時為 UNREACHABLE"""
+        dist = self.distances[self.cell_index(target_x, target_y)]
+        if dist is None:
+            return UNREACHABLE
+        return dist[self.cell_index(x, y)]
+    
+    def snap(self, x: int, y: int) -> Tuple[int, int]:
+        """把任意座標 (可在牆上或迷宮外) 對應到最近的可通行格"""
+        x = min(max(x, 0), self.width - 1)
+        y = min(max(y, 0), self.height - 1)
+        cell = self.nearest[y * self.width + x]
+        return cell % self.width, cell // self.width
+    
+    def next_direction(self, x: int, y: int, target_x: int, target_y: int,
+                       avoid: Optional[Tuple[int, int]] = None) -> Optional[Tuple[int, int]]:
+        """朝目標走最短路徑的下一步方向 (盡量不走 avoid 方向)，無路可走時回傳 None"""
+        dist = self.distances[self.cell_index(target_x, target_y)]
+        moves = self.neighbors[self.cell_index(x, y)]
+        if dist is None or not moves:
+            return None
+        
+        best_direction = None
+        best_distance = UNREACHABLE + 1
+        for direction, other in moves:
+            if direction == avoid:
+                continue
+            if dist[other] < best_distance:
+                best_distance = dist[other]
+                best_direction = direction
+        if best_direction is None:
+            # 死路: 只能回頭
+            best_direction = moves[0][0]
+        return best_direction
+    
+    def is_level_complete(self) -> bool:
+        """檢查關卡是否完成"""
+        return self.dots_remaining == 0
+
+
+class PacManSim:
+    """無頭的 Pac-Man 遊戲狀態與規則"""
+    
+    def __init__(self, mazes: Optional[List[List[str]]] = None, start_level: int = 0, seed=None):
+        # 關卡迷宮 (內建或從迷宮檔載入)，全部破關後從頭循環
+        self.mazes = mazes or MAZES
+        self.start_level = start_level
+        self.rng = random.Random(seed)
+        
+        # 初始化 Pac-Man 與幽靈 (起點在 load_level 中依迷宮設定)
+        self.pacman = PacMan(0, 0)
+        self.ghosts = [
+            Ghost("Blinky", 1, 0, 0, self.rng),
+            Ghost("Pinky", 2, 0, 0, self.rng),
+            Ghost("Inky", 3, 0, 0, self.rng),
+            Ghost("Clyde", 4, 0, 0, self.rng)
+        ]
+        self.modes = ModeScheduler()  # 全域 scatter / chase / frightened 階段
+        self.high_score = 0
+        self.maze = None
+        # 先編譯所有迷宮 (全點對 BFS 在大迷宮要數秒)，過關換圖時不會卡住畫面
+        for layout in self.mazes:
+            compile_maze(layout)
+        self.reset()
+    
+    def reset(self):
+        """開始新的一局"""
+        self.score = 0
+        self.lives = 3
+        self.level = self.start_level + 1
+        self.power_mode = False
+        self.power_timer = 0
+        self.ghost_combo = 0
+        self.game_over = False
+        self.level_complete = False
+        self.level_timer = 0.0
+        self.steps = 0
+        self.load_level(self.start_level)
+    
+    def load_level(self, index: int):
+        """載入第 index 個迷宮 (已在建構時編譯)，角色回到起點"""
+        self.maze = Maze(self.mazes[index % len(self.mazes)])
+        
+        pacman_x, pacman_y = self.maze.compiled.pacman_start
+        self.pacman.start_x, self.pacman.start_y = pacman_x, pacman_y
+        
+        # 幽靈起點不足 4 個時共用第一個
+        starts = list(self.maze.compiled.ghost_starts)
+        while len(starts) < len(self.ghosts):
+            starts.append(starts[0])
+        for ghost, (home_x, home_y) in zip(self.ghosts, starts):
+            ghost.home_x, ghost.home_y = home_x, home_y
+        
+        self.level_complete = False
+        self.reset_positions()
+    
+    def update(self, dt: float):
+        """更新遊戲狀態"""
+        if self.game_over:
+            return
+        
+        if self.level_complete:
+            # 過關畫面停留一下再進入下一個迷宮
+            self.level_timer -= dt
+            if self.level_timer <= 0:
+                self.level += 1
+                self.load_level(self.level - 1)
+            return
+        
+        # 移動 Pac-Man
+        self.pacman.move(self.maze, dt)
+        
+        # 吃豆子
+        score_gain, is_power_pellet = self.maze.eat_dot(self.pacman.x, self.pacman.y)
+        self.score += score_gain
+        
+        # 能量豆效果
+        if is_power_pellet:
+            self.modes.frighten(POWER_DURATION)
+            self.ghost_combo = 0
+            
+            # 所有幽靈進入逃跑模式
+            for ghost in self.ghosts:
+                if not ghost.eaten:
+                    ghost.frightened = True
+        
+        # 更新階段計時器 (frightened 期間 scatter / chase 計時暫停)
+        previous_mode = self.modes.mode
+        new_mode = self.modes.update(dt)
+        if new_mode is not None:
+            if previous_mode == FRIGHTENED:
+                for ghost in self.ghosts:
+                    ghost.frightened = False
+            else:
+                # scatter <-> chase 切換時幽靈掉頭
+                for ghost in self.ghosts:
+                    if not ghost.eaten:
+                        ghost.reverse()
+        self.power_mode = self.modes.mode == FRIGHTENED
+        self.power_timer = self.modes.frightened_timer
+        
+        # 移動幽靈 (Inky 的目標需要 Blinky 的位置)
+        mode = self.modes.base_mode
+        blinky = self.ghosts[0]
+        for ghost in self.ghosts:
+            ghost.update(self.pacman, self.maze, dt, mode, blinky)
+        
+        # 碰撞檢測
+        self.check_collisions()
+        
+        # 檢查關卡完成
+        if self.maze.is_level_complete():
+            self.level_complete = True
+            self.level_timer = LEVEL_CLEAR_DELAY
+        
+        # 更新最高分
+        if self.score > self.high_score:
+            self.high_score = self.score
+    
+    def check_collisions(self):
+        """檢查碰撞"""
+        for ghost in self.ghosts:
+            if ghost.x == self.pacman.x and ghost.y == self.pacman.y:
+                if ghost.frightened and not ghost.eaten:
+                    # 吃掉幽靈
+                    ghost.eaten = True
+                    ghost.frightened = False
+                    self.score += GHOST_EATEN_SCORES[min(self.ghost_combo, 3)]
+                    self.ghost_combo += 1
+                elif not ghost.eaten:
+                    # 被幽靈吃掉 (同一格有多隻幽靈也只算一次)
+                    self.lives -= 1
+                    if self.lives <= 0:
+                        self.game_over = True
+                    else:
+                        self.reset_positions()
+                    return
+    
+    def reset_positions(self):
+        """重置所有位置"""
+        self.pacman.reset()
+        for ghost in self.ghosts:
+            ghost.reset()
+        self.power_mode = False
+        self.power_timer = 0
+        self.modes.reset()
+    
+    def step(self, action: Optional[str] = None, dt: float = FRAME_TIME) -> dict:
+        """套用動作並推進一幀，回傳觀測值"""
+        if action is not None:
+            self.pacman.set_next_direction(DIRECTIONS[action])
+        score = self.score
+        self.update(dt)
+        self.steps += 1
+        return self.observe(self.score - score)
+    
+    def observe(self, reward: int = 0) -> dict:
+        """目前狀態的觀測值"""
+        return {
+            'pacman': (self.pacman.x, self.pacman.y),
+            'ghosts': [(ghost.x, ghost.y, ghost.frightened, ghost.eaten) for ghost in self.ghosts],
+            'score': self.score,
+            'reward': reward,
+            'lives': self.lives,
+            'level': self.level,
+            'dots_remaining': self.maze.dots_remaining,
+            'done': self.game_over,
+        }
@@ -3,21 +3,30 @@ Game 007: 2048
 A classic number puzzle game where you combine tiles to reach 2048.
 """
 
+import argparse
 import curses
-import random
+import os
+import sys
 from curses import wrapper
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from games.game_007_2048_engine import Engine2048, GridView, UP, DOWN, LEFT, RIGHT
+from games.game_007_2048_ai import ExpectimaxAI, DEFAULT_TIME_BUDGET
+
+AUTO_MOVE_DELAY_MS = 30  # Pause between autoplayer moves (and key polling)
+
 class Game2048:
-    def __init__(self, stdscr):
+    def __init__(self, stdscr, auto=False, time_budget=DEFAULT_TIME_BUDGET):
         self.stdscr = stdscr
-        self.board = [[0] * 4 for _ in range(4)]
-        self.score = 0
+        self.engine = Engine2048()
         self.best_score = 0
+        self.ai = ExpectimaxAI(time_budget=time_budget)
         
         # Initialize curses
         curses.curs_set(0)
         self.stdscr.nodelay(0)
-        self.stdscr.timeout(-1)  # Block until key press
+        self.set_auto(auto)
         
         # Initialize colors
         curses.start_color()
@@ -40,10 +49,6 @@ class Game2048:
             128: 8, 256: 9, 512: 10, 1024: 11, 2048: 12
         }
         
-        # Start with two tiles
-        self.add_new_tile()
-        self.add_new_tile()
-        
         self.game_over = False
         self.won = False
         self.continue_after_win = False
@@ -54,117 +59,63 @@ class Game2048:
             return curses.color_pair(self.colors.get(value, 1))
         return curses.color_pair(13)  # For values > 2048
     
-    def add_new_tile(self):
-        """Add a new tile (2 or 4) to a random empty cell"""
-        empty_cells = [(r, c) for r in range(4) for c in range(4) if self.board[r][c] == 0]
-        if empty_cells:
-            row, col = random.choice(empty_cells)
-            self.board[row][col] = 2 if random.random() < 0.9 else 4
-            return True
-        return False
+    @property
+    def board(self):
+        """Live 4x4 view of the engine's board (board[r][c] = v writes through)"""
+        return GridView(self.engine)
     
-    def compress(self, line):
-        """Remove zeros from line"""
-        return [num for num in line if num != 0]
+    @board.setter
+    def board(self, grid):
+        self.engine.grid = grid
     
-    def merge(self, line):
-        """Merge adjacent equal numbers"""
-        if len(line) < 2:
-            return line, 0
-        
-        merged = []
-        score_gain = 0
-        i = 0
-        while i < len(line):
-            if i + 1 < len(line) and line[i] == line[i + 1]:
-                merged.append(line[i] * 2)
-                score_gain += line[i] * 2
-                i += 2
-            else:
-                merged.append(line[i])
-                i += 1
-        return merged, score_gain
+    @property
+    def score(self):
+        """Current score (kept by the engine)"""
+        return self.engine.score
+    
+    @score.setter
+    def score(self, value):
+        self.engine.score = value
     
-    def move_line_left(self, line):
-        """Move and merge a line to the left"""
-        compressed = self.compress(line)
-        merged, score_gain = self.merge(compressed)
-        merged += [0] * (4 - len(merged))
-        return merged, score_gain
+    def add_new_tile(self):
+        """Add a new tile (2 or 4) to a random empty cell"""
+        return self.engine.add_new_tile()
     
     def move_left(self):
         """Move all tiles left"""
-        moved = False
-        score_gain = 0
-        for i in range(4):
-            new_line, gain = self.move_line_left(self.board[i])
-            if new_line != self.board[i]:
-                moved = True
-            self.board[i] = new_line
-            score_gain += gain
-        return moved, score_gain
-    
-    def rotate_board_clockwise(self):
-        """Rotate board 90 degrees clockwise"""
-        self.board = [[self.board[3-j][i] for j in range(4)] for i in range(4)]
+        return self.engine.move(LEFT)
     
     def move_right(self):
         """Move all tiles right"""
-        self.rotate_board_clockwise()
-        self.rotate_board_clockwise()
-        moved, score_gain = self.move_left()
-        self.rotate_board_clockwise()
-        self.rotate_board_clockwise()
-        return moved, score_gain
+        return self.engine.move(RIGHT)
     
     def move_up(self):
         """Move all tiles up"""
-        self.rotate_board_clockwise()
-        self.rotate_board_clockwise()
-        self.rotate_board_clockwise()
-        moved, score_gain = self.move_left()
-        self.rotate_board_clockwise()
-        return moved, score_gain
+        return self.engine.move(UP)
     
     def move_down(self):
         """Move all tiles down"""
-        self.rotate_board_clockwise()
-        moved, score_gain = self.move_left()
-        self.rotate_board_clockwise()
-        self.rotate_board_clockwise()
-        self.rotate_board_clockwise()
-        return moved, score_gain
+        return self.engine.move(DOWN)
     
     def can_move(self):
         """Check if any move is possible"""
-        # Check for empty cells
-        if any(0 in row for row in self.board):
-            return True
-        
-        # Check for possible horizontal merges
-        for row in range(4):
-            for col in range(3):
-                if self.board[row][col] == self.board[row][col + 1]:
-                    return True
-        
-        # Check for possible vertical merges
-        for row in range(3):
-            for col in range(4):
-                if self.board[row][col] == self.board[row + 1][col]:
-                    return True
-        
-        return False
+        return self.engine.can_move()
     
     def has_won(self):
         """Check if player has reached 2048"""
-        return any(2048 in row for row in self.board)
+        return self.engine.has_won()
+    
+    def set_auto(self, auto):
+        """Turn the autoplayer on or off"""
+        self.auto = auto
+        if auto:
+            self.stdscr.timeout(AUTO_MOVE_DELAY_MS)  # Poll keys between AI moves
+        else:
+            self.stdscr.timeout(-1)  # Block until key press
     
     def reset_game(self):
         """Reset the game"""
-        self.board = [[0] * 4 for _ in range(4)]
-        self.score = 0
-        self.add_new_tile()
-        self.add_new_tile()
+        self.engine.reset()
         self.game_over = False
         self.won = False
         self.continue_after_win = False
@@ -193,12 +144,13 @@ class Game2048:
         self.stdscr.addstr(board_top, border_left, "┌────┬────┬────┬────┐")
         
         # Draw tiles
+        board = self.board
         for row in range(4):
             y = board_top + 1 + row * 2
             self.stdscr.addstr(y, border_left, "│")
             
             for col in range(4):
-                value = self.board[row][col]
+                value = board[row][col]
                 x = border_left + 1 + col * 5
                 
                 if value == 0:
@@ -223,7 +175,10 @@ class Game2048:
         # Draw instructions
         instructions_y = board_top + 10
         self.stdscr.addstr(instructions_y, border_left, "↑↓←→: Move tiles")
-        self.stdscr.addstr(instructions_y + 1, border_left, "R: Restart    Q: Quit")
+        self.stdscr.addstr(instructions_y + 1, border_left, "A: Autoplay   R: Restart    Q: Quit")
+        if self.auto:
+            auto_text = f"AUTO - expectimax depth {self.ai.last_depth}"
+            self.stdscr.addstr(instructions_y + 2, border_left, auto_text, curses.A_BOLD)
         
         # Draw game status
         if self.won and not self.continue_after_win:
@@ -259,6 +214,15 @@ class Game2048:
                 self.reset_game()
                 continue
             
+            # Handle autoplay toggle
+            if key in [ord('a'), ord('A')]:
+                self.set_auto(not self.auto)
+                continue
+            
+            # Autoplayer keeps going after reaching 2048
+            if self.auto and self.won:
+                self.continue_after_win = True
+            
             # Handle continue after win
             if self.won and not self.continue_after_win:
                 if key in [ord('c'), ord('C')]:
@@ -270,41 +234,60 @@ class Game2048:
                 continue
             
             # Handle movement
-            moved = False
-            score_gain = 0
-            
+            direction = None
             if key == curses.KEY_UP:
-                moved, score_gain = self.move_up()
+                direction = UP
             elif key == curses.KEY_DOWN:
-                moved, score_gain = self.move_down()
+                direction = DOWN
             elif key == curses.KEY_LEFT:
-                moved, score_gain = self.move_left()
+                direction = LEFT
             elif key == curses.KEY_RIGHT:
-                moved, score_gain = self.move_right()
+                direction = RIGHT
+            elif self.auto and key == -1:
+                direction = self.ai.choose_move(self.engine.board)
             
-            # If moved, add new tile and update score
-            if moved:
-                self.score += score_gain
-                if self.score > self.best_score:
-                    self.best_score = self.score
-                
-                self.add_new_tile()
-                
-                # Check win condition
-                if self.has_won() and not self.won:
-                    self.won = True
-                
-                # Check game over
-                if not self.can_move():
-                    self.game_over = True
+            if direction is not None:
+                self.apply_move(direction)
+    
+    def apply_move(self, direction):
+        """Move tiles, then add a new tile and update win/game over state"""
+        moved, score_gain = self.engine.move(direction)
+        
+        # If moved, add new tile and update best score
+        # (the engine already added score_gain to self.score)
+        if moved:
+            if self.score > self.best_score:
+                self.best_score = self.score
+            
+            self.add_new_tile()
+            
+            # Check win condition
+            if self.has_won() and not self.won:
+                self.won = True
+            
+            # Check game over
+            if not self.can_move():
+                self.game_over = True
+        
+        return moved
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="2048 - Number Puzzle Game")
+    parser.add_argument("--auto", action="store_true",
+                        help="let the expectimax autoplayer play the game")
+    parser.add_argument("--think", type=float, default=DEFAULT_TIME_BUDGET,
+                        help="autoplayer time budget per move in seconds")
+    return parser.parse_args(argv)
 
-def main(stdscr=None):
+def main(stdscr=None, auto=False, time_budget=DEFAULT_TIME_BUDGET):
     """Entry point for the game"""
     if stdscr is None:
-        wrapper(main)
+        wrapper(main, auto=auto, time_budget=time_budget)
     else:
-        game = Game2048(stdscr)
+        game = Game2048(stdscr, auto=auto, time_budget=time_budget)
         game.run()
 
 if __name__ == "__main__":
-    main()
+    args = parse_args()
+    main(auto=args.auto, time_budget=args.think)
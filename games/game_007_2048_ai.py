@@ -0,0 +1,249 @@
+"""
+Game 007: 2048 - Autoplayer
+Expectimax search (and a Monte Carlo rollout player) on top of the bitboard engine.
+
+The chance nodes follow the spawn distribution of add_new_tile (90% 2, 10% 4).
+Search depth grows one ply at a time until the time budget runs out, and
+evaluated positions are kept in an LRU transposition table keyed on the board.
+"""
+
+import random
+import time
+from collections import OrderedDict
+
+from games import game_007_2048_engine as engine
+
+# Heuristic weights (per row/column, looked up from a 65536-entry table)
+EMPTY_WEIGHT = 270.0
+MERGES_WEIGHT = 700.0
+MONOTONICITY_WEIGHT = 47.0
+MONOTONICITY_POWER = 4.0
+SUM_WEIGHT = 11.0
+SUM_POWER = 3.5
+LOST_PENALTY = 200000.0
+
+# Search settings
+DEFAULT_TIME_BUDGET = 0.1   # seconds per move
+DEFAULT_CACHE_SIZE = 200000
+MAX_DEPTH = 8
+MIN_PROBABILITY = 0.0001    # stop expanding very unlikely spawn sequences
+SPAWNS = ((1, 1.0 - engine.SPAWN_FOUR_PROBABILITY), (2, engine.SPAWN_FOUR_PROBABILITY))
+
+
+def _row_heuristic(row):
+    """Score one 16-bit row: empty cells, merges, monotonicity, sum"""
+    line = [(row >> 4 * i) & 0xF for i in range(4)]
+
+    empty = 0
+    merges = 0
+    prev = 0
+    counter = 0
+    total = 0.0
+    for exponent in line:
+        total += exponent ** SUM_POWER
+        if exponent == 0:
+            empty += 1
+        else:
+            if prev == exponent:
+                counter += 1
+            elif counter > 0:
+                merges += 1 + counter
+                counter = 0
+            prev = exponent
+    if counter > 0:
+        merges += 1 + counter
+
+    mono_left = 0.0
+    mono_right = 0.0
+    for i in range(3):
+        a = line[i] ** MONOTONICITY_POWER
+        b = line[i + 1] ** MONOTONICITY_POWER
+        if line[i] > line[i + 1]:
+            mono_left += a - b
+        else:
+            mono_right += b - a
+
+    return (LOST_PENALTY
+            + EMPTY_WEIGHT * empty
+            + MERGES_WEIGHT * merges
+            - MONOTONICITY_WEIGHT * min(mono_left, mono_right)
+            - SUM_WEIGHT * total)
+
+
+HEURISTIC_TABLE = [_row_heuristic(row) for row in range(engine.ROW_MASK + 1)]
+
+
+def evaluate(board):
+    """Heuristic value of a board (rows plus columns)"""
+    table = HEURISTIC_TABLE
+    mask = engine.ROW_MASK
+    t = engine.transpose(board)
+    return (table[board & mask] + table[(board >> 16) & mask]
+            + table[(board >> 32) & mask] + table[(board >> 48) & mask]
+            + table[t & mask] + table[(t >> 16) & mask]
+            + table[(t >> 32) & mask] + table[(t >> 48) & mask])
+
+
+class SearchTimeout(Exception):
+    """Raised inside the search when the time budget is exhausted"""
+
+
+class TranspositionTable:
+    """Board -> (depth, value) cache with LRU eviction"""
+
+    def __init__(self, max_size=DEFAULT_CACHE_SIZE):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, board, depth):
+        """Return a cached value searched at least this deep, or None"""
+        entry = self.entries.get(board)
+        if entry is not None and entry[0] >= depth:
+            self.entries.move_to_end(board)
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        return None
+
+    def put(self, board, depth, value):
+        self.entries[board] = (depth, value)
+        self.entries.move_to_end(board)
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+
+class ExpectimaxAI:
+    """Iterative-deepening expectimax player with a time budget per move"""
+
+    def __init__(self, time_budget=DEFAULT_TIME_BUDGET, max_depth=MAX_DEPTH,
+                 cache_size=DEFAULT_CACHE_SIZE):
+        self.time_budget = time_budget
+        self.max_depth = max_depth
+        self.table = TranspositionTable(cache_size)
+        self.deadline = 0.0
+        self.nodes = 0
+        self.last_depth = 0
+
+    def choose_move(self, board):
+        """Return the best direction for board, or None if no move is possible"""
+        candidates = []
+        for direction in engine.DIRECTIONS:
+            new_board, score_gain = engine.move(board, direction)
+            if new_board != board:
+                candidates.append((direction, new_board, score_gain))
+        if not candidates:
+            return None
+        if len(candidates) == 1:
+            return candidates[0][0]
+
+        self.deadline = time.perf_counter() + self.time_budget
+        self.nodes = 0
+        best_direction = candidates[0][0]
+        depth = 1
+        while depth <= self.max_depth:
+            try:
+                best_direction = self._search_root(candidates, depth)
+            except SearchTimeout:
+                break
+            self.last_depth = depth
+            if time.perf_counter() >= self.deadline:
+                break
+            depth += 1
+        return best_direction
+
+    def _search_root(self, candidates, depth):
+        best_value = None
+        best_direction = candidates[0][0]
+        for direction, new_board, score_gain in candidates:
+            value = self._chance(new_board, depth, 1.0) + score_gain
+            if best_value is None or value > best_value:
+                best_value = value
+                best_direction = direction
+        return best_direction
+
+    def _chance(self, board, depth, probability):
+        """Expected value over all tile spawns on board"""
+        if depth <= 0 or probability < MIN_PROBABILITY:
+            return evaluate(board)
+
+        cached = self.table.get(board, depth)
+        if cached is not None:
+            return cached
+
+        self.nodes += 1
+        if time.perf_counter() >= self.deadline:
+            raise SearchTimeout()
+
+        cells = engine.empty_cells(board)
+        cell_probability = probability / len(cells)
+        total = 0.0
+        for index in cells:
+            shift = 4 * index
+            for exponent, spawn_probability in SPAWNS:
+                child = board | (exponent << shift)
+                total += spawn_probability * self._max(child, depth - 1,
+                                                       cell_probability * spawn_probability)
+        value = total / len(cells)
+        self.table.put(board, depth, value)
+        return value
+
+    def _max(self, board, depth, probability):
+        """Best value over all moves from board (the player's turn)"""
+        best = None
+        for direction in engine.DIRECTIONS:
+            new_board, score_gain = engine.move(board, direction)
+            if new_board == board:
+                continue
+            value = self._chance(new_board, depth, probability) + score_gain
+            if best is None or value > best:
+                best = value
+        return 0.0 if best is None else best
+
+
+class MonteCarloAI:
+    """Pick the move whose random playouts survive longest on average"""
+
+    def __init__(self, rollouts=20, rollout_depth=20, seed=None):
+        self.rollouts = rollouts
+        self.rollout_depth = rollout_depth
+        self.rng = random.Random(seed)
+
+    def choose_move(self, board):
+        best_direction = None
+        best_value = None
+        for direction in engine.DIRECTIONS:
+            new_board, score_gain = engine.move(board, direction)
+            if new_board == board:
+                continue
+            total = 0
+            for _ in range(self.rollouts):
+                total += score_gain + self._rollout(new_board)
+            if best_value is None or total > best_value:
+                best_value = total
+                best_direction = direction
+        return best_direction
+
+    def _rollout(self, board):
+        rng = self.rng
+        score = 0
+        board = engine.spawn_tile(board, rng)
+        for _ in range(self.rollout_depth):
+            direction = rng.choice(engine.DIRECTIONS)
+            new_board, score_gain = engine.move(board, direction)
+            if new_board == board:
+                if not engine.can_move(board):
+                    break
+                continue
+            score += score_gain
+            board = engine.spawn_tile(new_board, rng)
+        return score
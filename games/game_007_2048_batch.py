@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Game 007: 2048 - Batch Simulation
+Run many seeded headless 2048 games across a process pool.
+
+One JSON object per finished game is streamed to stdout (or --output):
+    {"game": 0, "seed": 1, "policy": "random", "score": 1234,
+     "max_tile": 128, "moves": 150, "won": false, "wall_time": 0.0123}
+A short summary is printed to stderr at the end.
+
+Usage:
+    python games/game_007_2048_batch.py --games 100000 --policy random
+    python games/game_007_2048_batch.py --games 200 --policy expectimax --think 0.01
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from games import game_007_2048_engine as engine
+from games.game_007_2048_ai import ExpectimaxAI, MonteCarloAI
+
+POLICIES = ('random', 'greedy', 'expectimax', 'montecarlo')
+DEFAULT_THINK_TIME = 0.01
+
+
+class RandomPolicy:
+    """Uniformly random legal move"""
+
+    def __init__(self, rng):
+        self.rng = rng
+
+    def choose_move(self, board):
+        directions = [d for d in engine.DIRECTIONS if engine.move(board, d)[0] != board]
+        return self.rng.choice(directions) if directions else None
+
+
+class GreedyPolicy:
+    """Move with the largest immediate score gain (ties: most empty cells)"""
+
+    def choose_move(self, board):
+        best_direction = None
+        best_key = None
+        for direction in engine.DIRECTIONS:
+            new_board, score_gain = engine.move(board, direction)
+            if new_board == board:
+                continue
+            key = (score_gain, engine.count_empty(new_board))
+            if best_key is None or key > best_key:
+                best_key = key
+                best_direction = direction
+        return best_direction
+
+
+def make_policy(name, game, think_time, seed):
+    """Build a move policy for one game"""
+    if name == 'random':
+        return RandomPolicy(game.rng)
+    if name == 'greedy':
+        return GreedyPolicy()
+    if name == 'expectimax':
+        return ExpectimaxAI(time_budget=think_time)
+    if name == 'montecarlo':
+        return MonteCarloAI(seed=seed)
+    raise ValueError(f"Unknown policy: {name}")
+
+
+def play_game(task):
+    """Play one seeded game to the end and return its result dict"""
+    index, seed, policy_name, think_time, max_moves = task
+    start = time.perf_counter()
+
+    game = engine.Engine2048(seed=seed)
+    policy = make_policy(policy_name, game, think_time, seed)
+    while max_moves is None or game.moves < max_moves:
+        direction = policy.choose_move(game.board)
+        if direction is None:
+            break
+        game.step(direction)
+
+    return {
+        'game': index,
+        'seed': seed,
+        'policy': policy_name,
+        'score': game.score,
+        'max_tile': game.max_tile(),
+        'moves': game.moves,
+        'won': game.has_won(),
+        'wall_time': round(time.perf_counter() - start, 6),
+    }
+
+
+def run_batch(games, seed=0, policy='random', think_time=DEFAULT_THINK_TIME,
+              workers=None, max_moves=None, chunksize=None):
+    """Yield result dicts as games finish (in completion order)"""
+    tasks = [(i, seed + i, policy, think_time, max_moves) for i in range(games)]
+    if workers == 1:
+        for task in tasks:
+            yield play_game(task)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(1, min(64, games // (workers * 8)))
+    with multiprocessing.Pool(workers) as pool:
+        for result in pool.imap_unordered(play_game, tasks, chunksize=chunksize):
+            yield result
+
+
+def summarize(results, elapsed):
+    """Build a short text summary of a batch"""
+    count = len(results)
+    if not count:
+        return "No games played"
+    scores = [r['score'] for r in results]
+    tiles = Counter(r['max_tile'] for r in results)
+    lines = [
+        f"Games: {count}  Time: {elapsed:.2f}s  ({count / elapsed:.1f} games/s)",
+        f"Score: mean {sum(scores) / count:.1f}  min {min(scores)}  max {max(scores)}",
+        f"Moves: mean {sum(r['moves'] for r in results) / count:.1f}",
+        "Max tile: " + "  ".join(f"{tile}: {tiles[tile] / count:.1%}" for tile in sorted(tiles)),
+    ]
+    return "\n".join(lines)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run seeded headless 2048 games in parallel")
+    parser.add_argument("-n", "--games", type=int, default=1000, help="number of games")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game")
+    parser.add_argument("--policy", choices=POLICIES, default='random', help="move policy")
+    parser.add_argument("--think", type=float, default=DEFAULT_THINK_TIME,
+                        help="expectimax time budget per move in seconds")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="worker processes (default: CPU count, 1 = no pool)")
+    parser.add_argument("--max-moves", type=int, default=None, help="stop each game after N moves")
+    parser.add_argument("-o", "--output", default=None, help="write JSON lines here instead of stdout")
+    parser.add_argument("-q", "--quiet", action="store_true", help="don't print the summary")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    out = open(args.output, 'w') if args.output else sys.stdout
+    results = []
+    start = time.perf_counter()
+    try:
+        for result in run_batch(args.games, args.seed, args.policy, args.think,
+                                args.workers, args.max_moves):
+            out.write(json.dumps(result) + "\n")
+            out.flush()
+            results.append(result)
+    except (KeyboardInterrupt, BrokenPipeError):
+        pass
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    if not args.quiet:
+        print(summarize(results, time.perf_counter() - start), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
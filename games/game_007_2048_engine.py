@@ -0,0 +1,374 @@
+"""
+Game 007: 2048 - Bitboard Engine
+Headless 2048 rules on a packed 64-bit board.
+
+Each tile is stored as a 4-bit exponent (0 = empty, 1 = 2, 2 = 4, ... 15 = 32768),
+row r lives in bits 16*r .. 16*r+15 and column c is nibble c of that row.
+Every possible 16-bit row is pre-moved once at import time, so a whole-board
+move is four table lookups (plus a transpose for vertical moves).
+"""
+
+import random
+
+ROW_MASK = 0xFFFF
+MAX_EXPONENT = 15
+
+# Directions (same order as the arrow keys are handled in Game2048.run)
+UP = 0
+DOWN = 1
+LEFT = 2
+RIGHT = 3
+DIRECTIONS = (UP, DOWN, LEFT, RIGHT)
+DIRECTION_NAMES = {UP: 'up', DOWN: 'down', LEFT: 'left', RIGHT: 'right'}
+
+# Spawn distribution used by add_new_tile: 90% "2", 10% "4"
+SPAWN_FOUR_PROBABILITY = 0.1
+
+
+def _unpack_col(row):
+    """Spread a 16-bit row into a column (nibble i -> bits 16*i)"""
+    return ((row & 0xF)
+            | (row & 0xF0) << 12
+            | (row & 0xF00) << 24
+            | (row & 0xF000) << 36)
+
+
+def _reverse_row(row):
+    """Reverse the four nibbles of a 16-bit row"""
+    return ((row >> 12) & 0xF) | ((row >> 4) & 0xF0) | ((row << 4) & 0xF00) | ((row << 12) & 0xF000)
+
+
+def _slide_left(line):
+    """Slide and merge one line of exponents to the left, return (line, score)"""
+    tiles = [e for e in line if e != 0]
+    merged = []
+    score = 0
+    i = 0
+    while i < len(tiles):
+        if i + 1 < len(tiles) and tiles[i] == tiles[i + 1]:
+            exponent = min(tiles[i] + 1, MAX_EXPONENT)
+            merged.append(exponent)
+            score += 1 << exponent
+            i += 2
+        else:
+            merged.append(tiles[i])
+            i += 1
+    merged += [0] * (4 - len(merged))
+    return merged, score
+
+
+def _build_tables():
+    """Precompute moved rows and score gains for all 65536 rows"""
+    size = ROW_MASK + 1
+    left = [0] * size
+    right = [0] * size
+    up = [0] * size
+    down = [0] * size
+    score = [0] * size
+
+    for row in range(size):
+        line = [(row >> 4 * i) & 0xF for i in range(4)]
+        moved, gain = _slide_left(line)
+        result = moved[0] | moved[1] << 4 | moved[2] << 8 | moved[3] << 12
+
+        rev_row = _reverse_row(row)
+        rev_result = _reverse_row(result)
+
+        left[row] = result
+        right[rev_row] = rev_result
+        up[row] = _unpack_col(result)
+        down[rev_row] = _unpack_col(rev_result)
+        score[row] = gain
+
+    return left, right, up, down, score
+
+
+# Moving right is moving left on the reversed row, so the score of a right
+# move on row r is SCORE_TABLE[_reverse_row(r)]; RIGHT_SCORE_TABLE caches that.
+LEFT_TABLE, RIGHT_TABLE, UP_TABLE, DOWN_TABLE, SCORE_TABLE = _build_tables()
+RIGHT_SCORE_TABLE = [SCORE_TABLE[_reverse_row(row)] for row in range(ROW_MASK + 1)]
+
+
+def transpose(board):
+    """Transpose the 4x4 nibble matrix (rows become columns)"""
+    a1 = board & 0xF0F00F0FF0F00F0F
+    a2 = board & 0x0000F0F00000F0F0
+    a3 = board & 0x0F0F00000F0F0000
+    a = a1 | (a2 << 12) | (a3 >> 12)
+    b1 = a & 0xFF00FF0000FF00FF
+    b2 = a & 0x00FF00FF00000000
+    b3 = a & 0x00000000FF00FF00
+    return b1 | (b2 >> 24) | (b3 << 24)
+
+
+def move_left(board):
+    """Move all tiles left, return (new_board, score_gain)"""
+    r0 = board & ROW_MASK
+    r1 = (board >> 16) & ROW_MASK
+    r2 = (board >> 32) & ROW_MASK
+    r3 = (board >> 48) & ROW_MASK
+    new_board = LEFT_TABLE[r0] | LEFT_TABLE[r1] << 16 | LEFT_TABLE[r2] << 32 | LEFT_TABLE[r3] << 48
+    return new_board, SCORE_TABLE[r0] + SCORE_TABLE[r1] + SCORE_TABLE[r2] + SCORE_TABLE[r3]
+
+
+def move_right(board):
+    """Move all tiles right, return (new_board, score_gain)"""
+    r0 = board & ROW_MASK
+    r1 = (board >> 16) & ROW_MASK
+    r2 = (board >> 32) & ROW_MASK
+    r3 = (board >> 48) & ROW_MASK
+    new_board = RIGHT_TABLE[r0] | RIGHT_TABLE[r1] << 16 | RIGHT_TABLE[r2] << 32 | RIGHT_TABLE[r3] << 48
+    score = RIGHT_SCORE_TABLE[r0] + RIGHT_SCORE_TABLE[r1] + RIGHT_SCORE_TABLE[r2] + RIGHT_SCORE_TABLE[r3]
+    return new_board, score
+
+
+def move_up(board):
+    """Move all tiles up, return (new_board, score_gain)"""
+    t = transpose(board)
+    c0 = t & ROW_MASK
+    c1 = (t >> 16) & ROW_MASK
+    c2 = (t >> 32) & ROW_MASK
+    c3 = (t >> 48) & ROW_MASK
+    new_board = UP_TABLE[c0] | UP_TABLE[c1] << 4 | UP_TABLE[c2] << 8 | UP_TABLE[c3] << 12
+    return new_board, SCORE_TABLE[c0] + SCORE_TABLE[c1] + SCORE_TABLE[c2] + SCORE_TABLE[c3]
+
+
+def move_down(board):
+    """Move all tiles down, return (new_board, score_gain)"""
+    t = transpose(board)
+    c0 = t & ROW_MASK
+    c1 = (t >> 16) & ROW_MASK
+    c2 = (t >> 32) & ROW_MASK
+    c3 = (t >> 48) & ROW_MASK
+    new_board = DOWN_TABLE[c0] | DOWN_TABLE[c1] << 4 | DOWN_TABLE[c2] << 8 | DOWN_TABLE[c3] << 12
+    score = RIGHT_SCORE_TABLE[c0] + RIGHT_SCORE_TABLE[c1] + RIGHT_SCORE_TABLE[c2] + RIGHT_SCORE_TABLE[c3]
+    return new_board, score
+
+
+MOVES = {UP: move_up, DOWN: move_down, LEFT: move_left, RIGHT: move_right}
+
+
+def move(board, direction):
+    """Apply a move in the given direction, return (new_board, score_gain)"""
+    return MOVES[direction](board)
+
+
+def empty_cells(board):
+    """Return the nibble indexes (0-15) of all empty cells"""
+    return [i for i in range(16) if (board >> (4 * i)) & 0xF == 0]
+
+
+def count_empty(board):
+    """Count empty cells without building a list"""
+    # Fold each nibble to a single "non-zero" bit, then count the zero nibbles
+    x = board | (board >> 1)
+    x |= x >> 2
+    x &= 0x1111111111111111
+    return 16 - bin(x).count('1')
+
+
+def place_tile(board, index, exponent):
+    """Return board with the given exponent placed at nibble index"""
+    return board | (exponent << (4 * index))
+
+
+def spawn_tile(board, rng=random):
+    """Add a 2 (90%) or 4 (10%) to a random empty cell, like Game2048.add_new_tile"""
+    cells = empty_cells(board)
+    if not cells:
+        return board
+    index = rng.choice(cells)
+    exponent = 2 if rng.random() < SPAWN_FOUR_PROBABILITY else 1
+    return place_tile(board, index, exponent)
+
+
+def can_move(board):
+    """Check if any move changes the board"""
+    if count_empty(board):
+        return True
+    return move_left(board)[0] != board or move_up(board)[0] != board
+
+
+def max_exponent(board):
+    """Largest exponent on the board"""
+    best = 0
+    while board:
+        nibble = board & 0xF
+        if nibble > best:
+            best = nibble
+        board >>= 4
+    return best
+
+
+def max_tile(board):
+    """Largest tile value on the board"""
+    exponent = max_exponent(board)
+    return 1 << exponent if exponent else 0
+
+
+def from_grid(grid):
+    """Pack a 4x4 list-of-lists of tile values into a board"""
+    board = 0
+    for r in range(4):
+        for c in range(4):
+            value = grid[r][c]
+            if value:
+                board |= (value.bit_length() - 1) << (16 * r + 4 * c)
+    return board
+
+
+def to_grid(board):
+    """Unpack a board into a 4x4 list-of-lists of tile values"""
+    grid = []
+    for r in range(4):
+        row = []
+        for c in range(4):
+            exponent = (board >> (16 * r + 4 * c)) & 0xF
+            row.append(1 << exponent if exponent else 0)
+        grid.append(row)
+    return grid
+
+
+def get_cell(board, r, c):
+    """Tile value at row r, column c"""
+    exponent = (board >> (16 * r + 4 * c)) & 0xF
+    return 1 << exponent if exponent else 0
+
+
+def set_cell(board, r, c, value):
+    """Board with the tile at row r, column c replaced by value (0 = empty)"""
+    shift = 16 * r + 4 * c
+    exponent = value.bit_length() - 1 if value else 0
+    return (board & ~(0xF << shift)) | (exponent << shift)
+
+
+class GridRow:
+    """One row of a GridView; assigning a cell writes through to the engine"""
+
+    def __init__(self, engine, r):
+        self.engine = engine
+        self.r = r
+
+    def __len__(self):
+        return 4
+
+    def __getitem__(self, c):
+        if isinstance(c, slice):
+            return list(self)[c]
+        if not -4 <= c < 4:
+            raise IndexError("column out of range")
+        return get_cell(self.engine.board, self.r, c % 4)
+
+    def __setitem__(self, c, value):
+        if not -4 <= c < 4:
+            raise IndexError("column out of range")
+        self.engine.board = set_cell(self.engine.board, self.r, c % 4, value)
+
+    def __iter__(self):
+        return (get_cell(self.engine.board, self.r, c) for c in range(4))
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class GridView:
+    """Live 4x4 list-of-lists view of an engine's board
+
+    view[r][c] reads the packed board and view[r][c] = v updates it, so code
+    written against the old list-of-lists board keeps working.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+
+    def __len__(self):
+        return 4
+
+    def __getitem__(self, r):
+        if isinstance(r, slice):
+            return [GridRow(self.engine, i) for i in range(4)][r]
+        if not -4 <= r < 4:
+            raise IndexError("row out of range")
+        return GridRow(self.engine, r % 4)
+
+    def __setitem__(self, r, row):
+        if not -4 <= r < 4:
+            raise IndexError("row out of range")
+        for c, value in enumerate(row):
+            self.engine.board = set_cell(self.engine.board, r % 4, c, value)
+
+    def __iter__(self):
+        return (GridRow(self.engine, r) for r in range(4))
+
+    def __eq__(self, other):
+        return [list(row) for row in self] == [list(row) for row in other]
+
+    def __repr__(self):
+        return repr(to_grid(self.engine.board))
+
+
+class Engine2048:
+    """Headless 2048 game state (board, score and RNG) without curses"""
+
+    def __init__(self, seed=None):
+        self.rng = random.Random(seed)
+        self.board = 0
+        self.score = 0
+        self.moves = 0
+        self.reset()
+
+    def reset(self):
+        """Start a new game with two tiles"""
+        self.board = 0
+        self.score = 0
+        self.moves = 0
+        self.add_new_tile()
+        self.add_new_tile()
+
+    def add_new_tile(self):
+        """Add a new tile (2 or 4) to a random empty cell"""
+        new_board = spawn_tile(self.board, self.rng)
+        added = new_board != self.board
+        self.board = new_board
+        return added
+
+    def move(self, direction):
+        """Apply a move without spawning, return (moved, score_gain)"""
+        new_board, score_gain = move(self.board, direction)
+        if new_board == self.board:
+            return False, 0
+        self.board = new_board
+        self.score += score_gain
+        self.moves += 1
+        return True, score_gain
+
+    def step(self, direction):
+        """Apply a move and spawn a tile if the board changed"""
+        moved, score_gain = self.move(direction)
+        if moved:
+            self.add_new_tile()
+        return moved, score_gain
+
+    def can_move(self):
+        """Check if any move is possible"""
+        return can_move(self.board)
+
+    def has_won(self):
+        """Check if a 2048 tile exists"""
+        return max_exponent(self.board) >= 11
+
+    def max_tile(self):
+        """Largest tile value on the board"""
+        return max_tile(self.board)
+
+    @property
+    def grid(self):
+        """Board as a 4x4 list-of-lists of tile values"""
+        return to_grid(self.board)
+
+    @grid.setter
+    def grid(self, grid):
+        self.board = from_grid(grid)
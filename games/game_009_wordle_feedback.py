@@ -0,0 +1,287 @@
+"""
+Game 009: Wordle - Feedback Matrix
+Precomputed guess x answer feedback patterns.
+
+A pattern packs the colours of one guess into a base-3 integer: digit i
+(weight 3**i) is 0 = gray, 1 = yellow, 2 = green for letter i. Five-letter
+patterns (0..242) fit in one byte, longer words use two bytes.
+
+FeedbackMatrix holds one pattern per (allowed guess, answer) pair, rows in
+WordIndex.guesses order and columns in WordIndex.answers order. It is built
+once per word index and stored under .cache/wordle, then memory-mapped on
+later runs, so feedback for any pair (or a whole row) is a single lookup.
+Sets of answers are int bitsets over the columns: partition(guess) splits
+all answers by pattern once, after which pruning any number of candidate
+sets (one per board) by a guess is a single AND each.
+
+With NumPy installed the matrix is built with vectorised letter comparisons
+and exposed as a 2-D array; without it a stdlib build is used and rows are
+memoryview slices.
+"""
+
+import mmap
+import os
+import string
+import struct
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.cache import cache_file, content_key, write_atomic
+
+try:
+    import numpy as np
+except ImportError:  # optional: only speeds up building the matrix
+    np = None
+
+GRAY, YELLOW, GREEN = 0, 1, 2
+COLORS = ('gray', 'yellow', 'green')
+
+MATRIX_VERSION = 1
+MATRIX_MAGIC = b'WFBM'
+HEADER = struct.Struct('<4sHBBII')  # magic, version, length, item size, rows, columns
+BUILD_CHUNK = 512  # guesses per vectorised block (bounds temporary memory)
+
+_memo = {}
+
+# set bit positions of every byte value (bitset -> column list)
+BYTE_BITS = [tuple(bit for bit in range(8) if value >> bit & 1) for value in range(256)]
+
+
+def pattern_count(length):
+    """Number of distinct patterns for a word length"""
+    return 3 ** length
+
+
+def typecode(length):
+    """array/memoryview type code big enough for every pattern"""
+    return 'B' if pattern_count(length) <= 256 else 'H'
+
+
+def score(guess, answer):
+    """Feedback pattern of guess against answer (standard repeated-letter rules)
+
+    Greens are matched first; each remaining guess letter is yellow only while
+    the answer still has an unmatched copy of it. Words may be str or ASCII
+    bytes; unmatched letters are counted in an integer array indexed by
+    character code.
+    """
+    if isinstance(guess, str):
+        guess = guess.encode('ascii')
+    if isinstance(answer, str):
+        answer = answer.encode('ascii')
+    unmatched = [0] * 128
+    for g, a in zip(guess, answer):
+        if g != a:
+            unmatched[a] += 1
+
+    pattern = 0
+    weight = 1
+    for g, a in zip(guess, answer):
+        if g == a:
+            pattern += GREEN * weight
+        elif unmatched[g]:
+            unmatched[g] -= 1
+            pattern += YELLOW * weight
+        weight *= 3
+    return pattern
+
+
+def solved_pattern(length):
+    """Pattern of an all-green guess"""
+    return pattern_count(length) - 1
+
+
+def bitset_columns(mask):
+    """Sorted column numbers of the set bits of an int bitset"""
+    columns = []
+    data = mask.to_bytes((mask.bit_length() + 7) // 8, 'little')
+    for offset, value in enumerate(data):
+        if value:
+            base = offset * 8
+            columns.extend(base + bit for bit in BYTE_BITS[value])
+    return columns
+
+
+def encode(colors):
+    """['green', 'gray', ...] -> pattern"""
+    pattern = 0
+    for color in reversed(colors):
+        pattern = pattern * 3 + COLORS.index(color)
+    return pattern
+
+
+def decode(pattern, length):
+    """pattern -> ['green', 'gray', ...]"""
+    colors = []
+    for _ in range(length):
+        pattern, digit = divmod(pattern, 3)
+        colors.append(COLORS[digit])
+    return colors
+
+
+def build_rows_python(guesses, answers):
+    """Stdlib build: one bytes/array row per guess
+
+    Letters that are not in the guess can never change its feedback, so each
+    answer is first projected onto the guess letters (one str.translate over
+    all answers) and score() runs once per distinct projection.
+    """
+    text = '\n'.join(answers)
+    code = typecode(len(answers[0])) if answers else 'B'
+    rows = []
+    for guess in guesses:
+        keep = set(guess)
+        table = str.maketrans({c: '_' for c in string.ascii_uppercase if c not in keep})
+        projected = text.translate(table).split('\n')
+        patterns = {p: score(guess, p) for p in set(projected)}
+        row = list(map(patterns.__getitem__, projected))
+        rows.append(bytes(row) if code == 'B' else struct.pack(f'<{len(row)}H', *row))
+    return rows
+
+
+def build_numpy(guesses, answers):
+    """Vectorised build: (guesses, answers) array of patterns
+
+    Works on blocks of guesses with one boolean (block, answers) plane per
+    letter position. A non-green guess letter is yellow while the answer
+    still has unclaimed copies of it: the answer's count of that letter minus
+    the copies claimed by greens later in the guess and by earlier non-green
+    copies of the same letter.
+    """
+    length = len(answers[0])
+    dtype = np.uint8 if typecode(length) == 'B' else np.uint16
+    guess_codes = np.frombuffer(''.join(guesses).encode('ascii'), np.uint8).reshape(-1, length)
+    answer_codes = np.frombuffer(''.join(answers).encode('ascii'), np.uint8).reshape(-1, length)
+    letter_counts = np.zeros((256, len(answers)), np.uint8)  # [letter code, answer]
+    for j in range(length):
+        np.add.at(letter_counts, (answer_codes[:, j], np.arange(len(answers))), 1)
+
+    result = np.zeros((len(guesses), len(answers)), dtype)
+    for start in range(0, len(guesses), BUILD_CHUNK):
+        g = guess_codes[start:start + BUILD_CHUNK]
+        green = [g[:, j:j + 1] == answer_codes[None, :, j] for j in range(length)]
+        patterns = result[start:start + BUILD_CHUNK]
+        for i in range(length):
+            same = g == g[:, i:i + 1]  # guess positions holding the same letter as i
+            claimed = np.zeros(green[0].shape, np.uint8)
+            claimed += same[:, :i].sum(axis=1, dtype=np.uint8)[:, None]
+            for j in range(i + 1, length):
+                if same[:, j].any():
+                    claimed += green[j] & same[:, j:j + 1]
+            yellow = ~green[i] & (letter_counts[g[:, i]] > claimed)
+            patterns += (green[i] * np.uint8(GREEN) + yellow).astype(dtype) * dtype(3 ** i)
+    return result
+
+
+class FeedbackMatrix:
+    """Patterns for every (guess, answer) pair of a WordIndex"""
+
+    def __init__(self, index, data):
+        self.key = matrix_key(index)
+        self.length = index.length
+        self.guesses = index.guesses
+        self.answers = index.answers
+        self.guess_row = {word: i for i, word in enumerate(self.guesses)}
+        self.answer_column = {word: i for i, word in enumerate(self.answers)}
+        self.columns = len(self.answers)
+        self.all_answers = (1 << self.columns) - 1  # bitset of every column
+        # NumPy: 2-D array; stdlib: flat memoryview in row-major order
+        self.data = data
+        self._partitions = {}
+
+    def row(self, guess_row):
+        """Patterns of one guess against every answer"""
+        if np is not None and isinstance(self.data, np.ndarray):
+            return self.data[guess_row]
+        start = guess_row * self.columns
+        return self.data[start:start + self.columns]
+
+    def pattern(self, guess, answer):
+        """Pattern for a pair of words (guess must be allowed, answer an answer)"""
+        return int(self.row(self.guess_row[guess])[self.answer_column[answer]])
+
+    def colors(self, guess, answer):
+        return decode(self.pattern(guess, answer), self.length)
+
+    def partition(self, guess):
+        """{pattern: bitset of the answers guess gives that pattern} (memoized)"""
+        groups = self._partitions.get(guess)
+        if groups is None:
+            bitmaps = {}
+            size = (self.columns + 7) // 8
+            for column, pattern in enumerate(self.row(self.guess_row[guess]).tolist()):
+                bitmap = bitmaps.get(pattern)
+                if bitmap is None:
+                    bitmap = bitmaps[pattern] = bytearray(size)
+                bitmap[column >> 3] |= 1 << (column & 7)
+            groups = {pattern: int.from_bytes(bitmap, 'little')
+                      for pattern, bitmap in bitmaps.items()}
+            self._partitions[guess] = groups
+        return groups
+
+
+def build_matrix_bytes(index):
+    """Header + row-major pattern data for a WordIndex"""
+    guesses, answers = index.guesses, index.answers
+    code = typecode(index.length)
+    header = HEADER.pack(MATRIX_MAGIC, MATRIX_VERSION, index.length,
+                         struct.calcsize(code), len(guesses), len(answers))
+    if np is not None and guesses and answers:
+        body = build_numpy(guesses, answers).astype('<' + code).tobytes()
+    else:
+        body = b''.join(build_rows_python(guesses, answers)) if answers else b''
+    return header + body
+
+
+def open_matrix_data(path, index):
+    """Memory-map a cached matrix file, or None if missing/stale"""
+    code = typecode(index.length)
+    expected = HEADER.pack(MATRIX_MAGIC, MATRIX_VERSION, index.length,
+                           struct.calcsize(code), len(index.guesses), len(index.answers))
+    size = HEADER.size + len(index.guesses) * len(index.answers) * struct.calcsize(code)
+    try:
+        with open(path, 'rb') as f:
+            if f.read(HEADER.size) != expected or os.fstat(f.fileno()).st_size != size:
+                return None
+            if size == HEADER.size:
+                return memoryview(b'').cast(code)
+            if np is not None:
+                return np.memmap(path, dtype='<' + code, mode='r', offset=HEADER.size,
+                                 shape=(len(index.guesses), len(index.answers)))
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    return memoryview(mapped)[HEADER.size:].cast(code)
+
+
+def matrix_key(index):
+    return content_key(f"wordle-feedback-v{MATRIX_VERSION}", str(index.length),
+                       index.answer_blob, index.allowed_blob)
+
+
+def load_matrix(index, use_cache=True):
+    """Return the FeedbackMatrix for a WordIndex (memoized, cached on disk)"""
+    key = matrix_key(index)
+    matrix = _memo.get(key)
+    if matrix is not None:
+        return matrix
+
+    path = cache_file('wordle', f"{key}.fbm") if use_cache else None
+    data = open_matrix_data(path, index) if path else None
+    if data is None:
+        blob = build_matrix_bytes(index)
+        if path:
+            try:
+                write_atomic(path, blob)
+                data = open_matrix_data(path, index)
+            except OSError:
+                data = None
+        if data is None:
+            data = memoryview(blob)[HEADER.size:].cast(typecode(index.length))
+            if np is not None:
+                data = np.asarray(data).reshape(len(index.guesses), len(index.answers))
+
+    matrix = FeedbackMatrix(index, data)
+    _memo[key] = matrix
+    return matrix
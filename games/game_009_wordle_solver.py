@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""
+Game 009: Wordle - Solver
+Entropy-maximising solver, used for in-game hints and an auto-play benchmark.
+
+The solver keeps the answers that are still consistent with every
+(guess, feedback) pair so far. Each turn it picks the allowed guess whose
+feedback splits those candidates most evenly, i.e. with the highest expected
+information (Shannon entropy of the pattern distribution); ties go to
+guesses that could still be the answer. Patterns come from the precomputed
+FeedbackMatrix, so scoring a guess is one row lookup plus a histogram.
+
+The opening guess only depends on the word lists, so it is computed once
+and cached under .cache/wordle. Later decisions are memoized per candidate
+set, which makes the benchmark share work between games.
+
+MultiBoardSolver plays several boards from one guess stream: each board
+keeps its own candidate bitset and one shared partition of the answers by
+pattern prunes all of them.
+
+Usage:
+    python games/game_009_wordle_solver.py            # solve every answer
+    python games/game_009_wordle_solver.py -n 200 -o runs.jsonl
+    python games/game_009_wordle_solver.py --boards 4 -n 100   # Quordle
+    python games/game_009_wordle.py --assist          # play with hints
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import time
+from collections import Counter
+from operator import itemgetter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from games import game_009_wordle_feedback as feedback
+from games.game_009_wordle_feedback import bitset_columns, encode, load_matrix
+from games.game_009_wordle_words import WORD_LENGTHS, load_index, read_words
+from utils.cache import cache_file, content_key, write_atomic
+
+SOLVER_VERSION = 1
+MAX_GUESSES = 6  # classic single-board game
+MAX_BOARDS = 8
+PAIRWISE_LIMIT = 64  # NumPy: candidate count below which pairwise counting beats bincount
+BINCOUNT_LIMIT = 1 << 22  # NumPy: largest guesses x patterns histogram to allocate
+
+_openers = {}
+
+
+def max_attempts(boards=1):
+    """Guesses allowed: 6 for one board, 7 for two, 9 for four, 13 for eight"""
+    return 5 + boards
+
+
+def plogp_table(size):
+    """c * log2(c) for c = 0..size (histogram term of the entropy)"""
+    return [c * math.log2(c) if c else 0.0 for c in range(size + 1)]
+
+
+class WordleSolver:
+    """Candidate tracking and best-guess search over a FeedbackMatrix
+
+    Candidates are an int bitset over the matrix columns (answers), pruned
+    by one AND with matrix.partition(guess)[pattern] per guess. Solvers
+    created with share=other reuse its tables and decision memo.
+    """
+
+    def __init__(self, matrix, share=None):
+        self.matrix = matrix
+        self.solved_pattern = feedback.solved_pattern(matrix.length)
+        if share is not None:
+            self.plogp, self.rows, self.decisions = share.plogp, share.rows, share.decisions
+        else:
+            self.plogp = plogp_table(len(matrix.answers))
+            self.decisions = {}  # tuple(candidate columns) -> guess
+            if feedback.np is not None and isinstance(matrix.data, feedback.np.ndarray):
+                self.plogp = feedback.np.array(self.plogp)
+                self.rows = None
+            else:
+                self.rows = [matrix.row(i) for i in range(len(matrix.guesses))]
+        self.reset()
+
+    def reset(self):
+        """Start a new game: every answer is possible"""
+        self.mask = self.matrix.all_answers
+        self.applied = 0
+        self.solved = False
+        self._columns = None
+
+    @property
+    def candidates(self):
+        """Columns of the answers still consistent with the feedback so far"""
+        if self._columns is None or self._columns[0] != self.mask:
+            self._columns = (self.mask, bitset_columns(self.mask))
+        return self._columns[1]
+
+    def count(self):
+        return bin(self.mask).count('1')
+
+    def remaining(self):
+        """Answers still consistent with the feedback so far"""
+        return [self.matrix.answers[c] for c in self.candidates]
+
+    def apply(self, guess, pattern):
+        """Keep only the answers that would have produced this pattern"""
+        self.mask &= self.matrix.partition(guess).get(pattern, 0)
+        self.solved = self.solved or pattern == self.solved_pattern
+        self.applied += 1
+
+    def sync(self, attempts):
+        """Apply new (guess, colors) entries of a game's attempt list"""
+        if len(attempts) < self.applied:
+            self.reset()
+        for guess, colors in attempts[self.applied:]:
+            self.apply(guess, encode(colors))
+
+    def guess_scores(self, candidates):
+        """sum(c * log2 c) over each guess's pattern histogram (lower = better)
+
+        Entropy is log2(k) - score / k for k candidates, so minimising the
+        score maximises the expected information.
+        """
+        if self.rows is None:
+            np = feedback.np
+            data = self.matrix.data
+            if len(candidates) <= PAIRWISE_LIMIT:
+                # small sets: sum over candidates of log2(size of its pattern class)
+                patterns = data[:, candidates]
+                same = (patterns[:, :, None] == patterns[:, None, :]).sum(axis=2)
+                return np.log2(same).sum(axis=1).tolist()
+            rows = len(self.matrix.guesses)
+            size = feedback.pattern_count(self.matrix.length)
+            patterns = data[:, candidates].astype(np.int64)
+            patterns += (np.arange(rows, dtype=np.int64) * size)[:, None]
+            if rows * size <= BINCOUNT_LIMIT:
+                counts = np.bincount(patterns.ravel(), minlength=rows * size)
+                return self.plogp[counts].reshape(rows, size).sum(axis=1).tolist()
+            # long words: too many patterns for a dense histogram per guess
+            keys, counts = np.unique(patterns, return_counts=True)
+            return np.bincount(keys // size, weights=self.plogp[counts], minlength=rows).tolist()
+
+        plogp = self.plogp
+        if len(candidates) == len(self.matrix.answers):
+            return [sum(plogp[n] for n in Counter(row).values()) for row in self.rows]
+        pick = itemgetter(*candidates)
+        return [sum(plogp[n] for n in Counter(pick(row)).values()) for row in self.rows]
+
+    def entropies(self, candidates):
+        """Expected information (bits) of every allowed guess"""
+        k = len(candidates)
+        return [math.log2(k) - score / k for score in self.guess_scores(candidates)]
+
+    def choose(self, candidates):
+        """Best guess for a candidate list (memoized)"""
+        key = tuple(candidates)
+        guess = self.decisions.get(key)
+        if guess is not None:
+            return guess
+
+        answers = self.matrix.answers
+        if len(candidates) <= 2:
+            guess = answers[candidates[0]]
+        else:
+            scores = self.guess_scores(candidates)
+            guesses = self.matrix.guesses
+            possible = {answers[c] for c in candidates}
+            best = min(range(len(guesses)),
+                       key=lambda i: (scores[i], guesses[i] not in possible))
+            guess = guesses[best]
+        self.decisions[key] = guess
+        return guess
+
+    def best_guess(self):
+        """Recommended next guess, or None if no answer fits the feedback"""
+        if not self.mask:
+            return None
+        if self.mask == self.matrix.all_answers:
+            return opening_guess(self)
+        return self.choose(self.candidates)
+
+    def solve(self, answer, max_guesses=None):
+        """Play one game against answer, return the list of guesses"""
+        self.reset()
+        guesses = []
+        row_of = self.matrix.guess_row
+        column = self.matrix.answer_column[answer]
+        while max_guesses is None or len(guesses) < max_guesses:
+            guess = self.best_guess()
+            guesses.append(guess)
+            if guess == answer:
+                break
+            self.apply(guess, int(self.matrix.row(row_of[guess])[column]))
+        return guesses
+
+
+class MultiBoardSolver:
+    """Several boards answered by one guess stream (Dordle / Quordle style)
+
+    Each board keeps its own candidate bitset; a guess prunes all of them
+    with one shared partition. A board that is down to one word is played
+    first, otherwise the guess with the most total information over the
+    unsolved boards wins.
+    """
+
+    def __init__(self, matrix, boards):
+        first = WordleSolver(matrix)
+        self.matrix = matrix
+        self.boards = [first] + [WordleSolver(matrix, share=first) for _ in range(boards - 1)]
+
+    def reset(self):
+        for board in self.boards:
+            board.reset()
+
+    def open_boards(self):
+        return [board for board in self.boards if not board.solved and board.mask]
+
+    def apply(self, guess, patterns):
+        for board, pattern in zip(self.boards, patterns):
+            if not board.solved:
+                board.apply(guess, pattern)
+
+    def sync(self, board_attempts):
+        """Apply new entries of each board's (guess, colors) attempt list"""
+        for board, attempts in zip(self.boards, board_attempts):
+            board.sync(attempts)
+
+    def best_guess(self):
+        """Recommended next guess, or None when nothing is left to solve"""
+        boards = self.open_boards()
+        if not boards:
+            return None
+        if len(boards) == 1:
+            return boards[0].best_guess()
+        sure = [board for board in boards if board.count() == 1]
+        if sure:
+            return min(sure, key=WordleSolver.count).best_guess()
+        if all(board.mask == self.matrix.all_answers for board in boards):
+            return opening_guess(boards[0])
+
+        guesses = self.matrix.guesses
+        totals = [0.0] * len(guesses)
+        possible = set()
+        for board in boards:
+            for i, bits in enumerate(board.entropies(board.candidates)):
+                totals[i] += bits
+            possible.update(board.remaining())
+        best = max(range(len(guesses)), key=lambda i: (totals[i], guesses[i] in possible))
+        return guesses[best]
+
+    def solve(self, answers, max_guesses=None):
+        """Play one game against a tuple of answers, return the list of guesses"""
+        self.reset()
+        guesses = []
+        row_of = self.matrix.guess_row
+        columns = [self.matrix.answer_column[answer] for answer in answers]
+        while max_guesses is None or len(guesses) < max_guesses:
+            guess = self.best_guess()
+            if guess is None:
+                break
+            guesses.append(guess)
+            row = self.matrix.row(row_of[guess])
+            self.apply(guess, [int(row[column]) for column in columns])
+        return guesses
+
+
+def opening_guess(solver):
+    """Best first guess for the solver's word lists (memoized, cached on disk)"""
+    matrix = solver.matrix
+    key = content_key(f"wordle-opener-v{SOLVER_VERSION}", matrix.key)
+    guess = _openers.get(key)
+    if guess is not None:
+        return guess
+
+    path = cache_file('wordle', f"{key}.opener")
+    if path:
+        try:
+            with open(path, 'r', encoding='ascii') as f:
+                guess = f.read().strip()
+        except (OSError, ValueError):  # missing, unreadable or not ASCII
+            guess = None
+    if guess not in matrix.guess_row:
+        guess = solver.choose(list(range(len(matrix.answers))))
+        if path:
+            try:
+                write_atomic(path, guess.encode('ascii'))
+            except OSError:
+                pass
+
+    _openers[key] = guess
+    return guess
+
+
+def run_benchmark(solver, games=None, max_guesses=None):
+    """Yield one result dict per game
+
+    games are answers for a WordleSolver and tuples of answers for a
+    MultiBoardSolver (default: every answer, one board).
+    """
+    for target in games if games is not None else solver.matrix.answers:
+        start = time.perf_counter()
+        guesses = solver.solve(target, max_guesses)
+        words = (target,) if isinstance(target, str) else tuple(target)
+        yield {
+            'answer': target if isinstance(target, str) else list(target),
+            'guesses': len(guesses),
+            'path': guesses,
+            'solved': all(word in guesses for word in words),
+            'wall_time': round(time.perf_counter() - start, 6),
+        }
+
+
+def random_games(answers, count, boards, seed=0):
+    """count reproducible tuples of distinct answers"""
+    rng = random.Random(seed)
+    return [tuple(rng.sample(answers, boards)) for _ in range(count)]
+
+
+def summarize(results, elapsed, limit=MAX_GUESSES):
+    """Short summary of a benchmark run"""
+    count = len(results)
+    if not count:
+        return "No games played"
+    turns = Counter(r['guesses'] for r in results)
+    failed = sum(r['guesses'] > limit or not r['solved'] for r in results)
+    lines = [
+        f"Games: {count}  Time: {elapsed:.2f}s  ({elapsed / count * 1000:.2f} ms/game)",
+        f"Guesses: mean {sum(r['guesses'] for r in results) / count:.3f}  "
+        f"max {max(turns)}  over {limit}: {failed}",
+        "Distribution: " + "  ".join(f"{n}:{turns[n]}" for n in sorted(turns)),
+    ]
+    return "\n".join(lines)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Wordle entropy solver")
+    parser.add_argument("-n", "--games", type=int, default=None,
+                        help="number of games (default: every answer, or 100 with --boards)")
+    parser.add_argument("--length", type=int, choices=WORD_LENGTHS, default=5,
+                        help="word length (default: 5)")
+    parser.add_argument("--boards", type=int, choices=range(1, MAX_BOARDS + 1), default=1,
+                        metavar="N",
+                        help=f"boards solved at once from one guess stream, 1-{MAX_BOARDS} (default: 1)")
+    parser.add_argument("--seed", type=int, default=0, help="seed for multi-board games")
+    parser.add_argument("--answers", metavar="FILE", help="answer word list (default: built-in list)")
+    parser.add_argument("--guesses", metavar="FILE", help="extra allowed guesses")
+    parser.add_argument("-o", "--output", default=None, help="write JSON lines here instead of stdout")
+    parser.add_argument("-q", "--quiet", action="store_true", help="don't print the summary")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    answers = read_words(args.answers) if args.answers else None
+    guesses = read_words(args.guesses) if args.guesses else ()
+    index = load_index(answers, guesses, args.length)
+    if len(index.answers) < args.boards:
+        sys.exit("Not enough answer words for that many boards")
+
+    start = time.perf_counter()
+    matrix = load_matrix(index)
+    if args.boards > 1:
+        solver = MultiBoardSolver(matrix, args.boards)
+        games = random_games(index.answers, args.games or 100, args.boards, args.seed)
+    else:
+        solver = WordleSolver(matrix)
+        games = index.answers[:args.games] if args.games is not None else None
+    out = open(args.output, 'w') if args.output else sys.stdout
+    results = []
+    try:
+        for result in run_benchmark(solver, games):
+            out.write(json.dumps(result) + "\n")
+            results.append(result)
+    except (KeyboardInterrupt, BrokenPipeError):
+        pass
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    if not args.quiet:
+        print(summarize(results, time.perf_counter() - start, max_attempts(args.boards)),
+              file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,789 @@
+"""
+Game 009: Wordle - Word Index
+Answer and allowed-guess dictionaries for Wordle.
+
+Word lists (the built-in WORD_LIST / WORD_LIST_<n> for 4-8 letters, or files with one word per line) are
+normalised once: upper-cased, filtered to the word length, de-duplicated
+and sorted. The result is kept as
+- a frozenset of allowed guesses (O(1) validation), and
+- compact sorted byte arrays (fixed-width records) so words can be
+  addressed by index and found by binary search.
+The built index is memoized in-process and cached on disk under
+.cache/wordle as a small binary file, keyed by a hash of the sources.
+"""
+
+import os
+import random
+import struct
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.cache import cache_file, content_key, write_atomic
+
+INDEX_VERSION = 1
+INDEX_MAGIC = b'WRDX'
+HEADER = struct.Struct('<4sHBBII')  # magic, version, length, flags, answers, allowed
+DISTINCT_ANSWERS = 1  # flag: answers limited to words without repeated letters
+
+WORD_LENGTHS = range(4, 9)  # supported word lengths
+
+_memo = {}
+
+# Common 5-letter words for the game
+WORD_LIST = [
+    "ABOUT", "ABOVE", "ABUSE", "ACTOR", "ACUTE", "ADMIT", "ADOPT", "ADULT", "AFTER", "AGAIN",
+    "AGENT", "AGREE", "AHEAD", "ALARM", "ALBUM", "ALERT", "ALIEN", "ALIGN", "ALIKE", "ALIVE",
+    "ALLOW", "ALONE", "ALONG", "ALTER", "ANGEL", "ANGER", "ANGLE", "ANGRY", "APART", "APPLE",
+    "APPLY", "ARENA", "ARGUE", "ARISE", "ARRAY", "ASIDE", "ASSET", "AUDIO", "AVOID", "AWAKE",
+    "AWARD", "AWARE", "BADLY", "BAKER", "BASIC", "BEACH", "BEGAN", "BEGIN", "BEING", "BELOW",
+    "BENCH", "BILLY", "BIRTH", "BLACK", "BLAME", "BLIND", "BLOCK", "BLOOD", "BOARD", "BOOST",
+    "BOOTH", "BOUND", "BRAIN", "BRAND", "BREAD", "BREAK", "BREED", "BRIEF", "BRING", "BROAD",
+    "BROKE", "BROWN", "BUILD", "BUILT", "BUYER", "CABLE", "CALIF", "CARRY", "CATCH", "CAUSE",
+    "CHAIN", "CHAIR", "CHART", "CHASE", "CHEAP", "CHECK", "CHEST", "CHIEF", "CHILD", "CHINA",
+    "CHOSE", "CIVIC", "CIVIL", "CLAIM", "CLASS", "CLEAN", "CLEAR", "CLICK", "CLOCK", "CLOSE",
+    "COACH", "COAST", "COULD", "COUNT", "COURT", "COVER", "CRAFT", "CRASH", "CRAZY", "CREAM",
+    "CRIME", "CROSS", "CROWD", "CROWN", "CRUDE", "CURVE", "CYCLE", "DAILY", "DANCE", "DATED",
+    "DEALT", "DEATH", "DEBUT", "DELAY", "DEPTH", "DOING", "DOUBT", "DOZEN", "DRAFT", "DRAMA",
+    "DRANK", "DRAWN", "DREAM", "DRESS", "DRILL", "DRINK", "DRIVE", "DROVE", "DYING", "EAGER",
+    "EARLY", "EARTH", "EIGHT", "ELITE", "EMPTY", "ENEMY", "ENJOY", "ENTER", "ENTRY", "EQUAL",
+    "ERROR", "EVENT", "EVERY", "EXACT", "EXIST", "EXTRA", "FAITH", "FALSE", "FAULT", "FIBER",
+    "FIELD", "FIFTH", "FIFTY", "FIGHT", "FINAL", "FIRST", "FIXED", "FLASH", "FLEET", "FLOOR",
+    "FLUID", "FOCUS", "FORCE", "FORTH", "FORTY", "FORUM", "FOUND", "FRAME", "FRANK", "FRAUD",
+    "FRESH", "FRONT", "FRUIT", "FULLY", "FUNNY", "GIANT", "GIVEN", "GLASS", "GLOBE", "GOING",
+    "GRACE", "GRADE", "GRAND", "GRANT", "GRASS", "GREAT", "GREEN", "GROSS", "GROUP", "GROWN",
+    "GUARD", "GUESS", "GUEST", "GUIDE", "HAPPY", "HARRY", "HEART", "HEAVY", "HENCE", "HENRY",
+    "HORSE", "HOTEL", "HOUSE", "HUMAN", "IDEAL", "IMAGE", "INDEX", "INNER", "INPUT", "ISSUE",
+    "JAPAN", "JIMMY", "JOINT", "JONES", "JUDGE", "KNOWN", "LABEL", "LARGE", "LASER", "LATER",
+    "LAUGH", "LAYER", "LEARN", "LEASE", "LEAST", "LEAVE", "LEGAL", "LEMON", "LEVEL", "LEWIS",
+    "LIGHT", "LIMIT", "LINKS", "LIVED", "LIVES", "LOCAL", "LOGIC", "LOOSE", "LOWER", "LUCKY",
+    "LUNCH", "LYING", "MAGIC", "MAJOR", "MAKER", "MARCH", "MARIA", "MATCH", "MAYBE", "MAYOR",
+    "MEANT", "MEDIA", "METAL", "MIGHT", "MINOR", "MINUS", "MIXED", "MODEL", "MONEY", "MONTH",
+    "MORAL", "MOTOR", "MOUNT", "MOUSE", "MOUTH", "MOVED", "MOVIE", "MUSIC", "NEEDS", "NEVER",
+    "NEWLY", "NIGHT", "NOISE", "NORTH", "NOTED", "NOVEL", "NURSE", "OCCUR", "OCEAN", "OFFER",
+    "OFTEN", "ORDER", "OTHER", "OUGHT", "PAINT", "PANEL", "PAPER", "PARTY", "PEACE", "PETER",
+    "PHASE", "PHONE", "PHOTO", "PIECE", "PILOT", "PITCH", "PLACE", "PLAIN", "PLANE", "PLANT",
+    "PLATE", "POINT", "POUND", "POWER", "PRESS", "PRICE", "PRIDE", "PRIME", "PRINT", "PRIOR",
+    "PRIZE", "PROOF", "PROUD", "PROVE", "QUEEN", "QUICK", "QUIET", "QUITE", "RADIO", "RAISE",
+    "RANGE", "RAPID", "RATIO", "REACH", "READY", "REFER", "RIGHT", "RIVAL", "RIVER", "ROBIN",
+    "ROCKY", "ROMAN", "ROUGH", "ROUND", "ROUTE", "ROYAL", "RURAL", "SCALE", "SCENE", "SCOPE",
+    "SCORE", "SENSE", "SERVE", "SEVEN", "SHALL", "SHAPE", "SHARE", "SHARP", "SHEET", "SHELF",
+    "SHELL", "SHIFT", "SHINE", "SHIRT", "SHOCK", "SHOOT", "SHORT", "SHOWN", "SIGHT", "SINCE",
+    "SIXTH", "SIXTY", "SIZED", "SKILL", "SLEEP", "SLIDE", "SMALL", "SMART", "SMILE", "SMITH",
+    "SMOKE", "SOLID", "SOLVE", "SORRY", "SOUND", "SOUTH", "SPACE", "SPARE", "SPEAK", "SPEED",
+    "SPEND", "SPENT", "SPLIT", "SPOKE", "SPORT", "STAFF", "STAGE", "STAKE", "STAND", "START",
+    "STATE", "STEAM", "STEEL", "STICK", "STILL", "STOCK", "STONE", "STOOD", "STORE", "STORM",
+    "STORY", "STRIP", "STUCK", "STUDY", "STUFF", "STYLE", "SUGAR", "SUITE", "SUPER", "SWEET",
+    "TABLE", "TAKEN", "TASTE", "TAXES", "TEACH", "TEETH", "TEXAS", "THANK", "THEFT", "THEIR",
+    "THEME", "THERE", "THESE", "THICK", "THING", "THINK", "THIRD", "THOSE", "THREE", "THREW",
+    "THROW", "TIGHT", "TIMES", "TITLE", "TODAY", "TOPIC", "TOTAL", "TOUCH", "TOUGH", "TOWER",
+    "TRACK", "TRADE", "TRAIN", "TREAT", "TREND", "TRIAL", "TRIBE", "TRICK", "TRIED", "TRIES",
+    "TROOP", "TRUCK", "TRULY", "TRUNK", "TRUST", "TRUTH", "TWICE", "UNDER", "UNDUE", "UNION",
+    "UNITY", "UNTIL", "UPPER", "UPSET", "URBAN", "USAGE", "USUAL", "VALID", "VALUE", "VIDEO",
+    "VIRUS", "VISIT", "VITAL", "VOCAL", "VOICE", "WASTE", "WATCH", "WATER", "WHEEL", "WHERE",
+    "WHICH", "WHILE", "WHITE", "WHOLE", "WHOSE", "WOMAN", "WOMEN", "WORLD", "WORRY", "WORSE",
+    "WORST", "WORTH", "WOULD", "WOUND", "WRITE", "WRONG", "WROTE", "YOUNG", "YOUTH",
+    "ABACK", "ABASE", "ABATE", "ABBEY", "ABBOT", "ABHOR", "ABIDE", "ABLED", "ABODE", "ABORT",
+    "ABOVE", "ABUSE", "ABYSS", "ACHED", "ACIDS", "ACING", "ACRES", "ACTED", "ACTOR", "ACUTE",
+    "ADAGE", "ADAPT", "ADDED", "ADDER", "ADEPT", "ADMIN", "ADMIT", "ADOBE", "ADOPT", "ADORE",
+    "ADORN", "ADULT", "AEGIS", "AFIRE", "AFOOT", "AFOUL", "AFTER", "AGAIN", "AGENT", "AGILE",
+    "AGING", "AGLOW", "AGONY", "AGREE", "AHEAD", "AIDED", "AIDER", "AIMED", "AIRER", "AISLE",
+    "ALARM", "ALBUM", "ALERT", "ALGAE", "ALIBI", "ALIEN", "ALIGN", "ALIKE", "ALIVE", "ALLAY",
+    "ALLEY", "ALLOT", "ALLOW", "ALLOY", "ALOFT", "ALONE", "ALONG", "ALOOF", "ALOUD", "ALPHA",
+    "ALTAR", "ALTER", "AMBER", "AMBLE", "AMEND", "AMIGO", "AMISS", "AMONG", "AMPLE", "AMPLY",
+    "AMUSE", "ANGEL", "ANGER", "ANGLE", "ANGRY", "ANGST", "ANKLE", "ANNEX", "ANNOY", "ANNUL",
+    "ANTIC", "ANVIL", "AORTA", "APART", "APHID", "APPLE", "APPLY", "APRON", "ARBOR", "ARDOR",
+    "ARENA", "ARGUE", "ARISE", "ARMOR", "AROMA", "AROSE", "ARRAY", "ARROW", "ARSON", "ARTSY",
+    "ASHEN", "ASHES", "ASIDE", "ASKED", "ASPEN", "ASSAY", "ASSET", "ATOLL", "ATONE", "ATTIC",
+    "AUDIO", "AUDIT", "AUGUR", "AUNTY", "AVAIL", "AVERT", "AVOID", "AWAIT", "AWAKE", "AWARD",
+    "AWARE", "AWASH", "AWFUL", "AWOKE", "AXIAL", "AXIOM", "AZURE", "BADGE", "BADLY", "BAGEL",
+    "BALMY", "BANAL", "BANJO", "BARGE", "BARON", "BASAL", "BASIC", "BASIL", "BASIN", "BATCH",
+    "BATHE", "BATON", "BATTY", "BAYOU", "BEACH", "BEARD", "BEAST", "BEGAN", "BEGIN", "BEGUN",
+    "BEING", "BELCH", "BELLE", "BELLY", "BELOW", "BENCH", "BERRY", "BERTH", "BESET", "BEVEL",
+    "BIDDY", "BIGHT", "BIJOU", "BIKINI", "BILLY", "BINGE", "BINGO", "BIOME", "BIRCH", "BIRTH",
+    "BISON", "BLACK", "BLADE", "BLAME", "BLAND", "BLANK", "BLARE", "BLAST", "BLAZE", "BLEAK",
+    "BLEAT", "BLEED", "BLEND", "BLESS", "BLIMP", "BLIND", "BLINK", "BLISS", "BLITZ", "BLOAT",
+    "BLOCK", "BLOKE", "BLOND", "BLOOD", "BLOOM", "BLOWN", "BLUES", "BLUFF", "BLUNT", "BLURB",
+    "BLURT", "BLUSH", "BOARD", "BOAST", "BOGEY", "BOGUS", "BOILS", "BOLTS", "BOMBS", "BONDS",
+    "BONED", "BONES", "BONUS", "BOOBY", "BOOKS", "BOOST", "BOOTH", "BOOTS", "BOOZE", "BORAX",
+    "BORED", "BOUND", "BOWEL", "BOXER", "BRACE", "BRAID", "BRAIN", "BRAKE", "BRAND", "BRASH",
+    "BRASS", "BRAVE", "BRAVO", "BRAWL", "BRAWN", "BREAD", "BREAK", "BREED", "BRIAR", "BRIBE",
+    "BRICK", "BRIDE", "BRIEF", "BRINE", "BRING", "BRINK", "BRINY", "BRISK", "BROAD", "BROIL",
+    "BROKE", "BROOD", "BROOK", "BROOM", "BROTH", "BROWN", "BRUNT", "BRUSH", "BRUTE", "BUDDY",
+    "BUDGE", "BUGGY", "BUILD", "BUILT", "BULGE", "BULKY", "BULLY", "BUNCH", "BUNNY", "BURLY",
+    "BURNS", "BURNT", "BURST", "BUSHY", "BUTCH", "BUYER", "BYLAW", "CABIN", "CABLE", "CACHE",
+    "CADET", "CADRE", "CAMEL", "CAMEO", "CANAL", "CANDY", "CANNY", "CANOE", "CANON", "CAPER",
+    "CARAT", "CARGO", "CAROL", "CARRY", "CARVE", "CASTE", "CATCH", "CATER", "CATTY", "CAUSE",
+    "CAVIL", "CEASE", "CEDAR", "CHAIN", "CHAIR", "CHALK", "CHAMP", "CHANT", "CHAOS", "CHARD",
+    "CHARM", "CHART", "CHASE", "CHASM", "CHEAP", "CHEAT", "CHECK", "CHEEK", "CHEER", "CHESS",
+    "CHEST", "CHICK", "CHIEF", "CHILD", "CHILI", "CHILL", "CHIME", "CHIMP", "CHINA", "CHIRP",
+    "CHIVE", "CHOCK", "CHOIR", "CHOKE", "CHORD", "CHORE", "CHOSE", "CHUCK", "CHUMP", "CHUNK",
+    "CHURN", "CHUTE", "CIDER", "CIGAR", "CINCH", "CIRCA", "CIVIC", "CIVIL", "CLACK", "CLAIM",
+    "CLAMP", "CLANG", "CLANK", "CLASH", "CLASP", "CLASS", "CLEAN", "CLEAR", "CLEAT", "CLEFT",
+    "CLERK", "CLICK", "CLIFF", "CLIMB", "CLING", "CLOAK", "CLOCK", "CLONE", "CLOSE", "CLOTH",
+    "CLOUD", "CLOUT", "CLOVE", "CLOWN", "CLUBS", "CLUCK", "CLUMP", "CLUNG", "COACH", "COAST",
+    "COBRA", "COCOA", "COLON", "COLOR", "COMET", "COMIC", "COMMA", "CONCH", "CORAL", "CORNY",
+    "COUCH", "COUGH", "COULD", "COUNT", "COUPE", "COURT", "COVEN", "COVER", "COVET", "COWER",
+    "COYLY", "CRACK", "CRAFT", "CRAMP", "CRANE", "CRANK", "CRASH", "CRASS", "CRATE", "CRAVE",
+    "CRAWL", "CRAZE", "CRAZY", "CREAK", "CREAM", "CREED", "CREEK", "CREEP", "CREME", "CREPE",
+    "CREPT", "CRESS", "CREST", "CRICK", "CRIED", "CRIER", "CRIES", "CRIME", "CRIMP", "CRISP",
+    "CROAK", "CROCK", "CRONY", "CROOK", "CROSS", "CROUCH", "CROWD", "CROWN", "CRUDE", "CRUEL",
+    "CRUMB", "CRUSH", "CRUST", "CRYPT", "CUBIC", "CUMIN", "CUPID", "CURLY", "CURRY", "CURSE",
+    "CURVE", "CURVY", "CUTIE", "CYBER", "CYCLE", "CYNIC", "DADDY", "DAILY", "DAIRY", "DAISY",
+    "DALLY", "DANCE", "DANDY", "DATUM", "DAUNT", "DEALT", "DEATH", "DEBAR", "DEBIT", "DEBUG",
+    "DEBUT", "DECAF", "DECAY", "DECOR", "DECOY", "DECRY", "DEFER", "DEITY", "DELAY", "DELTA",
+    "DELVE", "DEMON", "DEMUR", "DENIM", "DENSE", "DEPOT", "DEPTH", "DERBY", "DETER", "DETOX",
+    "DEUCE", "DEVIL", "DIARY", "DICEY", "DIGIT", "DIMLY", "DINER", "DINGO", "DINGY", "DIRTY",
+    "DISCO", "DITCH", "DITTO", "DITTY", "DIVAN", "DIVER", "DIZZY", "DODGE", "DODGY", "DOGMA",
+    "DOING", "DOLLY", "DONOR", "DONUT", "DOPEY", "DOUBT", "DOUGH", "DOWDY", "DOWEL", "DOWNY",
+    "DOWRY", "DOYEN", "DOZEN", "DRAFT", "DRAIN", "DRAKE", "DRAMA", "DRANK", "DRAPE", "DRAWL",
+    "DRAWN", "DREAD", "DREAM", "DREARY", "DRECK", "DRESS", "DRIED", "DRIER", "DRIFT", "DRILL",
+    "DRINK", "DRIVE", "DROIT", "DROLL", "DRONE", "DROOL", "DROOP", "DROSS", "DROVE", "DROWN",
+    "DRUGS", "DRUMS", "DRUNK", "DRYER", "DRYLY", "DUCHY", "DUCKY", "DUELS", "DUET", "DUMMY",
+    "DUMPS", "DUMPY", "DUNCE", "DUNES", "DUSKY", "DUSTY", "DUTCH", "DUVET", "DWARF", "DWELL",
+    "DWELT", "DYING", "EAGER", "EAGLE", "EARLY", "EARTH", "EASEL", "EATEN", "EATER", "EBONY",
+    "ECLAT", "EDICT", "EDIFY", "EERIE", "EGGED", "EGRET", "EIGHT", "EJECT", "EKING", "ELATE",
+    "ELBOW", "ELDER", "ELECT", "ELEGY", "ELFIN", "ELIDE", "ELITE", "ELOPE", "ELUDE", "ELVES",
+    "EMAIL", "EMBED", "EMBER", "EMCEE", "EMOTE", "EMPTY", "ENACT", "ENDOW", "ENEMA", "ENEMY",
+    "ENJOY", "ENNUI", "ENSUE", "ENTER", "ENTRY", "ENVOY", "EPOXY", "EQUAL", "EQUIP", "ERASE",
+    "ERECT", "ERODE", "ERROR", "ERUPT", "ESSAY", "ESTER", "ETHER", "ETHIC", "ETHOS", "EVADE",
+    "EVICT", "EVOKE", "EXACT", "EXALT", "EXCEL", "EXERT", "EXILE", "EXIST", "EXPAT", "EXTOL",
+    "EXULT", "EYING", "FABLE", "FACET", "FAINT", "FAIRY", "FAITH", "FAKER", "FALLS", "FALSE",
+    "FANCY", "FANNY", "FARCE", "FATAL", "FATTY", "FAULT", "FAUNA", "FAVOR", "FEAST", "FECAL",
+    "FEIGN", "FELLA", "FELON", "FEMME", "FEMUR", "FENCE", "FERAL", "FERRY", "FETAL", "FETCH",
+    "FETID", "FETUS", "FEVER", "FEWER", "FIBER", "FICUS", "FIEND", "FIERY", "FIFTH", "FIFTY",
+    "FIGHT", "FILCH", "FILER", "FILET", "FILLY", "FILMY", "FILTH", "FINAL", "FINCH", "FINER",
+    "FIRED", "FIRMS", "FIRST", "FISHY", "FIXER", "FIZZY", "FJORD", "FLACK", "FLAIL", "FLAIR",
+    "FLAKE", "FLAKY", "FLAME", "FLANK", "FLARE", "FLASH", "FLASK", "FLATS", "FLECK", "FLEET",
+    "FLESH", "FLICK", "FLIER", "FLING", "FLINT", "FLIRT", "FLOAT", "FLOCK", "FLOOD", "FLOOR",
+    "FLORA", "FLOSS", "FLOUR", "FLOUT", "FLOWN", "FLUFF", "FLUID", "FLUKE", "FLUNG", "FLUNK",
+    "FLUSH", "FLUTE", "FOAMY", "FOCAL", "FOCUS", "FOGGY", "FOILS", "FOIST", "FOLIO", "FOLKS",
+    "FOLLY", "FONTS", "FORAY", "FORCE", "FORGE", "FORGO", "FORMS", "FORTE", "FORTH", "FORTY",
+    "FORUM", "FOUND", "FOYER", "FRAIL", "FRAME", "FRANK", "FRAUD", "FREAK", "FREED", "FRESH",
+    "FRIAR", "FRIED", "FRILL", "FRISK", "FROCK", "FROGS", "FRONT", "FROST", "FROWN", "FROZE",
+    "FRUIT", "FULLY", "FUMED", "FUNDS", "FUNGI", "FUNKY", "FUNNY", "FURRY", "FUSSY", "FUZZY",
+    "GAILY", "GAINS", "GAMER", "GAMES", "GAMMA", "GAMUT", "GASSY", "GAUGE", "GAUNT", "GAUZE",
+    "GAVEL", "GAWKY", "GAZER", "GEARS", "GECKO", "GEESE", "GENES", "GENIE", "GENRE", "GENUS",
+    "GHOST", "GHOUL", "GIANT", "GIDDY", "GIFTS", "GILDS", "GIRLS", "GIRTH", "GIVEN", "GIVER",
+    "GIVES", "GIZMO", "GLADE", "GLAND", "GLARE", "GLASS", "GLAZE", "GLEAM", "GLEAN", "GLIDE",
+    "GLINT", "GLOAT", "GLOBE", "GLOOM", "GLORY", "GLOSS", "GLOVE", "GLOWS", "GLUEY", "GLYPH",
+    "GNARL", "GNASH", "GNOME", "GODLY", "GOING", "GOLLY", "GONNA", "GOODS", "GOOEY", "GOOFY",
+    "GOOSE", "GORGE", "GOUGE", "GOURD", "GRACE", "GRADE", "GRAIN", "GRAND", "GRANT", "GRAPH",
+    "GRASP", "GRASS", "GRATE", "GRAVE", "GRAVY", "GRAZE", "GREAT", "GREED", "GREEK", "GREEN",
+    "GREET", "GRIEF", "GRILL", "GRIME", "GRIMY", "GRIND", "GRIPE", "GROAN", "GROIN", "GROOM",
+    "GROPE", "GROSS", "GROUP", "GROVE", "GROWL", "GROWN", "GRUEL", "GRUFF", "GRUNT", "GUARD",
+    "GUAVA", "GUESS", "GUEST", "GUIDE", "GUILD", "GUILE", "GUILT", "GUISE", "GULCH", "GULLY",
+    "GUMBO", "GUMMY", "GUSTY", "HABIT", "HAIRY", "HALVE", "HANDY", "HAPPY", "HARDY", "HASTE",
+    "HASTY", "HATCH", "HATER", "HAUNT", "HAVEN", "HAVOC", "HAZEL", "HEADS", "HEADY", "HEARD",
+    "HEART", "HEATH", "HEAVE", "HEAVY", "HEDGE", "HEFTY", "HEIRS", "HEIST", "HELIX", "HELLO",
+    "HELPS", "HENCE", "HENRY", "HERON", "HILLY", "HINGE", "HINTS", "HIPPO", "HIPPY", "HITCH",
+    "HOARD", "HOARY", "HOBBY", "HOIST", "HOLES", "HOLEY", "HOLLY", "HOMER", "HOMES", "HONEY",
+    "HONOR", "HOPED", "HOPES", "HORNY", "HORSE", "HOTEL", "HOTLY", "HOUND", "HOUSE", "HOVEL",
+    "HOVER", "HOWDY", "HUFFY", "HUMAN", "HUMID", "HUMOR", "HUMPH", "HUMUS", "HUNCH", "HUNKY",
+    "HURRY", "HUSKY", "HUSSY", "HUTCH", "HYDRO", "HYENA", "HYMEN", "HYPER", "ICHOR", "ICING",
+    "ICONS", "IDEAL", "IDEAS", "IDIOM", "IDIOT", "IDLER", "IDOLS", "IGLOO", "ILEUM", "IMAGE",
+    "IMBUE", "IMPEL", "IMPLY", "INBOX", "INCUR", "INEPT", "INERT", "INFER", "INGOT", "INLAY",
+    "INLET", "INNER", "INPUT", "INTER", "INTRO", "IONIC", "IRATE", "IRKED", "IRONS", "IRONY",
+    "ISLES", "ISLET", "ISSUE", "ITCHY", "ITEMS", "IVORY", "JABOT", "JAUNT", "JAZZY", "JEANS",
+    "JELLY", "JENNY", "JERKY", "JETTY", "JEWEL", "JIFFY", "JOINT", "JOKER", "JOLLY", "JOUST",
+    "JUDGE", "JUICE", "JUICY", "JUMBO", "JUMPY", "JUNTA", "JUROR", "KAPPA", "KARMA", "KAYAK",
+    "KEBAB", "KHAKI", "KIOSK", "KITTY", "KLUTZ", "KNACK", "KNAVE", "KNEAD", "KNEEL", "KNELT",
+    "KNIFE", "KNOCK", "KNOLL", "KNOWN", "KNOWS", "KOALA", "KOOKY", "KUDOS", "LABEL", "LABOR",
+    "LACED", "LADEN", "LADLE", "LAGER", "LANCE", "LANDS", "LANES", "LANKY", "LAPEL", "LAPSE",
+    "LARGE", "LARGO", "LASSO", "LATCH", "LATER", "LATHE", "LATTE", "LAUGH", "LAYER", "LAYUP",
+    "LEACH", "LEAFY", "LEAKY", "LEANT", "LEAPT", "LEARN", "LEASE", "LEASH", "LEAST", "LEAVE",
+    "LEDGE", "LEECH", "LEEKS", "LEERY", "LEFTY", "LEGAL", "LEGGY", "LEMON", "LEMUR", "LEPER",
+    "LETUP", "LEVEE", "LEVER", "LEXIS", "LIBEL", "LIFER", "LIGHT", "LIKEN", "LILAC", "LIMBO",
+    "LIMIT", "LINEN", "LINER", "LINGO", "LINKS", "LIONS", "LIPID", "LITER", "LITHE", "LIVER",
+    "LIVID", "LLAMA", "LOADS", "LOAMY", "LOANS", "LOATH", "LOBBY", "LOCAL", "LOCKS", "LOCUS",
+    "LODGE", "LOFTY", "LOGIC", "LOGIN", "LOGOS", "LOINS", "LONER", "LOOPS", "LOOPY", "LOOSE",
+    "LORDY", "LOSER", "LOSES", "LOTTE", "LOTTO", "LOTUS", "LOUGH", "LOUSE", "LOUSY", "LOVED",
+    "LOVER", "LOVES", "LOWER", "LOWLY", "LOYAL", "LUCID", "LUCKY", "LUMPY", "LUNAR", "LUNCH",
+    "LUNGE", "LURCH", "LURED", "LURKS", "LUSTY", "LYING", "LYMPH", "LYNCH", "LYRIC", "MACHO",
+    "MACRO", "MADAM", "MADLY", "MAFIA", "MAGIC", "MAGMA", "MAIZE", "MAJOR", "MAKER", "MAKES",
+    "MALES", "MALLS", "MALTY", "MAMAS", "MAMBO", "MAMMA", "MANGO", "MANIA", "MANIC", "MANOR",
+    "MAPLE", "MARCH", "MARRY", "MARSH", "MASON", "MATCH", "MATED", "MATER", "MATES", "MATHS",
+    "MATTE", "MAUVE", "MAXIM", "MAYBE", "MAYOR", "MAZES", "MEALY", "MEANS", "MEATY", "MECCA",
+    "MEDAL", "MEDIA", "MEDIC", "MELEE", "MELON", "MENUS", "MERCY", "MERGE", "MERIT", "MERRY",
+    "MESSY", "METAL", "METER", "METRO", "MICRO", "MIDGE", "MIDST", "MIGHT", "MILKY", "MILLS",
+    "MIMIC", "MINCE", "MINDS", "MINED", "MINER", "MINES", "MINIM", "MINOR", "MINTY", "MINUS",
+    "MIRTH", "MISER", "MISTY", "MITES", "MIXED", "MIXER", "MIXES", "MOANS", "MOATS", "MOBIL",
+    "MODEL", "MODEM", "MODES", "MOGUL", "MOIST", "MOLDY", "MOLES", "MONEY", "MONKS", "MONTH",
+    "MOODS", "MOODY", "MOONS", "MOOSE", "MORAL", "MORON", "MORPH", "MORSE", "MOSSY", "MOTEL",
+    "MOTIF", "MOTOR", "MOTTO", "MOULD", "MOULT", "MOUND", "MOUNT", "MOURN", "MOUSE", "MOUSY",
+    "MOUTH", "MOVED", "MOVER", "MOVES", "MOVIE", "MOWER", "MUCKS", "MUCKY", "MUCUS", "MUDDY",
+    "MULCH", "MUMMY", "MUNCH", "MURAL", "MURKY", "MUSHY", "MUSIC", "MUSKY", "MUSTY", "MUTED",
+    "MUTES", "MYRRH", "MYTHS", "NACHO", "NAIVE", "NAKED", "NAMED", "NAMES", "NANNY", "NAPES",
+    "NAPPY", "NASAL", "NASTY", "NATAL", "NAVAL", "NAVEL", "NEARS", "NEATO", "NECKS", "NEEDS",
+    "NEEDY", "NEIGH", "NERDS", "NERDY", "NERVE", "NERVY", "NEVER", "NEWER", "NEWLY", "NICHE",
+    "NIFTY", "NIGHT", "NINJA", "NINNY", "NINTH", "NOBLE", "NOBLY", "NODES", "NOISE", "NOISY",
+    "NOMAD", "NONCE", "NOOKS", "NOONS", "NOOSE", "NORMS", "NORTH", "NOSED", "NOSES", "NOSEY",
+    "NOTCH", "NOTED", "NOTES", "NOVEL", "NUDGE", "NUKED", "NUKES", "NULLS", "NUMB", "NURSE",
+    "NUTTY", "NYLON", "NYMPH", "OAKEN", "OARED", "OASIS", "OATHS", "OBESE", "OBEYS", "OCCUR",
+    "OCEAN", "OCTET", "ODDER", "ODDLY", "ODORS", "OFFAL", "OFFER", "OFTEN", "OGLED", "OGLES",
+    "OILED", "OILER", "OKAPI", "OKAYS", "OLDEN", "OLDER", "OLDIE", "OLIVE", "OMEGA", "OMENS",
+    "OMITS", "ONION", "ONSET", "OOHED", "OOMPH", "OOZED", "OOZES", "OPALS", "OPENS", "OPERA",
+    "OPINE", "OPIUM", "OPTED", "OPTIC", "ORBIT", "ORCAS", "ORDER", "ORGAN", "OTHER", "OTTER",
+    "OUGHT", "OUNCE", "OUTDO", "OUTER", "OUTGO", "OVARY", "OVATE", "OVENS", "OVERT", "OVINE",
+    "OWING", "OWLET", "OWNED", "OWNER", "OXIDE", "OZONE", "PACED", "PACER", "PACES", "PACKS",
+    "PACTS", "PADDY", "PAGAN", "PAGED", "PAGER", "PAGES", "PAILS", "PAINS", "PAINT", "PAIRS",
+    "PALMS", "PALSY", "PAMPA", "PANDA", "PANEL", "PANIC", "PANSY", "PANTS", "PAPAL", "PAPAW",
+    "PAPER", "PARCH", "PARED", "PARER", "PARES", "PARKA", "PARKS", "PARRY", "PARSE", "PARTS",
+    "PARTY", "PASSE", "PASTA", "PASTE", "PASTY", "PATCH", "PATEN", "PATER", "PATHS", "PATIO",
+    "PATSY", "PATTY", "PAUSE", "PAVED", "PAVER", "PAVES", "PAWED", "PAWNS", "PAYEE", "PAYER",
+    "PEACE", "PEACH", "PEAKS", "PEAKY", "PEARL", "PEARS", "PECAN", "PECKS", "PEDAL", "PEEKS",
+    "PEELS", "PEEPS", "PEERS", "PEEVE", "PENAL", "PENCE", "PENIS", "PENNY", "PERCH", "PERKS",
+    "PERKY", "PERMS", "PESOS", "PESTS", "PETAL", "PETTY", "PHASE", "PHONE", "PHONY", "PHOTO",
+    "PIANO", "PICKS", "PICKY", "PIECE", "PIERS", "PIETY", "PIGGY", "PILES", "PILLS", "PILOT",
+    "PINCH", "PINED", "PINES", "PINGS", "PINKO", "PINKS", "PINKY", "PINTO", "PINTS", "PIPER",
+    "PIPES", "PIQUE", "PITCH", "PITHY", "PIVOT", "PIXEL", "PIXIE", "PIZZA", "PLACE", "PLAID",
+    "PLAIN", "PLAIT", "PLANE", "PLANK", "PLANS", "PLANT", "PLATE", "PLATS", "PLAYS", "PLAZA",
+    "PLEAD", "PLEAS", "PLEAT", "PLIED", "PLIES", "PLINK", "PLODS", "PLOPS", "PLOTS", "PLOWS",
+    "PLOYS", "PLUCK", "PLUGS", "PLUMB", "PLUME", "PLUMP", "PLUMS", "PLUNG", "PLUNK", "PLUSH",
+    "PLUTO", "POACH", "POCKS", "PODGY", "POEMS", "POESY", "POETS", "POINT", "POISE", "POKED",
+    "POKER", "POKES", "POLAR", "POLED", "POLES", "POLIO", "POLLS", "POLYP", "PONDS", "PONES",
+    "PONIES", "POOCH", "POOLS", "POOPS", "POPES", "POPPY", "POPUP", "PORCH", "PORED", "PORES",
+    "PORGY", "PORKS", "PORKY", "PORTS", "POSED", "POSER", "POSES", "POSIT", "POSSE", "POSTS",
+    "POTTY", "POUCH", "POUND", "POURS", "POUTS", "POWER", "PRANK", "PRATE", "PRAWN", "PRAYS",
+    "PREEN", "PREPS", "PRESS", "PREYS", "PRICE", "PRICK", "PRIDE", "PRIED", "PRIER", "PRIES",
+    "PRIMA", "PRIME", "PRIMO", "PRIMP", "PRINT", "PRIOR", "PRISM", "PRIVY", "PRIZE", "PROBE",
+    "PRODS", "PROFS", "PROMO", "PRONE", "PRONG", "PROOF", "PROPS", "PROSE", "PROSY", "PROUD",
+    "PROVE", "PROWL", "PROXY", "PRUDE", "PRUNE", "PSALM", "PSYCH", "PUBIC", "PUCKA", "PUDGY",
+    "PUFFS", "PUFFY", "PULLS", "PULPS", "PULPY", "PULSE", "PUMPS", "PUNCH", "PUNKS", "PUNNY",
+    "PUPIL", "PUPPY", "PUREE", "PURER", "PURGE", "PURRS", "PURSE", "PUSHY", "PUSSY", "PUTTY",
+    "PYGMY", "PYLON", "QUACK", "QUADS", "QUAFF", "QUAIL", "QUAKE", "QUALM", "QUART", "QUASH",
+    "QUASI", "QUEEN", "QUEER", "QUELL", "QUERY", "QUEST", "QUEUE", "QUICK", "QUIET", "QUIFF",
+    "QUILT", "QUIPS", "QUIRK", "QUITE", "QUITS", "QUOTA", "QUOTE", "QUOTH", "RABID", "RACED",
+    "RACER", "RACES", "RACKS", "RADAR", "RADII", "RADIO", "RADON", "RAFTS", "RAGED", "RAGES",
+    "RAGGED", "RAIDS", "RAILS", "RAINS", "RAINY", "RAISE", "RAJAH", "RAKED", "RAKER", "RAKES",
+    "RALLY", "RALPH", "RAMPS", "RANCH", "RANDY", "RANGE", "RANGY", "RANKS", "RANTS", "RAPED",
+    "RAPER", "RAPES", "RAPID", "RARER", "RASED", "RASES", "RASPS", "RASPY", "RATED", "RATES",
+    "RATIO", "RATTY", "RAVED", "RAVEL", "RAVEN", "RAVER", "RAVES", "RAYON", "RAZED", "RAZER",
+    "RAZES", "RAZOR", "REACH", "REACT", "READS", "READY", "REALM", "REAMS", "REAPS", "REARS",
+    "REBEL", "REBUT", "RECAP", "RECUR", "RECUT", "REEDY", "REEFS", "REEKS", "REELS", "REFER",
+    "REFIT", "REGAL", "REHAB", "REIGN", "REINS", "RELAX", "RELAY", "RELIC", "REMIT", "RENAL",
+    "RENEW", "RENTS", "REPAY", "REPEL", "REPLY", "REPOS", "RESET", "RESIN", "RESTS", "RETCH",
+    "RETRO", "RETRY", "REUSE", "REVED", "REVEL", "REVS", "RHINO", "RHYME", "RICED", "RICES",
+    "RICHER", "RICKY", "RIDER", "RIDES", "RIDGE", "RIDGY", "RIFLE", "RIFTS", "RIGHT", "RIGID",
+    "RIGOR", "RILED", "RILES", "RILLS", "RINDS", "RINGS", "RINKS", "RINSE", "RIOTS", "RIPEN",
+    "RIPER", "RISEN", "RISER", "RISES", "RISKS", "RISKY", "RITES", "RITZY", "RIVAL", "RIVED",
+    "RIVEN", "RIVER", "RIVET", "ROACH", "ROADS", "ROAMS", "ROANS", "ROARS", "ROAST", "ROBED",
+    "ROBES", "ROBIN", "ROBOT", "ROCKS", "ROCKY", "RODEO", "ROGER", "ROGUE", "ROILS", "ROLES",
+    "ROLLS", "ROMAN", "ROMPS", "ROOFS", "ROOKS", "ROOMS", "ROOMY", "ROOST", "ROOTS", "ROPED",
+    "ROPER", "ROPES", "ROSES", "ROSIN", "ROTAS", "ROTOR", "ROUGE", "ROUGH", "ROUND", "ROUPS",
+    "ROUSE", "ROUST", "ROUTE", "ROUTS", "ROVED", "ROVER", "ROVES", "ROWAN", "ROWDY", "ROWED",
+    "ROWER", "ROYAL", "RUBLE", "RUDDY", "RUDER", "RUFFS", "RUGBY", "RUINS", "RULED", "RULER",
+    "RULES", "RUMBA", "RUMOR", "RUMPS", "RUNIC", "RUNNY", "RUNTS", "RUPEE", "RURAL", "RUSES",
+    "RUSHS", "RUSHY", "RUSTS", "RUSTY", "RUTTY", "SABRE", "SACKS", "SADLY", "SAFER", "SAFES",
+    "SAGAS", "SAGER", "SAGES", "SAGGY", "SAHIB", "SAILS", "SAINT", "SAITH", "SAKES", "SALAD",
+    "SALEM", "SALES", "SALLY", "SALON", "SALSA", "SALTS", "SALTY", "SALVE", "SALVO", "SAMBA",
+    "SANDS", "SANDY", "SANER", "SANGS", "SAPPY", "SARGE", "SARIS", "SASSY", "SATAN", "SATED",
+    "SATES", "SATIN", "SATYR", "SAUCE", "SAUCY", "SAUNA", "SAUTE", "SAVED", "SAVER", "SAVES",
+    "SAVOR", "SAVOY", "SAVVY", "SAWED", "SAYER", "SAYSO", "SCABS", "SCADS", "SCALD", "SCALE",
+    "SCALP", "SCALY", "SCAMP", "SCAMS", "SCANS", "SCANT", "SCARE", "SCARF", "SCARP", "SCARY",
+    "SCENE", "SCENT", "SCHMO", "SCHWA", "SCION", "SCOFF", "SCOLD", "SCONE", "SCOOP", "SCOOT",
+    "SCOPE", "SCORE", "SCORN", "SCOTS", "SCOUR", "SCOUT", "SCOWL", "SCRAM", "SCRAP", "SCREE",
+    "SCREW", "SCRIP", "SCRUB", "SCRUM", "SCUBA", "SCUDS", "SCUFF", "SCULL", "SCUMS", "SEALS",
+    "SEAMS", "SEAMY", "SEARS", "SEATS", "SEBUM", "SECTS", "SEDAN", "SEDGE", "SEEDY", "SEEKS",
+    "SEEMS", "SEEPS", "SEERS", "SEGUE", "SEIZE", "SELLS", "SEMEN", "SEMIS", "SENDS", "SENOR",
+    "SENSE", "SEPAL", "SEPIA", "SEPOY", "SEPTA", "SERF", "SERIF", "SERUM", "SERVE", "SETUP",
+    "SEVEN", "SEVER", "SEWED", "SEWER", "SEXED", "SEXES", "SHACK", "SHADE", "SHADY", "SHAFT",
+    "SHAKE", "SHAKY", "SHALE", "SHALL", "SHALT", "SHAME", "SHAMS", "SHANK", "SHAPE", "SHARD",
+    "SHARE", "SHARK", "SHARP", "SHAVE", "SHAWL", "SHEAF", "SHEAR", "SHEDS", "SHEEN", "SHEEP",
+    "SHEER", "SHEET", "SHEIK", "SHELF", "SHELL", "SHERD", "SHIED", "SHIES", "SHIFT", "SHILL",
+    "SHIMS", "SHINE", "SHINS", "SHINY", "SHIPS", "SHIRE", "SHIRK", "SHIRT", "SHITS", "SHIVA",
+    "SHOAL", "SHOCK", "SHOED", "SHOER", "SHOES", "SHONE", "SHOOK", "SHOOT", "SHOPS", "SHORE",
+    "SHORN", "SHORT", "SHOTS", "SHOUT", "SHOVE", "SHOWN", "SHOWS", "SHOWY", "SHRED", "SHREW",
+    "SHRUB", "SHRUG", "SHUCK", "SHUNS", "SHUNT", "SHUSH", "SHUTS", "SHYER", "SHYLY", "SICKO",
+    "SICKS", "SIDED", "SIDES", "SIDLE", "SIEGE", "SIEVE", "SIFTS", "SIGHS", "SIGHT", "SIGMA",
+    "SIGNS", "SILKS", "SILKY", "SILLS", "SILLY", "SILOS", "SILTS", "SILTY", "SINCE", "SINES",
+    "SINEW", "SINGE", "SINGS", "SINKS", "SINUS", "SIRED", "SIREN", "SIRES", "SIRUP", "SISAL",
+    "SISSY", "SITAR", "SITED", "SITES", "SITUS", "SIXES", "SIXTH", "SIXTY", "SIZED", "SIZER",
+    "SIZES", "SKATE", "SKEIN", "SKEWS", "SKIDS", "SKIED", "SKIER", "SKIES", "SKIFF", "SKILL",
+    "SKIMP", "SKIMS", "SKINK", "SKINS", "SKIPS", "SKIRT", "SKITS", "SKULK", "SKULL", "SKUNK",
+    "SLABS", "SLACK", "SLAGS", "SLAIN", "SLAKE", "SLAMS", "SLANG", "SLANT", "SLAPS", "SLASH",
+    "SLATE", "SLATS", "SLAVE", "SLAYS", "SLEDS", "SLEEK", "SLEEP", "SLEET", "SLEPT", "SLEWS",
+    "SLICE", "SLICK", "SLIDE", "SLIER", "SLILY", "SLIME", "SLIMS", "SLIMY", "SLING", "SLINK",
+    "SLIPS", "SLITS", "SLOBS", "SLOES", "SLOGS", "SLOOP", "SLOPE", "SLOPS", "SLOSH", "SLOTH",
+    "SLOTS", "SLOWS", "SLUDGE", "SLUED", "SLUES", "SLUGS", "SLUMP", "SLUMS", "SLUNG", "SLUNK",
+    "SLURP", "SLURS", "SLUSH", "SLUTS", "SMALL", "SMART", "SMASH", "SMEAR", "SMELL", "SMELT",
+    "SMILE", "SMIRK", "SMITE", "SMITH", "SMOCK", "SMOKE", "SMOKY", "SMOTE", "SNACK", "SNAFU",
+    "SNAGS", "SNAIL", "SNAKE", "SNAKY", "SNAPS", "SNARE", "SNARL", "SNEAK", "SNEER", "SNIDE",
+    "SNIFF", "SNIPS", "SNITS", "SNOBS", "SNOOP", "SNOOT", "SNORE", "SNORT", "SNOTS", "SNOUT",
+    "SNOWS", "SNOWY", "SNUBS", "SNUCK", "SNUFF", "SNUGS", "SOAPS", "SOAPY", "SOARS", "SOBER",
+    "SOCKS", "SODAS", "SODDY", "SOFAS", "SOFTY", "SOGGY", "SOILS", "SOLAR", "SOLED", "SOLES",
+    "SOLID", "SOLON", "SOLOS", "SOLVE", "SONAR", "SONGS", "SONIC", "SONNY", "SOOTH", "SOOTY",
+    "SOPHS", "SOREL", "SORER", "SORES", "SORRY", "SORTS", "SOUGH", "SOULS", "SOUND", "SOUPS",
+    "SOUPY", "SOURS", "SOUSE", "SOUTH", "SOWED", "SOWER", "SPACE", "SPADE", "SPANK", "SPARE",
+    "SPARK", "SPARS", "SPASM", "SPATE", "SPAWN", "SPEAK", "SPEAR", "SPECS", "SPEED", "SPELL",
+    "SPEND", "SPENT", "SPERM", "SPICE", "SPICY", "SPIED", "SPIEL", "SPIES", "SPIKE", "SPIKY",
+    "SPILL", "SPILT", "SPINE", "SPINY", "SPIRE", "SPITE", "SPITZ", "SPLAT", "SPLIT", "SPOIL",
+    "SPOKE", "SPOOF", "SPOOK", "SPOOL", "SPOON", "SPORE", "SPORT", "SPOTS", "SPOUT", "SPRAY",
+    "SPREE", "SPRIG", "SPRIT", "SPROUT", "SPRUE", "SPUDS", "SPUNK", "SPURN", "SPURS", "SPURT",
+    "SQUAD", "SQUAT", "SQUIB", "SQUID", "STABS", "STACK", "STAFF", "STAGE", "STAGS", "STAID",
+    "STAIN", "STAIR", "STAKE", "STALE", "STALK", "STALL", "STAMP", "STAND", "STANK", "STARE",
+    "STARK", "STARS", "START", "STASH", "STATE", "STATS", "STAVE", "STAYS", "STEAD", "STEAK",
+    "STEAL", "STEAM", "STEED", "STEEL", "STEEP", "STEER", "STEIN", "STEMS", "STENO", "STEPS",
+    "STERN", "STEWS", "STICK", "STIFF", "STILL", "STILT", "STING", "STINK", "STINT", "STOCK",
+    "STOIC", "STOKE", "STOLE", "STOMP", "STONE", "STONY", "STOOD", "STOOL", "STOOP", "STOPS",
+    "STORE", "STORK", "STORM", "STORY", "STOUT", "STOVE", "STRAP", "STRAW", "STRAY", "STRIP",
+    "STROP", "STROVE", "STRUCK", "STRUM", "STRUT", "STUBS", "STUCK", "STUDS", "STUDY", "STUFF",
+    "STUMP", "STUNG", "STUNK", "STUNT", "STUPE", "STYLE", "SUAVE", "SUCKS", "SUDSY", "SUEDE",
+    "SUGAR", "SUING", "SUITE", "SUITS", "SULKS", "SULKY", "SULLY", "SUMAC", "SUMMON", "SUNNY",
+    "SUPER", "SURER", "SURGE", "SURLY", "SUSHI", "SWABS", "SWAGS", "SWAIN", "SWAMP", "SWANK",
+    "SWANS", "SWAPS", "SWARM", "SWASH", "SWATH", "SWATS", "SWAYS", "SWEAR", "SWEAT", "SWEDE",
+    "SWEEP", "SWEET", "SWELL", "SWEPT", "SWIFT", "SWIGS", "SWILL", "SWIMS", "SWINE", "SWING",
+    "SWIPE", "SWIRL", "SWISS", "SWOOP", "SWORD", "SWORE", "SWORN", "SWUNG", "SYNOD", "SYRUP",
+    "TABBY", "TABLE", "TABOO", "TACIT", "TACKY", "TACOS", "TAFFY", "TAILS", "TAINT", "TAKEN",
+    "TAKER", "TAKES", "TALES", "TALKS", "TALKY", "TALLY", "TALON", "TAMED", "TAMER", "TAMES",
+    "TANGO", "TANGY", "TANKS", "TANSY", "TANTO", "TAPED", "TAPER", "TAPES", "TAPIR", "TARDY",
+    "TARED", "TARES", "TAROT", "TARPS", "TARRY", "TARTS", "TARTY", "TASKS", "TASTE", "TASTY",
+    "TATTY", "TAUNT", "TAUPE", "TAWNY", "TAXED", "TAXES", "TAXIS", "TEACH", "TEAKS", "TEAMS",
+    "TEARS", "TEARY", "TEASE", "TEATS", "TEDDY", "TEENS", "TEENY", "TEETH", "TEMPO", "TEMPS",
+    "TEMPT", "TENET", "TENOR", "TENSE", "TENTH", "TENTS", "TEPEE", "TERMS", "TERRA", "TERRY",
+    "TERSE", "TESTS", "TESTY", "TEXAS", "TEXTS", "THANK", "THAW", "THEFT", "THEIR", "THEME",
+    "THENS", "THERE", "THESE", "THETA", "THICK", "THIEF", "THIGH", "THING", "THINK", "THIRD",
+    "THORN", "THOSE", "THREE", "THREW", "THROB", "THROE", "THROW", "THUGS", "THUMB", "THUMP",
+    "THUNK", "THYME", "TIARA", "TIBIA", "TICKS", "TIDAL", "TIDED", "TIDES", "TIERS", "TIGER",
+    "TIGHT", "TILDE", "TILED", "TILES", "TILLS", "TILTS", "TIMED", "TIMER", "TIMES", "TIMID",
+    "TINES", "TINGE", "TINTS", "TIPPY", "TIPS", "TIRED", "TIRES", "TITAN", "TITHE", "TITLE",
+    "TOAST", "TODAY", "TODDY", "TOGAS", "TOGETHER", "TOILS", "TOKED", "TOKEN", "TOKES", "TOKYO",
+    "TOLLS", "TOMBS", "TOMES", "TONAL", "TONED", "TONER", "TONES", "TONGS", "TONIC", "TONNE",
+    "TONUS", "TOOLS", "TOONS", "TOOTH", "TOOTS", "TOPAZ", "TOPIC", "TORCH", "TORIC", "TORSO",
+    "TORUS", "TOTAL", "TOTEM", "TOUCH", "TOUGH", "TOURS", "TOUTS", "TOWED", "TOWEL", "TOWER",
+    "TOWNS", "TOXIC", "TOXIN", "TRACE", "TRACK", "TRACT", "TRADE", "TRAIL", "TRAIN", "TRAIT",
+    "TRAMP", "TRAMS", "TRANS", "TRASH", "TRASK", "TRAWL", "TRAYS", "TREAD", "TREAT", "TREED",
+    "TREES", "TREKS", "TREND", "TRESS", "TRIAD", "TRIAL", "TRIBE", "TRICK", "TRIED", "TRIER",
+    "TRIES", "TRIKE", "TRILL", "TRIMS", "TRINE", "TRIOS", "TRIPE", "TRIPS", "TRITE", "TROD",
+    "TROLL", "TROMP", "TROOP", "TROPE", "TROTH", "TROTS", "TROUT", "TROVE", "TRUCE", "TRUCK",
+    "TRUED", "TRUER", "TRUES", "TRULY", "TRUMP", "TRUNK", "TRUSS", "TRUST", "TRUTH", "TRYST",
+    "TSARS", "TUBAS", "TUBBY", "TUBED", "TUBER", "TUBES", "TUCKS", "TUFTS", "TULIP", "TULLE",
+    "TUMBLE", "TUMOR", "TUNAS", "TUNED", "TUNER", "TUNES", "TUNIC", "TUNNY", "TURBO", "TURFS",
+    "TURNS", "TURPS", "TUSKS", "TUTOR", "TUTUS", "TUXES", "TWAIN", "TWANG", "TWEAK", "TWEED",
+    "TWEET", "TWERP", "TWICE", "TWIGS", "TWILL", "TWINE", "TWINS", "TWIRL", "TWIST", "TWITS",
+    "TWIXT", "TYING", "TYKES", "TYPED", "TYPES", "TYPIC", "TYPOS", "UDDER", "ULCER", "ULTRA",
+    "UMBRA", "UMIAK", "UMPHS", "UNABLE", "UNCLE", "UNCLES", "UNCUT", "UNDER", "UNDUE", "UNFED",
+    "UNFIT", "UNHAPPIUNION", "UNITE", "UNITS", "UNITY", "UNJUST", "UNWED", "UNZIP", "UPEND", "UPPER",
+    "UPSET", "URBAN", "URGED", "URGES", "URINE", "USAGE", "USHER", "USING", "USUAL", "USURP",
+    "UTTER", "UVULA", "VACUA", "VAGUE", "VAILS", "VALES", "VALET", "VALID", "VALOR", "VALUE",
+    "VALVE", "VAMPS", "VANES", "VAPOR", "VAULT", "VAUNT", "VEALS", "VEERS", "VEINS", "VELAR",
+    "VENAL", "VENDS", "VENOM", "VENTS", "VENUE", "VERBS", "VERGE", "VERSE", "VERSO", "VERVE",
+    "VESTS", "VETCH", "VEXED", "VEXES", "VIALS", "VIBES", "VICAR", "VICES", "VIDEO", "VIEWS",
+    "VIGIL", "VIGOR", "VILER", "VILLA", "VINES", "VINYL", "VIOLA", "VIPER", "VIRAL", "VIRUS",
+    "VISAS", "VISED", "VISES", "VISIT", "VISOR", "VISTA", "VITAL", "VIVID", "VIXEN", "VIZOR",
+    "VOCAL", "VODKA", "VOGUE", "VOICE", "VOIDS", "VOILA", "VOLES", "VOLTS", "VOMIT", "VOTED",
+    "VOTER", "VOTES", "VOUCH", "VOWED", "VOWEL", "VOWER", "VYING", "WACKO", "WACKS", "WACKY",
+    "WADED", "WADER", "WADES", "WAFER", "WAFTS", "WAGED", "WAGER", "WAGES", "WAGON", "WAIFS",
+    "WAILS", "WAIST", "WAITS", "WAIVE", "WAKED", "WAKEN", "WAKES", "WALDO", "WALES", "WALKS",
+    "WALLS", "WALTZ", "WANDS", "WANES", "WANNA", "WANTS", "WARDS", "WARES", "WARILY", "WARMS",
+    "WARNS", "WARPS", "WARTS", "WARTY", "WASPS", "WASPY", "WASTE", "WATCH", "WATER", "WATTS",
+    "WAVED", "WAVER", "WAVES", "WAXED", "WAXEN", "WAXES", "WEARY", "WEAVE", "WEBER", "WEDGE",
+    "WEDGY", "WEEDS", "WEEDY", "WEEKS", "WEENY", "WEEPS", "WEEPY", "WEFTS", "WEIGH", "WEIRD",
+    "WEIRS", "WELDS", "WELLS", "WELSH", "WELTS", "WENCH", "WENDS", "WHACK", "WHALE", "WHAMS",
+    "WHARF", "WHEAT", "WHEEL", "WHELK", "WHELM", "WHELP", "WHERE", "WHICH", "WHIFF", "WHILE",
+    "WHIMS", "WHINE", "WHINY", "WHIPS", "WHIRL", "WHIRS", "WHISK", "WHIST", "WHITE", "WHITS",
+    "WHOLE", "WHOMP", "WHOOP", "WHOPS", "WHORE", "WHORL", "WHOSE", "WICKS", "WIDEN", "WIDER",
+    "WIDOW", "WIDTH", "WIELD", "WIFED", "WIFES", "WIGHT", "WILED", "WILES", "WILLS", "WILLY",
+    "WILTS", "WIMPS", "WIMPY", "WINCE", "WINCH", "WINDS", "WINDY", "WINED", "WINES", "WINGS",
+    "WINKS", "WINOS", "WIPED", "WIPER", "WIPES", "WIRED", "WIRES", "WIRY", "WISED", "WISER",
+    "WISES", "WISPS", "WISPY", "WITCH", "WITEN", "WITHER", "WITTY", "WIVED", "WIVES", "WIZEN",
+    "WOKE", "WOLDS", "WOMAN", "WOMEN", "WONKY", "WOODS", "WOODY", "WOOED", "WOOER", "WOOFS",
+    "WOOLS", "WOOLY", "WOOZY", "WORDS", "WORDY", "WORKS", "WORLD", "WORMS", "WORMY", "WORRY",
+    "WORSE", "WORST", "WORTH", "WOULD", "WOUND", "WOVEN", "WOWED", "WRACK", "WRAPS", "WRATH",
+    "WREAK", "WRECK", "WREST", "WRING", "WRIST", "WRITE", "WRONG", "WROTE", "WROTH", "WRUNG",
+    "WRYLY", "XEROX", "XYLEM", "YACHT", "YAHOO", "YANKS", "YARDS", "YARNS", "YAWED", "YAWLS",
+    "YAWNS", "YEAHS", "YEARS", "YEAST", "YELLS", "YELPS", "YIELD", "YIKES", "YODEL", "YOGAS",
+    "YOGIS", "YOKED", "YOKES", "YOLKS", "YOUNG", "YOURS", "YOUTH", "YOWLS", "YUCCA", "YUCKY",
+    "YUKON", "YUMMY", "ZAGGED", "ZAPPY", "ZEROS", "ZESTS", "ZESTY", "ZILCH", "ZINCS", "ZINGY",
+    "ZIPPY", "ZONED", "ZONES", "ZONKS", "ZOOMS"
+]
+
+# Built-in 4-letter words (--length 4)
+WORD_LIST_4 = [
+    "ABLE", "ACID", "AGED", "ALSO", "AREA", "ARMY", "AWAY", "BABY", "BACK", "BALL", "BAND",
+    "BANK", "BASE", "BATH", "BEAR", "BEAT", "BEEN", "BEER", "BELL", "BELT", "BEST", "BILL",
+    "BIRD", "BLOW", "BLUE", "BOAT", "BODY", "BOMB", "BOND", "BONE", "BOOK", "BOOM", "BORN",
+    "BOSS", "BOTH", "BOWL", "BULK", "BURN", "BUSH", "BUSY", "CAKE", "CALL", "CALM", "CAME",
+    "CAMP", "CARD", "CARE", "CASE", "CASH", "CAST", "CELL", "CHAT", "CHIP", "CITY", "CLUB",
+    "COAL", "COAT", "CODE", "COLD", "COME", "COOK", "COOL", "COPE", "COPY", "CORE", "COST",
+    "CREW", "CROP", "DARK", "DATA", "DATE", "DAWN", "DAYS", "DEAD", "DEAL", "DEAR", "DEBT",
+    "DEEP", "DENY", "DESK", "DIAL", "DIET", "DISC", "DISK", "DOES", "DONE", "DOOR", "DOSE",
+    "DOWN", "DRAW", "DREW", "DROP", "DRUG", "DUAL", "DUKE", "DUST", "DUTY", "EACH", "EARN",
+    "EASE", "EAST", "EASY", "EDGE", "ELSE", "EVEN", "EVER", "EVIL", "EXIT", "FACE", "FACT",
+    "FAIL", "FAIR", "FALL", "FARM", "FAST", "FATE", "FEAR", "FEED", "FEEL", "FEET", "FELL",
+    "FELT", "FILE", "FILL", "FILM", "FIND", "FINE", "FIRE", "FIRM", "FISH", "FIVE", "FLAT",
+    "FLOW", "FOOD", "FOOT", "FORM", "FORT", "FOUR", "FREE", "FROM", "FUEL", "FULL", "FUND",
+    "GAIN", "GAME", "GATE", "GAVE", "GEAR", "GENE", "GIFT", "GIRL", "GIVE", "GLAD", "GOAL",
+    "GOES", "GOLD", "GOLF", "GONE", "GOOD", "GRAY", "GREW", "GREY", "GROW", "GULF", "HAIR",
+    "HALF", "HALL", "HAND", "HANG", "HARD", "HARM", "HATE", "HAVE", "HEAD", "HEAR", "HEAT",
+    "HELD", "HELL", "HELP", "HERE", "HERO", "HIGH", "HILL", "HIRE", "HOLD", "HOLE", "HOLY",
+    "HOME", "HOPE", "HOST", "HOUR", "HUGE", "HUNG", "HUNT", "HURT", "IDEA", "INCH", "INTO",
+    "IRON", "ITEM", "JAIL", "JOIN", "JOKE", "JUMP", "JURY", "JUST", "KEEN", "KEEP", "KEPT",
+    "KICK", "KIND", "KING", "KNEE", "KNEW", "KNOW", "LACK", "LADY", "LAID", "LAKE", "LAND",
+    "LANE", "LAST", "LATE", "LEAD", "LEFT", "LESS", "LIFE", "LIFT", "LIKE", "LINE", "LINK",
+    "LIST", "LIVE", "LOAN", "LOCK", "LONG", "LOOK", "LORD", "LOSE", "LOSS", "LOST", "LOVE",
+    "LUCK", "MADE", "MAIL", "MAIN", "MAKE", "MALE", "MANY", "MARK", "MASS", "MEAL", "MEAN",
+    "MEAT", "MEET", "MENU", "MERE", "MILD", "MILE", "MILK", "MILL", "MIND", "MINE", "MISS",
+    "MODE", "MOOD", "MOON", "MORE", "MOST", "MOVE", "MUCH", "MUST", "NAME", "NAVY", "NEAR",
+    "NECK", "NEED", "NEWS", "NEXT", "NICE", "NINE", "NONE", "NOSE", "NOTE", "OKAY", "ONCE",
+    "ONLY", "ONTO", "OPEN", "ORAL", "OVER", "PACE", "PACK", "PAGE", "PAID", "PAIN", "PAIR",
+    "PALM", "PARK", "PART", "PASS", "PAST", "PATH", "PEAK", "PICK", "PINK", "PIPE", "PLAN",
+    "PLAY", "PLOT", "PLUG", "PLUS", "POLL", "POOL", "POOR", "PORT", "POST", "PULL", "PURE",
+    "PUSH", "RACE", "RAIL", "RAIN", "RANK", "RARE", "RATE", "READ", "REAL", "REAR", "RELY",
+    "RENT", "REST", "RICE", "RICH", "RIDE", "RING", "RISE", "RISK", "ROAD", "ROCK", "ROLE",
+    "ROLL", "ROOF", "ROOM", "ROOT", "ROSE", "RULE", "RUSH", "SAFE", "SAID", "SAKE", "SALE",
+    "SALT", "SAME", "SAND", "SAVE", "SEAT", "SEED", "SEEK", "SEEM", "SEEN", "SELF", "SELL",
+    "SEND", "SENT", "SHIP", "SHOP", "SHOT", "SHOW", "SHUT", "SICK", "SIDE", "SIGN", "SITE",
+    "SIZE", "SKIN", "SLIP", "SLOW", "SNOW", "SOFT", "SOIL", "SOLD", "SOLE", "SOME", "SONG",
+    "SOON", "SORT", "SOUL", "SPOT", "STAR", "STAY", "STEP", "STOP", "SUCH", "SUIT", "SURE",
+    "TAKE", "TALE", "TALK", "TALL", "TANK", "TAPE", "TASK", "TEAM", "TECH", "TELL", "TEND",
+    "TERM", "TEST", "TEXT", "THAN", "THAT", "THEM", "THEN", "THEY", "THIN", "THIS", "THUS",
+    "TIDE", "TIED", "TIER", "TILL", "TIME", "TINY", "TOLD", "TONE", "TOOK", "TOOL", "TOUR",
+    "TOWN", "TREE", "TRIP", "TRUE", "TUNE", "TURN", "TWIN", "TYPE", "UNIT", "UPON", "USED",
+    "USER", "VARY", "VAST", "VERY", "VIEW", "VOTE", "WAGE", "WAIT", "WAKE", "WALK", "WALL",
+    "WANT", "WARD", "WARM", "WASH", "WAVE", "WAYS", "WEAK", "WEAR", "WEEK", "WELL", "WENT",
+    "WERE", "WEST", "WHAT", "WHEN", "WHOM", "WIDE", "WIFE", "WILD", "WILL", "WIND", "WINE",
+    "WING", "WIRE", "WISE", "WISH", "WITH", "WOOD", "WORD", "WORE", "WORK", "YARD", "YEAH",
+    "YEAR", "YOUR", "ZERO", "ZONE"
+]
+
+# Built-in 6-letter words (--length 6)
+WORD_LIST_6 = [
+    "ACCEPT", "ACCESS", "ACROSS", "ACTING", "ACTION", "ACTIVE", "ACTUAL", "ADVICE", "ADVISE",
+    "AFFECT", "AFFORD", "AFRAID", "AGENCY", "AGENDA", "ALMOST", "ALWAYS", "AMOUNT", "ANIMAL",
+    "ANNUAL", "ANSWER", "ANYONE", "ANYWAY", "APPEAL", "APPEAR", "AROUND", "ARRIVE", "ARTIST",
+    "ASPECT", "ASSESS", "ASSIST", "ASSUME", "ATTACK", "ATTEND", "AUTHOR", "AVENUE", "BACKED",
+    "BARELY", "BATTLE", "BEAUTY", "BECAME", "BECOME", "BEFORE", "BEHALF", "BEHIND", "BELIEF",
+    "BELONG", "BETTER", "BEYOND", "BISHOP", "BORDER", "BOTTLE", "BOTTOM", "BOUGHT", "BRANCH",
+    "BREATH", "BRIDGE", "BRIGHT", "BROKEN", "BUDGET", "BURDEN", "BUREAU", "BUTTON", "CAMERA",
+    "CANCER", "CANNOT", "CARBON", "CAREER", "CASTLE", "CASUAL", "CAUGHT", "CENTER", "CENTRE",
+    "CHANCE", "CHANGE", "CHARGE", "CHOICE", "CHOOSE", "CHOSEN", "CHURCH", "CIRCLE", "CLIENT",
+    "CLOSED", "CLOSER", "COFFEE", "COLUMN", "COMBAT", "COMING", "COMMON", "COMPLY", "COPPER",
+    "CORNER", "COSTLY", "COUNTY", "COUPLE", "COURSE", "COVERS", "CREATE", "CREDIT", "CRISIS",
+    "CUSTOM", "DAMAGE", "DANGER", "DEALER", "DEBATE", "DECADE", "DECIDE", "DEFEAT", "DEFEND",
+    "DEFINE", "DEGREE", "DEMAND", "DEPEND", "DEPUTY", "DESERT", "DESIGN", "DESIRE", "DETAIL",
+    "DETECT", "DEVICE", "DIFFER", "DINNER", "DIRECT", "DOCTOR", "DOLLAR", "DOMAIN", "DOUBLE",
+    "DRIVEN", "DRIVER", "DURING", "EASILY", "EATING", "EDITOR", "EFFECT", "EFFORT", "EIGHTH",
+    "EITHER", "ELEVEN", "EMERGE", "EMPIRE", "EMPLOY", "ENDING", "ENERGY", "ENGAGE", "ENGINE",
+    "ENOUGH", "ENSURE", "ENTIRE", "ENTITY", "EQUITY", "ESCAPE", "ESTATE", "ETHNIC", "EXCEED",
+    "EXCEPT", "EXCESS", "EXPAND", "EXPECT", "EXPERT", "EXPORT", "EXTEND", "EXTENT", "FABRIC",
+    "FACING", "FACTOR", "FAILED", "FAIRLY", "FALLEN", "FAMILY", "FAMOUS", "FATHER", "FELLOW",
+    "FEMALE", "FIGURE", "FILING", "FINGER", "FINISH", "FISCAL", "FLIGHT", "FLYING", "FOLLOW",
+    "FORCED", "FOREST", "FORGET", "FORMAL", "FORMAT", "FORMER", "FOSTER", "FOUGHT", "FOURTH",
+    "FRIEND", "FUTURE", "GARDEN", "GATHER", "GENDER", "GENIUS", "GLOBAL", "GOLDEN", "GROUND",
+    "GROWTH", "GUILTY", "HANDED", "HANDLE", "HAPPEN", "HARDLY", "HEADED", "HEALTH", "HEIGHT",
+    "HIDDEN", "HOLDER", "HONEST", "IMPACT", "IMPORT", "INCOME", "INDEED", "INJURY", "INSIDE",
+    "INTEND", "INTENT", "INVEST", "ISLAND", "ITSELF", "JUNIOR", "KILLED", "LABOUR", "LATEST",
+    "LATTER", "LAUNCH", "LAWYER", "LEADER", "LEAGUE", "LEAVES", "LEGACY", "LENGTH", "LESSON",
+    "LETTER", "LIGHTS", "LIKELY", "LINKED", "LIQUID", "LISTEN", "LITTLE", "LIVING", "LOSING",
+    "MAINLY", "MAKING", "MANAGE", "MANNER", "MANUAL", "MARGIN", "MARINE", "MARKED", "MARKET",
+    "MASTER", "MATTER", "MEDIUM", "MEMBER", "MEMORY", "MENTAL", "MERELY", "METHOD", "MIDDLE",
+    "MINUTE", "MIRROR", "MOBILE", "MODERN", "MODEST", "MOMENT", "MOSTLY", "MOTHER", "MOTION",
+    "MOVING", "MURDER", "MUSCLE", "MUSEUM", "MUTUAL", "MYSELF", "NARROW", "NATION", "NATIVE",
+    "NATURE", "NEARBY", "NEARLY", "NIGHTS", "NOBODY", "NORMAL", "NOTICE", "NOTION", "NUMBER",
+    "OBJECT", "OBTAIN", "OFFICE", "OFFSET", "ONLINE", "OPTION", "ORANGE", "ORIGIN", "OUTPUT",
+    "PACKED", "PALACE", "PARENT", "PARTLY", "PATENT", "PEOPLE", "PERIOD", "PERMIT", "PERSON",
+    "PHRASE", "PICKED", "PLANET", "PLAYER", "PLEASE", "PLENTY", "POCKET", "POLICE", "POLICY",
+    "PREFER", "PRETTY", "PRINCE", "PRISON", "PROFIT", "PROPER", "PROVEN", "PUBLIC", "PURSUE",
+    "RAISED", "RANDOM", "RARELY", "RATHER", "RATING", "READER", "REALLY", "REASON", "RECALL",
+    "RECENT", "RECORD", "REDUCE", "REFORM", "REGARD", "REGIME", "REGION", "RELATE", "RELIEF",
+    "REMAIN", "REMOTE", "REMOVE", "REPAIR", "REPEAT", "REPLAY", "REPORT", "RESCUE", "RESORT",
+    "RESULT", "RETAIL", "RETAIN", "RETURN", "REVEAL", "REVIEW", "REWARD", "RIDING", "RISING",
+    "ROBUST", "RULING", "SAFETY", "SALARY", "SAMPLE", "SAVING", "SAYING", "SCHEME", "SCHOOL",
+    "SCREEN", "SEARCH", "SEASON", "SECOND", "SECRET", "SECTOR", "SECURE", "SEEING", "SELECT",
+    "SELLER", "SENIOR", "SERIES", "SERVER", "SETTLE", "SEVERE", "SHOULD", "SIGNAL", "SIGNED",
+    "SILENT", "SILVER", "SIMPLE", "SIMPLY", "SINGLE", "SISTER", "SLIGHT", "SMOOTH", "SOCIAL",
+    "SOLELY", "SOUGHT", "SOURCE", "SPEECH", "SPIRIT", "SPOKEN", "SPREAD", "SPRING", "SQUARE",
+    "STABLE", "STATUS", "STEADY", "STOLEN", "STRAIN", "STREAM", "STREET", "STRESS", "STRICT",
+    "STRIKE", "STRING", "STRONG", "STRUCK", "STUDIO", "SUBMIT", "SUDDEN", "SUFFER", "SUMMER",
+    "SUMMIT", "SUPPLY", "SURELY", "SURVEY", "SWITCH", "SYMBOL", "SYSTEM", "TAKING", "TALENT",
+    "TARGET", "TAUGHT", "TENANT", "TENDER", "TENNIS", "THANKS", "THEORY", "THIRTY", "THOUGH",
+    "THREAT", "THROWN", "TICKET", "TIMELY", "TIMING", "TISSUE", "TOWARD", "TRAVEL", "TREATY",
+    "TRYING", "TWELVE", "TWENTY", "UNIQUE", "UNLESS", "UNLIKE", "UPDATE", "USEFUL", "VALLEY",
+    "VARIED", "VENDOR", "VERSUS", "VICTIM", "VISION", "VISUAL", "VOLUME", "WALKER", "WEALTH",
+    "WEEKLY", "WEIGHT", "WHOLLY", "WINDOW", "WINNER", "WINTER", "WITHIN", "WONDER", "WORKER",
+    "WRITER", "YELLOW"
+]
+
+# Built-in 7-letter words (--length 7)
+WORD_LIST_7 = [
+    "ABILITY", "ABSENCE", "ACADEMY", "ACCOUNT", "ACCUSED", "ACHIEVE", "ACQUIRE", "ADDRESS",
+    "ADVANCE", "ADVERSE", "ADVISED", "ADVISER", "AGAINST", "AIRLINE", "AIRPORT", "ALCOHOL",
+    "ALLEGED", "ALREADY", "ANALYST", "ANCIENT", "ANOTHER", "ANXIETY", "ANXIOUS", "ANYBODY",
+    "APPLIED", "ARRANGE", "ARRIVAL", "ARTICLE", "ASSAULT", "ASSUMED", "ATTEMPT", "ATTRACT",
+    "AUCTION", "AVERAGE", "BACKING", "BALANCE", "BANKING", "BARRIER", "BATTERY", "BEARING",
+    "BEATING", "BECAUSE", "BEDROOM", "BELIEVE", "BENEATH", "BENEFIT", "BESIDES", "BETWEEN",
+    "BILLION", "BINDING", "BROTHER", "BROUGHT", "BURNING", "CABINET", "CALIBER", "CALLING",
+    "CAPABLE", "CAPITAL", "CAPTAIN", "CAPTION", "CAPTURE", "CAREFUL", "CARRIER", "CAUTION",
+    "CEILING", "CENTRAL", "CERTAIN", "CHAMBER", "CHANNEL", "CHAPTER", "CHARITY", "CHARTER",
+    "CHECKED", "CHICKEN", "CHRONIC", "CIRCUIT", "CLASSIC", "CLIMATE", "CLOSING", "CLOTHES",
+    "COLLECT", "COLLEGE", "COMBINE", "COMFORT", "COMMAND", "COMMENT", "COMPACT", "COMPANY",
+    "COMPARE", "COMPETE", "COMPLEX", "CONCEPT", "CONCERN", "CONCERT", "CONDUCT", "CONFIRM",
+    "CONNECT", "CONSENT", "CONSIST", "CONTACT", "CONTAIN", "CONTENT", "CONTEST", "CONTEXT",
+    "CONTROL", "CONVERT", "CORRECT", "COUNCIL", "COUNSEL", "COUNTER", "COUNTRY", "CRUCIAL",
+    "CRYSTAL", "CULTURE", "CURRENT", "CUTTING", "DEALING", "DECIDED", "DECLINE", "DEFAULT",
+    "DEFENCE", "DEFICIT", "DELIVER", "DENSITY", "DEPOSIT", "DESKTOP", "DESPITE", "DESTROY",
+    "DEVELOP", "DEVOTED", "DIAMOND", "DIGITAL", "DISCUSS", "DISEASE", "DISPLAY", "DISPUTE",
+    "DISTANT", "DIVERSE", "DIVIDED", "DRAWING", "DRIVING", "DYNAMIC", "EASTERN", "ECONOMY",
+    "EDITION", "ELDERLY", "ELEMENT", "ENGAGED", "ENHANCE", "ESSENCE", "EVENING", "EVIDENT",
+    "EXACTLY", "EXAMINE", "EXAMPLE", "EXCITED", "EXCLUDE", "EXHIBIT", "EXPENSE", "EXPLAIN",
+    "EXPLORE", "EXPRESS", "EXTREME", "FACTORY", "FACULTY", "FAILING", "FAILURE", "FASHION",
+    "FEATURE", "FEDERAL", "FEELING", "FICTION", "FIFTEEN", "FILLING", "FINANCE", "FINDING",
+    "FISHING", "FITNESS", "FOREIGN", "FOREVER", "FORMULA", "FORTUNE", "FORWARD", "FOUNDER",
+    "FREEDOM", "FURTHER", "GALLERY", "GATEWAY", "GENERAL", "GENETIC", "GENUINE", "GREATER",
+    "HANGING", "HEADING", "HEALTHY", "HEARING", "HEAVILY", "HELPFUL", "HELPING", "HERSELF",
+    "HIGHWAY", "HIMSELF", "HISTORY", "HOLDING", "HOLIDAY", "HOUSING", "HOWEVER", "HUNDRED",
+    "HUSBAND", "ILLEGAL", "ILLNESS", "IMAGINE", "IMAGING", "IMPROVE", "INCLUDE", "INITIAL",
+    "INQUIRY", "INSIGHT", "INSTALL", "INSTANT", "INSTEAD", "INTENSE", "INTERIM", "INVOLVE",
+    "JOURNAL", "JOURNEY", "JUSTICE", "JUSTIFY", "KEEPING", "KILLING", "KINGDOM", "KITCHEN",
+    "KNOWING", "LANDING", "LARGELY", "LASTING", "LEADING", "LEARNED", "LEISURE", "LIBERAL",
+    "LIBERTY", "LIBRARY", "LICENSE", "LIMITED", "LISTING", "LOGICAL", "LOYALTY", "MACHINE",
+    "MANAGER", "MARRIED", "MASSIVE", "MAXIMUM", "MEANING", "MEASURE", "MEDICAL", "MEETING",
+    "MENTION", "MESSAGE", "MILLION", "MINERAL", "MINIMAL", "MINIMUM", "MISSING", "MISSION",
+    "MISTAKE", "MIXTURE", "MONITOR", "MONTHLY", "MORNING", "MYSTERY", "NATURAL", "NEITHER",
+    "NERVOUS", "NETWORK", "NEUTRAL", "NOTABLE", "NOTHING", "NOWHERE", "NUCLEAR", "NURSING",
+    "OBVIOUS", "OFFENCE", "OFFICER", "OPENING", "OPERATE", "OPINION", "OPTICAL", "ORGANIC",
+    "OUTCOME", "OUTDOOR", "OUTLOOK", "OUTSIDE", "OVERALL", "PACKAGE", "PAINTED", "PARKING",
+    "PARTIAL", "PARTNER", "PASSAGE", "PASSING", "PASSION", "PASSIVE", "PATIENT", "PATTERN",
+    "PAYABLE", "PAYMENT", "PENALTY", "PENDING", "PENSION", "PERCENT", "PERFECT", "PERFORM",
+    "PERHAPS", "PICTURE", "PIONEER", "PLASTIC", "POINTED", "POPULAR", "PORTION", "POVERTY",
+    "PRECISE", "PREDICT", "PREMIER", "PREMIUM", "PREPARE", "PRESENT", "PREVENT", "PRIMARY",
+    "PRINTER", "PRIVACY", "PRIVATE", "PROBLEM", "PROCEED", "PROCESS", "PRODUCE", "PRODUCT",
+    "PROFILE", "PROGRAM", "PROJECT", "PROMISE", "PROMOTE", "PROTECT", "PROTEIN", "PROTEST",
+    "PROVIDE", "PUBLISH", "PURPOSE", "PUSHING", "QUALIFY", "QUALITY", "QUARTER", "RADICAL",
+    "RAILWAY", "READILY", "READING", "REALITY", "REALIZE", "RECEIPT", "RECEIVE", "RECOVER",
+    "REFLECT", "REGULAR", "RELATED", "RELEASE", "REMAINS", "REMOVAL", "REPLACE", "REQUEST",
+    "REQUIRE", "RESERVE", "RESOLVE", "RESPECT", "RESPOND", "RESTORE", "RETIRED", "REVENUE",
+    "REVERSE", "ROLLING", "ROUTINE", "RUNNING", "SATISFY", "SCIENCE", "SECTION", "SEGMENT",
+    "SERIOUS", "SERVICE", "SERVING", "SESSION", "SETTING", "SEVERAL", "SHELTER", "SHERIFF",
+    "SIGNING", "SIMILAR", "SOCIETY", "SOLDIER", "SOMEHOW", "SOMEONE", "SPEAKER", "SPECIAL",
+    "SPONSOR", "STATION", "STORAGE", "STRANGE", "STRETCH", "STUDENT", "STUDIED", "SUBJECT",
+    "SUCCESS", "SUGGEST", "SUMMARY", "SUPPORT", "SUPPOSE", "SUPREME", "SURFACE", "SURGERY",
+    "SURPLUS", "SURVIVE", "SUSPECT", "SUSTAIN", "TEACHER", "TEXTILE", "THEATER", "THERAPY",
+    "THOUGHT", "THROUGH", "TONIGHT", "TOTALLY", "TOUCHED", "TOWARDS", "TRAFFIC", "TRAINER",
+    "TROUBLE", "TURNING", "TYPICAL", "UNIFORM", "UNKNOWN", "UNUSUAL", "UPGRADE", "USUALLY",
+    "VARIETY", "VEHICLE", "VERSION", "VETERAN", "VICTORY", "VILLAGE", "VINTAGE", "VIOLENT",
+    "VIRTUAL", "VISIBLE", "WAITING", "WALKING", "WANTING", "WARNING", "WARRANT", "WEALTHY",
+    "WEATHER", "WEBSITE", "WEDDING", "WEEKEND", "WELCOME", "WELFARE", "WESTERN", "WHEREAS",
+    "WHETHER", "WILLING", "WINNING", "WITHOUT", "WITNESS", "WORKING", "WRITING", "WRITTEN"
+]
+
+# Built-in 8-letter words (--length 8)
+WORD_LIST_8 = [
+    "ABSOLUTE", "ACADEMIC", "ACCEPTED", "ACCIDENT", "ACCURACY", "ACCURATE", "ACHIEVED",
+    "ACQUIRED", "ACTIVITY", "ACTUALLY", "ADDITION", "ADEQUATE", "ADJACENT", "ADVANCED",
+    "ADVISORY", "ADVOCATE", "AFFECTED", "AIRCRAFT", "ALLIANCE", "ALTHOUGH", "ALUMINUM",
+    "ANALYSIS", "ANNOUNCE", "ANYTHING", "ANYWHERE", "APPARENT", "APPEARED", "APPROACH",
+    "APPROVAL", "ARGUMENT", "ARTISTIC", "ASSEMBLY", "ASSUMING", "ATTACHED", "ATTITUDE",
+    "ATTORNEY", "AUDIENCE", "AVIATION", "BACKWARD", "BASEBALL", "BATHROOM", "BECOMING",
+    "BEHAVIOR", "BIRTHDAY", "BOUNDARY", "BREAKING", "BREEDING", "BUILDING", "BUSINESS",
+    "CALENDAR", "CAMPAIGN", "CAPACITY", "CASUALTY", "CATCHING", "CATEGORY", "CATHOLIC",
+    "CAUTIOUS", "CELLULAR", "CHAIRMAN", "CHAMPION", "CHEMICAL", "CHILDREN", "CIRCULAR",
+    "CIVILIAN", "CLEARING", "CLINICAL", "CLOTHING", "COLLAPSE", "COLONIAL", "COLORFUL",
+    "COMMENCE", "COMMERCE", "COMPLAIN", "COMPLETE", "COMPOSED", "COMPOUND", "COMPRISE",
+    "COMPUTER", "CONCLUDE", "CONCRETE", "CONFLICT", "CONFUSED", "CONGRESS", "CONSIDER",
+    "CONSTANT", "CONSUMER", "CONTINUE", "CONTRACT", "CONTRARY", "CONTRAST", "CONVINCE",
+    "CORRIDOR", "COVERAGE", "COVERING", "CREATION", "CREATIVE", "CRIMINAL", "CRITICAL",
+    "CROSSING", "CULTURAL", "CURRENCY", "CUSTOMER", "DATABASE", "DAUGHTER", "DAYLIGHT",
+    "DEADLINE", "DECIDING", "DECISION", "DECREASE", "DEFERRED", "DEFINITE", "DELIGHTS",
+    "DELIVERY", "DESCRIBE", "DESIGNER", "DETAILED", "DIABETES", "DIALOGUE", "DIAMETER",
+    "DIRECTOR", "DISABLED", "DISASTER", "DISCLOSE", "DISCOUNT", "DISCOVER", "DISORDER",
+    "DISPOSAL", "DISTANCE", "DISTINCT", "DISTRICT", "DIVIDEND", "DIVISION", "DOCTRINE",
+    "DOCUMENT", "DOMESTIC", "DOMINANT", "DOMINATE", "DOUBTFUL", "DRAMATIC", "DRESSING",
+    "DROPPING", "DURATION", "DWELLING", "DYNAMICS", "EARNINGS", "ECONOMIC", "EDUCATED",
+    "EFFICACY", "EIGHTEEN", "ELECTION", "ELECTRIC", "ELIGIBLE", "EMERGING", "EMPHASIS",
+    "EMPLOYEE", "ENDORSED", "ENORMOUS", "ENTIRELY", "ENTRANCE", "ENVELOPE", "EQUALITY",
+    "EQUATION", "ESTIMATE", "EVALUATE", "EVENTUAL", "EVERYDAY", "EVERYONE", "EVIDENCE",
+    "EXCHANGE", "EXCITING", "EXERCISE", "EXPLICIT", "EXPOSURE", "EXTENDED", "EXTERNAL",
+    "FACILITY", "FAMILIAR", "FEATURED", "FEEDBACK", "FESTIVAL", "FINISHED", "FIREWALL",
+    "FLAGSHIP", "FLEXIBLE", "FLOATING", "FOOTBALL", "FOOTPATH", "FORECAST", "FORESTRY",
+    "FORMERLY", "FOURTEEN", "FRACTION", "FREQUENT", "FRIENDLY", "FRONTIER", "FUNCTION",
+    "GENERATE", "GENEROUS", "GENOMICS", "GOODWILL", "GORGEOUS", "GOVERNOR", "GRADUATE",
+    "GRAPHICS", "GRATEFUL", "GUARDIAN", "GUIDANCE", "HANDLING", "HARDWARE", "HEADLINE",
+    "HERITAGE", "HIGHLAND", "HISTORIC", "HOMELESS", "HOMEPAGE", "HOSPITAL", "HUMANITY",
+    "IDENTIFY", "IDENTITY", "IDEOLOGY", "IMPERIAL", "INCIDENT", "INCLUDED", "INCREASE",
+    "INDICATE", "INDIRECT", "INDUSTRY", "INFORMAL", "INFORMED", "INHERENT", "INITIATE",
+    "INNOCENT", "INSPIRED", "INSTANCE", "INTEGRAL", "INTENDED", "INTERACT", "INTEREST",
+    "INTERIOR", "INTERNAL", "INTERVAL", "INTIMATE", "INTRANET", "INVASION", "INVOLVED",
+    "ISOLATED", "JUDGMENT", "JUDICIAL", "JUNCTION", "KEYBOARD", "LANDLORD", "LANGUAGE",
+    "LAUGHTER", "LEARNING", "LEVERAGE", "LIFETIME", "LIGHTING", "LIKEWISE", "LIMITING",
+    "LITERARY", "LOCATION", "MAGAZINE", "MAGNETIC", "MAINTAIN", "MAJORITY", "MARATHON",
+    "MARGINAL", "MATERIAL", "MATERNAL", "MEASURED", "MECHANIC", "MEDICINE", "MEMORIAL",
+    "MERCHANT", "MIDNIGHT", "MILITARY", "MINIMIZE", "MINISTER", "MINISTRY", "MINORITY",
+    "MOBILITY", "MODELING", "MODERATE", "MOMENTUM", "MONETARY", "MORTGAGE", "MOUNTAIN",
+    "MOVEMENT", "MULTIPLE", "NATIONAL", "NEGATIVE", "NINETEEN", "NORTHERN", "NOTEBOOK",
+    "NUMEROUS", "OBSTACLE", "OBTAINED", "OCCASION", "OFFERING", "OFFICIAL", "OFFSHORE",
+    "OPERATOR", "OPPONENT", "OPPOSITE", "OPTIMISM", "ORDINARY", "ORGANIZE", "ORIENTED",
+    "ORIGINAL", "OVERCOME", "OVERLOOK", "OVERSEAS", "OVERVIEW", "PAINTING", "PARALLEL",
+    "PARENTAL", "PATIENCE", "PEACEFUL", "PERIODIC", "PERSONAL", "PERSUADE", "PETITION",
+    "PHYSICAL", "PLANNING", "PLATFORM", "PLEASANT", "PLEASURE", "POLITICS", "PORTABLE",
+    "PORTRAIT", "POSITION", "POSITIVE", "POSSIBLE", "POWERFUL", "PRACTICE", "PRECIOUS",
+    "PREGNANT", "PRESENCE", "PRESERVE", "PRESSING", "PRESSURE", "PREVIOUS", "PRINCESS",
+    "PRINTING", "PRIORITY", "PROBABLE", "PROBABLY", "PRODUCER", "PROFOUND", "PROGRESS",
+    "PROPERTY", "PROPOSAL", "PROSPECT", "PROTOCOL", "PROVIDED", "PROVIDER", "PROVINCE",
+    "PUBLICLY", "PURCHASE", "PURSUANT", "QUANTITY", "QUESTION", "RATIONAL", "REACTION",
+    "RECEIVED", "RECEIVER", "RECOVERY", "REGIONAL", "REGISTER", "RELATION", "RELATIVE",
+    "RELEVANT", "RELIABLE", "RELIANCE", "RELIGION", "REMAINED", "REMEMBER", "RENOWNED",
+    "REPEATED", "REPORTER", "REPUBLIC", "REQUIRED", "RESEARCH", "RESERVED", "RESIDENT",
+    "RESIGNED", "RESOURCE", "RESPONSE", "RESTRICT", "REVISION", "RIGOROUS", "ROMANTIC",
+    "SAMPLING", "SCENARIO", "SCHEDULE", "SCRUTINY", "SEASONAL", "SECONDLY", "SECURITY",
+    "SELECTED", "SEMESTER", "SENSIBLE", "SENTENCE", "SEPARATE", "SEQUENCE", "SERGEANT",
+    "SHIPPING", "SHOOTING", "SHOPPING", "SHORTAGE", "SHOULDER", "SIMPLIFY", "SITUATED",
+    "SKELETON", "SLIGHTLY", "SOFTWARE", "SOLUTION", "SOMEBODY", "SOMEWHAT", "SOUTHERN",
+    "SPEAKING", "SPECIFIC", "SPECTRUM", "SPORTING", "STANDARD", "STANDING", "STRATEGY",
+    "STRENGTH", "STRIKING", "STRUGGLE", "STUNNING", "SUITABLE", "SUPERIOR", "SUPPOSED",
+    "SURGICAL", "SURPRISE", "SURROUND", "SURVIVAL", "SURVIVOR", "SWIMMING", "SYMBOLIC",
+    "SYMPATHY", "SYNDROME", "TACTICAL", "TAILORED", "TAKEOVER", "TANGIBLE", "TEAMWORK",
+    "TERMINAL", "THINKING", "THIRTEEN", "THOROUGH", "THOUSAND", "THREATEN", "TOGETHER",
+    "TOMORROW", "TOUCHING", "TRACKING", "TRAINING", "TRANSFER", "TRAVELED", "TREASURY",
+    "TRIANGLE", "TROPICAL", "TURNOVER", "ULTIMATE", "UMBRELLA", "UNIVERSE", "UNLIKELY",
+    "UPCOMING", "VACATION", "VALUABLE", "VARIABLE", "VERTICAL", "VIOLENCE", "VOLATILE",
+    "WARRANTY", "WEAKNESS", "WHATEVER", "WHENEVER", "WHEREVER", "WILDLIFE", "WIRELESS",
+    "WITHDRAW", "WORKSHOP", "YOURSELF"
+]
+
+
+def builtin_words(length=5):
+    """Built-in words of one length (WORD_LIST also has a few strays)"""
+    return [word for words in (WORD_LIST, WORD_LIST_4, WORD_LIST_6, WORD_LIST_7, WORD_LIST_8)
+            for word in words if len(word) == length]
+
+
+def normalize_words(words, length=5):
+    """Upper-case, keep alphabetic words of the given length, de-duplicate and sort"""
+    return sorted({word.strip().upper() for word in words
+                   if len(word.strip()) == length and word.strip().isalpha()})
+
+
+def read_words(path):
+    """Read a word list file (one word per line, '#' comments allowed)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return [line.split('#', 1)[0].strip() for line in f if line.split('#', 1)[0].strip()]
+
+
+def pack_words(words):
+    """Sorted equal-length words -> one ASCII byte string"""
+    return ''.join(words).encode('ascii')
+
+
+class WordIndex:
+    """Answers and allowed guesses for one word length"""
+
+    def __init__(self, length, answer_blob, allowed_blob, flags=0):
+        self.length = length
+        self.flags = flags
+        self.answer_blob = answer_blob
+        self.allowed_blob = allowed_blob
+        self.answers = self._unpack(answer_blob)
+        self.guesses = self._unpack(allowed_blob)  # sorted allowed guesses
+        self.allowed = frozenset(self.guesses)
+
+    def _unpack(self, blob):
+        text = blob.decode('ascii')
+        n = self.length
+        return tuple(text[i:i + n] for i in range(0, len(text), n))
+
+    @classmethod
+    def build(cls, answers, guesses=(), length=5, distinct_answers=False):
+        """Build an index; every answer is also an allowed guess
+
+        distinct_answers=True keeps only answers without repeated letters.
+        """
+        answers = normalize_words(answers, length)
+        allowed = normalize_words(list(answers) + list(guesses), length)
+        if distinct_answers:
+            answers = [word for word in answers if len(set(word)) == length]
+        flags = DISTINCT_ANSWERS if distinct_answers else 0
+        return cls(length, pack_words(answers), pack_words(allowed), flags)
+
+    def __len__(self):
+        return len(self.allowed)
+
+    def __contains__(self, word):
+        return word.upper() in self.allowed
+
+    def random_answer(self, rng=random):
+        return rng.choice(self.answers)
+
+    def word_at(self, index):
+        """The index-th allowed guess in sorted order"""
+        start = index * self.length
+        return self.allowed_blob[start:start + self.length].decode('ascii')
+
+    def index_of(self, word):
+        """Position of word in the sorted allowed list (binary search), or -1"""
+        key = word.upper().encode('ascii', 'replace')
+        if len(key) != self.length:
+            return -1
+        blob = self.allowed_blob
+        n = self.length
+        lo, hi = 0, len(blob) // n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if blob[mid * n:mid * n + n] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if blob[lo * n:lo * n + n] == key:
+            return lo
+        return -1
+
+    # ----- persistence -------------------------------------------------
+
+    def to_bytes(self):
+        header = HEADER.pack(INDEX_MAGIC, INDEX_VERSION, self.length, self.flags,
+                             len(self.answers), len(self.allowed))
+        return header + self.answer_blob + self.allowed_blob
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Parse a cached index, or return None if it is not one"""
+        if len(data) < HEADER.size:
+            return None
+        magic, version, length, flags, answers, allowed = HEADER.unpack_from(data)
+        if magic != INDEX_MAGIC or version != INDEX_VERSION or not length:
+            return None
+        split = HEADER.size + answers * length
+        end = split + allowed * length
+        if len(data) != end:
+            return None
+        return cls(length, data[HEADER.size:split], data[split:end], flags)
+
+
+def index_key(answers, guesses, length, distinct_answers):
+    """Hash of the index inputs (memo key and cache file name)"""
+    return content_key(f"wordle-index-v{INDEX_VERSION}", str(length), str(distinct_answers),
+                       '\n'.join(answers), '\n'.join(guesses))
+
+
+def load_index(answers=None, guesses=(), length=5, distinct_answers=False, use_cache=True):
+    """Return a WordIndex from memory, the disk cache or a fresh build
+
+    answers defaults to the built-in words of that length.
+    """
+    if length not in WORD_LENGTHS:
+        raise ValueError(f"word length must be {WORD_LENGTHS[0]}-{WORD_LENGTHS[-1]}, got {length}")
+    answers = builtin_words(length) if answers is None else list(answers)
+    guesses = list(guesses)
+    key = index_key(answers, guesses, length, distinct_answers)
+    index = _memo.get(key)
+    if index is not None:
+        return index
+
+    path = cache_file('wordle', f"{key}.idx") if use_cache else None
+    if path:
+        try:
+            with open(path, 'rb') as f:
+                index = WordIndex.from_bytes(f.read())
+        except OSError:
+            index = None
+    if index is None:
+        index = WordIndex.build(answers, guesses, length, distinct_answers)
+        if path:
+            try:
+                write_atomic(path, index.to_bytes())
+            except OSError:
+                pass
+
+    _memo[key] = index
+    return index
@@ -3,8 +3,28 @@ Game 010: Sokoban
 Classic box-pushing puzzle game - push all boxes to target positions.
 """
 
+import argparse
 import curses
 import copy
+import os
+import sys
+from array import array
+from collections import deque
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from games.game_010_sokoban_tables import load_tables
+from games.game_010_sokoban_solver import SokobanSolver, BackgroundSearch
+from games.game_010_sokoban_levels import LevelPack
+
+# Hint / auto-solve settings
+SEARCH_TIME_LIMIT = 10.0   # seconds before a hint search gives up
+ANIMATION_DELAY_MS = 80    # delay between animated solution steps
+LURD_STEPS = {'u': (0, -1), 'd': (0, 1), 'l': (-1, 0), 'r': (1, 0)}
+
+# Undo/redo log: one signed byte per step = direction index | PUSH_FLAG
+STEP_DIRECTIONS = ((0, -1), (0, 1), (-1, 0), (1, 0))
+PUSH_FLAG = 4
 
 # Classic Sokoban levels (10 levels from easy to hard)
 # All levels verified solvable
@@ -107,8 +127,9 @@ LEVELS = [
 ]
 
 class Sokoban:
-    def __init__(self, stdscr):
+    def __init__(self, stdscr, levels=None, start_level=0):
         self.stdscr = stdscr
+        self.levels = LEVELS if levels is None else levels
         
         # Initialize curses
         curses.curs_set(0)
@@ -124,17 +145,26 @@ class Sokoban:
         curses.init_pair(5, curses.COLOR_GREEN, curses.COLOR_BLACK)   # Box on target
         curses.init_pair(6, curses.COLOR_RED, curses.COLOR_BLACK)     # Player on target
         
+        # Hint / auto-solve state
+        self.solver = None
+        self.solver_level = None
+        self.search = None
+        self.search_mode = None
+        self.search_state = None
+        self.playback = deque()
+        self.status_message = ""
+        
         # Game state
-        self.current_level = 0
+        self.current_level = min(max(start_level, 0), len(self.levels) - 1)
         self.load_level(self.current_level)
     
     def load_level(self, level_num):
         """Load a level"""
-        if level_num >= len(LEVELS):
+        if level_num >= len(self.levels):
             return False
         
         self.current_level = level_num
-        level = LEVELS[level_num]
+        level = self.levels[level_num]
         
         # Parse level
         self.board = []
@@ -143,7 +173,23 @@ class Sokoban:
         self.targets = set()
         self.moves = 0
         self.pushes = 0
-        self.history = []
+        self.history = array('b')
+        self.redo_log = array('b')
+        self.deadlocked = False
+        
+        # Static analysis (dead cells, push distances), cached per layout
+        self.tables = load_tables(level)
+        
+        # Solver for hints; solutions are remembered per state so following
+        # a hint (or asking again) doesn't search again. Both survive a
+        # restart, so unfinished searches of this level can be resumed.
+        self.cancel_search()
+        if self.solver_level != level_num:
+            self.solver = None
+            self.solver_level = level_num
+            self.solution_cache = {}
+        self.playback.clear()
+        self.status_message = ""
         
         for y, row in enumerate(level):
             board_row = []
@@ -182,7 +228,14 @@ class Sokoban:
         return self.board[y][x] != '#'
     
     def move_player(self, dx, dy):
-        """Try to move player"""
+        """Try to move player (a new move clears the redo log)"""
+        if not self.step(dx, dy):
+            return False
+        del self.redo_log[:]
+        return True
+    
+    def step(self, dx, dy):
+        """Move (and maybe push) one step, recording it in the undo log"""
         new_x = self.player_pos[0] + dx
         new_y = self.player_pos[1] + dy
         
@@ -190,6 +243,8 @@ class Sokoban:
         if not self.can_move(new_x, new_y):
             return False
         
+        code = STEP_DIRECTIONS.index((dx, dy))
+        
         # Check if there's a box
         if (new_x, new_y) in self.boxes:
             # Try to push box
@@ -202,44 +257,142 @@ class Sokoban:
             if (box_new_x, box_new_y) in self.boxes:
                 return False
             
-            # Save state for undo
-            self.history.append({
-                'player_pos': self.player_pos.copy(),
-                'boxes': self.boxes.copy(),
-                'moves': self.moves,
-                'pushes': self.pushes
-            })
-            
             # Push box
             self.boxes.remove((new_x, new_y))
             self.boxes.add((box_new_x, box_new_y))
             self.pushes += 1
-        else:
-            # Save state for undo (no push)
-            self.history.append({
-                'player_pos': self.player_pos.copy(),
-                'boxes': self.boxes.copy(),
-                'moves': self.moves,
-                'pushes': self.pushes
-            })
+            self.deadlocked = self.check_deadlock()
+            code |= PUSH_FLAG
         
         # Move player
+        self.history.append(code)
         self.player_pos = [new_x, new_y]
         self.moves += 1
         return True
     
     def undo(self):
-        """Undo last move"""
+        """Undo last move by replaying it in reverse"""
         if not self.history:
             return False
         
-        state = self.history.pop()
-        self.player_pos = state['player_pos']
-        self.boxes = state['boxes']
-        self.moves = state['moves']
-        self.pushes = state['pushes']
+        code = self.history.pop()
+        dx, dy = STEP_DIRECTIONS[code & 3]
+        x, y = self.player_pos
+        if code & PUSH_FLAG:
+            # Pull the box back onto the cell the player is leaving
+            self.boxes.remove((x + dx, y + dy))
+            self.boxes.add((x, y))
+            self.pushes -= 1
+        self.player_pos = [x - dx, y - dy]
+        self.moves -= 1
+        self.redo_log.append(code)
+        self.deadlocked = self.check_deadlock()
         return True
     
+    def redo(self):
+        """Redo the last undone move"""
+        if not self.redo_log:
+            return False
+        
+        code = self.redo_log.pop()
+        return self.step(*STEP_DIRECTIONS[code & 3])
+    
+    def check_deadlock(self):
+        """Check if any box can no longer reach a target (dead cell or frozen)"""
+        tables = self.tables
+        cells = {tables.to_index(x, y) for x, y in self.boxes}
+        for box in cells:
+            if tables.dead[box]:
+                return True
+            if box not in tables.target_set and tables.is_freeze_deadlock(cells, box):
+                return True
+        return False
+    
+    def state_key(self):
+        """Hashable snapshot of the dynamic state (player + boxes)"""
+        return (tuple(self.player_pos), frozenset(self.boxes))
+    
+    def request_solution(self, mode):
+        """Start a hint ('hint') or full solution ('solve') from the current state"""
+        key = self.state_key()
+        if key in self.solution_cache:
+            self.start_playback(self.solution_cache[key], mode)
+            return
+        
+        if self.search is not None:
+            # Already thinking about this state; just upgrade hint -> solve
+            if self.search_state == key:
+                if mode == 'solve':
+                    self.search_mode = mode
+                return
+            self.cancel_search()
+        
+        if self.solver is None:
+            self.solver = SokobanSolver(self.levels[self.current_level], self.tables)
+        boxes = [self.tables.to_index(x, y) for x, y in self.boxes]
+        player = self.tables.to_index(*self.player_pos)
+        self.search = BackgroundSearch(self.solver, boxes, player, SEARCH_TIME_LIMIT)
+        self.search_mode = mode
+        self.search_state = key
+        self.status_message = "Thinking... (any key cancels)"
+    
+    def cancel_search(self):
+        """Stop a running background search"""
+        if self.search is not None:
+            self.search.cancel()
+            self.search = None
+            self.status_message = ""
+    
+    def poll_search(self):
+        """Pick up a finished background search"""
+        if self.search is None or not self.search.done:
+            return
+        result = self.search.result
+        self.search = None
+        if self.search_state != self.state_key():
+            return  # state changed while searching
+        
+        if result.solved:
+            self.remember_solution(result.lurd)
+            self.status_message = ""
+            self.start_playback(result.lurd, self.search_mode)
+        else:
+            if result.reason in ('no solution', 'deadlock'):
+                self.solution_cache[self.search_state] = None
+                self.status_message = f"No solution found ({result.reason})"
+            else:
+                self.status_message = f"No solution yet ({result.reason}) - H/Z keeps searching"
+    
+    def remember_solution(self, lurd):
+        """Cache the remaining solution for every state along the path"""
+        player = tuple(self.player_pos)
+        boxes = set(self.boxes)
+        for i, move in enumerate(lurd):
+            self.solution_cache[(player, frozenset(boxes))] = lurd[i:]
+            dx, dy = LURD_STEPS[move.lower()]
+            player = (player[0] + dx, player[1] + dy)
+            if player in boxes:
+                boxes.remove(player)
+                boxes.add((player[0] + dx, player[1] + dy))
+        self.solution_cache[(player, frozenset(boxes))] = ''
+    
+    def start_playback(self, lurd, mode):
+        """Queue moves to animate: the next push for a hint, everything to solve"""
+        if lurd is None:
+            self.status_message = "No solution from here - press U to undo"
+            return
+        if mode == 'hint':
+            pushes = [i for i, move in enumerate(lurd) if move.isupper()]
+            if pushes:
+                lurd = lurd[:pushes[0] + 1]
+        self.playback = deque(lurd)
+    
+    def play_next_move(self):
+        """Animate one queued solution step"""
+        dx, dy = LURD_STEPS[self.playback.popleft().lower()]
+        if not self.move_player(dx, dy):
+            self.playback.clear()
+    
     def check_win(self):
         """Check if all boxes are on targets"""
         return self.boxes == self.targets
@@ -250,7 +403,7 @@ class Sokoban:
     
     def next_level(self):
         """Load next level"""
-        if self.current_level < len(LEVELS) - 1:
+        if self.current_level < len(self.levels) - 1:
             return self.load_level(self.current_level + 1)
         return False
     
@@ -265,7 +418,7 @@ class Sokoban:
         
         # Draw stats
         stats_y = 3
-        stats = f"Level: {self.current_level + 1}/{len(LEVELS)}  Moves: {self.moves}  Pushes: {self.pushes}"
+        stats = f"Level: {self.current_level + 1}/{len(self.levels)}  Moves: {self.moves}  Pushes: {self.pushes}"
         self.stdscr.addstr(stats_y, (width - len(stats)) // 2, stats)
         
         # Calculate board position
@@ -323,8 +476,8 @@ class Sokoban:
         # Draw instructions
         inst_y = start_y + board_height + 2
         instructions = [
-            "↑↓←→/WASD: Move  U: Undo  R: Restart",
-            "N: Next Level  Q: Quit"
+            "↑↓←→/WASD: Move  U: Undo  Y: Redo  R: Restart",
+            "H: Hint  Z: Solve  N: Next Level  Q: Quit"
         ]
         
         for i, inst in enumerate(instructions):
@@ -333,10 +486,27 @@ class Sokoban:
             except:
                 pass
         
+        # Hint / solver status
+        if self.status_message:
+            try:
+                self.stdscr.addstr(inst_y + 2, (width - len(self.status_message)) // 2,
+                                 self.status_message, curses.A_DIM)
+            except:
+                pass
+        
+        # Warn about an unsolvable position right away
+        if self.deadlocked:
+            msg = "⚠ Deadlock! A box can't reach a target - press U to undo"
+            try:
+                self.stdscr.addstr(inst_y + 3, (width - len(msg)) // 2, msg,
+                                 curses.color_pair(6) | curses.A_BOLD)
+            except:
+                pass
+        
         # Check win
         if self.check_win():
             msg = "★ LEVEL COMPLETE! ★"
-            if self.current_level < len(LEVELS) - 1:
+            if self.current_level < len(self.levels) - 1:
                 msg2 = "Press N for next level"
             else:
                 msg2 = "🎉 YOU WIN ALL LEVELS! 🎉"
@@ -354,16 +524,42 @@ class Sokoban:
         while True:
             self.draw_board()
             
+            # Poll instead of blocking while searching or animating
+            busy = self.search is not None or self.playback
+            self.stdscr.timeout(ANIMATION_DELAY_MS if busy else -1)
+            
             # Get input
             try:
                 key = self.stdscr.getch()
             except:
                 continue
             
+            self.poll_search()
+            if key == -1:
+                if self.playback:
+                    self.play_next_move()
+                continue
+            
+            # Any key stops a running animation or search
+            if self.playback:
+                self.playback.clear()
+                continue
+            if self.search is not None and key not in [ord('h'), ord('H'), ord('z'), ord('Z')]:
+                self.cancel_search()
+                continue
+            
             # Handle quit
             if key in [ord('q'), ord('Q')]:
                 break
             
+            # Handle hint / solve from here
+            if key in [ord('h'), ord('H')]:
+                self.request_solution('hint')
+                continue
+            if key in [ord('z'), ord('Z')]:
+                self.request_solution('solve')
+                continue
+            
             # Handle restart
             if key in [ord('r'), ord('R')]:
                 self.restart_level()
@@ -377,10 +573,13 @@ class Sokoban:
                         pass
                 continue
             
-            # Handle undo
+            # Handle undo / redo
             if key in [ord('u'), ord('U')]:
                 self.undo()
                 continue
+            if key in [ord('y'), ord('Y')]:
+                self.redo()
+                continue
             
             # Handle movement
             dx, dy = 0, 0
@@ -394,16 +593,30 @@ class Sokoban:
                 dx = 1
             
             if dx != 0 or dy != 0:
+                self.status_message = ""
                 self.move_player(dx, dy)
 
-def main(stdscr=None):
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Sokoban - Box Pushing Puzzle")
+    parser.add_argument("--pack", metavar="FILE",
+                        help="play levels from an XSB/SOK level collection")
+    parser.add_argument("--level", type=int, default=1,
+                        help="level number to start at (default: 1)")
+    return parser.parse_args(argv)
+
+def main(stdscr=None, levels=None, start_level=0):
     """Entry point for the game"""
     if stdscr is None:
         from curses import wrapper
-        wrapper(main)
+        wrapper(main, levels=levels, start_level=start_level)
     else:
-        game = Sokoban(stdscr)
+        game = Sokoban(stdscr, levels, start_level)
         game.run()
 
 if __name__ == "__main__":
-    main()
+    args = parse_args()
+    pack = LevelPack(args.pack) if args.pack else None
+    if pack is not None and not len(pack):
+        sys.exit(f"No levels found in {args.pack}")
+    main(levels=pack, start_level=args.level - 1)
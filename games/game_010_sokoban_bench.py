@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Game 010: Sokoban - Solver Benchmark
+Run the solver headlessly over every level of a pack in worker processes.
+
+Each level is solved with a per-level time limit. One CSV row per level
+records whether it was solved, the solution length, the nodes expanded,
+the peak Python heap used by the search (via tracemalloc) and the time.
+The results can be compared against a stored baseline CSV. Levels that
+stopped solving, or that got much slower or expanded many more nodes,
+are reported as regressions and make the command exit with status 1.
+
+Usage:
+    python games/game_010_sokoban_bench.py                    # bundled levels vs baseline
+    python games/game_010_sokoban_bench.py pack.xsb -t 30 -o pack.csv
+    python games/game_010_sokoban_bench.py --update-baseline  # record a new baseline
+"""
+
+import argparse
+import csv
+import multiprocessing
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from games.game_010_sokoban_solver import SokobanSolver, SolveResult
+
+FIELDS = ('pack', 'level', 'title', 'solved', 'reason', 'pushes', 'moves',
+          'nodes', 'peak_kb', 'time_ms')
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                'benchmarks', 'sokoban_baseline.csv')
+DEFAULT_TIME_LIMIT = 10.0
+NODE_TOLERANCE = 1.10     # flag node counts more than 10% above the baseline
+TIME_TOLERANCE = 2.0      # flag times more than 2x the baseline ...
+MIN_TIME_DELTA_MS = 50.0  # ... but only when the difference is noticeable
+
+
+def bench_level(task):
+    """Solve one level and return its CSV row as a dict
+
+    A level the solver cannot handle (malformed pack entry, ...) gives an
+    unsolved row with the error as the reason instead of ending the run.
+    """
+    pack, number, title, rows, algorithm, time_limit, track_memory = task
+    if track_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        result = SokobanSolver(rows).solve(algorithm=algorithm, time_limit=time_limit)
+    except Exception as error:
+        result = SolveResult(False, reason=f"error: {type(error).__name__}: {error}")
+    finally:
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1] if track_memory else None
+        if track_memory:
+            tracemalloc.stop()
+
+    return {
+        'pack': pack,
+        'level': number,
+        'title': title,
+        'solved': int(result.solved),
+        'reason': result.reason or '',
+        'pushes': result.pushes if result.solved else '',
+        'moves': result.moves if result.solved else '',
+        'nodes': result.nodes,
+        'peak_kb': '' if peak is None else peak // 1024,
+        'time_ms': round(elapsed * 1000, 2),
+    }
+
+
+def level_tasks(path=None, levels=None, algorithm='astar', time_limit=DEFAULT_TIME_LIMIT,
+                track_memory=True):
+    """Yield bench_level tasks for a pack file (or the bundled levels)"""
+    if path:
+        from games.game_010_sokoban_levels import LevelPack
+        pack = LevelPack(path)
+        name = pack.name
+        titles = pack.title
+    else:
+        from games.game_010_sokoban import LEVELS as pack
+        name = 'bundled'
+        titles = lambda number: f"Level {number + 1}"
+
+    numbers = [n - 1 for n in levels] if levels else range(len(pack))
+    for number in numbers:
+        yield (name, number + 1, titles(number), pack[number], algorithm, time_limit,
+               track_memory)
+
+
+def run_bench(tasks, workers=None):
+    """Yield result rows as levels finish (in completion order)"""
+    if workers == 1:
+        for task in tasks:
+            yield bench_level(task)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    with multiprocessing.Pool(workers) as pool:
+        for row in pool.imap_unordered(bench_level, tasks):
+            yield row
+
+
+def read_csv(path):
+    """Load a results CSV into {(pack, level): row}"""
+    with open(path, newline='') as f:
+        return {(row['pack'], int(row['level'])): row for row in csv.DictReader(f)}
+
+
+def write_csv(path, rows):
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def compare(rows, baseline):
+    """Return a list of regression messages for rows against a baseline dict"""
+    problems = []
+    for row in rows:
+        base = baseline.get((row['pack'], int(row['level'])))
+        if base is None:
+            continue
+        label = f"{row['pack']} #{row['level']}"
+        if int(base['solved']) and not int(row['solved']):
+            problems.append(f"{label}: no longer solved ({row['reason']})")
+            continue
+        if not int(row['solved']):
+            continue
+        if base['pushes'] and int(row['pushes']) > int(base['pushes']):
+            problems.append(f"{label}: pushes {base['pushes']} -> {row['pushes']}")
+        if int(row['nodes']) > int(base['nodes']) * NODE_TOLERANCE:
+            problems.append(f"{label}: nodes {base['nodes']} -> {row['nodes']}")
+        old_ms = float(base['time_ms'])
+        new_ms = float(row['time_ms'])
+        if new_ms > old_ms * TIME_TOLERANCE and new_ms - old_ms > MIN_TIME_DELTA_MS:
+            problems.append(f"{label}: time {old_ms:.1f}ms -> {new_ms:.1f}ms")
+    return problems
+
+
+def summarize(rows, elapsed):
+    """Build a short text summary of a benchmark run"""
+    if not rows:
+        return "No levels run"
+    solved = [row for row in rows if int(row['solved'])]
+    total_ms = sum(float(row['time_ms']) for row in rows)
+    return (f"Solved {len(solved)}/{len(rows)}  nodes {sum(int(r['nodes']) for r in rows)}  "
+            f"solver time {total_ms / 1000:.2f}s  wall time {elapsed:.2f}s")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Sokoban solver over a level pack")
+    parser.add_argument("pack", nargs="?", default=None,
+                        help="XSB/SOK pack file (default: the bundled levels)")
+    parser.add_argument("-l", "--levels", type=int, nargs="+", help="level numbers (1-based)")
+    parser.add_argument("-t", "--time-limit", type=float, default=DEFAULT_TIME_LIMIT,
+                        help="seconds per level")
+    parser.add_argument("--ida", action="store_true", help="use IDA* instead of A*")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="worker processes (default: CPU count, 1 = no pool)")
+    parser.add_argument("--no-memory", action="store_true",
+                        help="skip tracemalloc peak memory (faster solves)")
+    parser.add_argument("-o", "--output", default=None, help="write the results CSV here")
+    parser.add_argument("-b", "--baseline", default=DEFAULT_BASELINE,
+                        help="baseline CSV to compare against")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="overwrite the baseline with these results")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    algorithm = 'ida' if args.ida else 'astar'
+    tasks = level_tasks(args.pack, args.levels, algorithm, args.time_limit, not args.no_memory)
+
+    rows = []
+    start = time.perf_counter()
+    try:
+        for row in run_bench(tasks, args.workers):
+            status = "ok" if int(row['solved']) else row['reason']
+            print(f"{row['pack']} #{row['level']:<5} {status:<10} {row['nodes']:>9} nodes  "
+                  f"{row['time_ms']:>9.1f}ms  {row['peak_kb'] or '-':>7} KB")
+            rows.append(row)
+    except KeyboardInterrupt:
+        pass
+    rows.sort(key=lambda row: (row['pack'], row['level']))
+    print(summarize(rows, time.perf_counter() - start))
+
+    if args.output:
+        write_csv(args.output, rows)
+    if args.update_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        write_csv(args.baseline, rows)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        return 0
+    problems = compare(rows, read_csv(args.baseline))
+    for problem in problems:
+        print(f"REGRESSION {problem}")
+    if not problems:
+        print(f"No regressions against {os.path.relpath(args.baseline)}")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Game 010: Sokoban - Level Packs
+Lazy loader for standard XSB / SOK level collections.
+
+A pack is a text file with levels separated by blank lines, comments
+(';' lines) or metadata ("Title: ..."). Rows may be run-length encoded
+("4#" = "####", '|' separates rows) and may use '-' or '_' for floor.
+
+On first open the file is scanned once to build an index of
+(byte offset, length, title) per level. The index is written next to the
+pack as <pack>.idx (or to .cache/sokoban-packs if that directory is
+read-only), so reopening a 10k-level collection is just a JSON load, and
+each level is only read and parsed when it is requested.
+
+Usage:
+    python games/game_010_sokoban_levels.py pack.xsb         # list levels
+    python games/game_010_sokoban_levels.py pack.xsb 42      # show level 42
+"""
+
+import json
+import os
+import re
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.cache import cache_file, content_key, write_atomic
+
+INDEX_VERSION = 1
+LEVEL_CHARS = frozenset(b'#@+$*.-_ |0123456789')
+RLE_TOKEN = re.compile(r'(\d+)(.)')
+
+
+def decode_row(line):
+    """Expand one (possibly run-length encoded) row into game rows"""
+    if any(c.isdigit() for c in line):
+        line = RLE_TOKEN.sub(lambda m: m.group(2) * int(m.group(1)), line)
+    rows = line.split('|')
+    return [row.replace('-', ' ').replace('_', ' ').rstrip() for row in rows]
+
+
+def is_level_line(line):
+    """True for a raw (bytes) line that belongs to a level map"""
+    stripped = line.rstrip(b'\r\n')
+    return b'#' in stripped and all(c in LEVEL_CHARS for c in stripped)
+
+
+def scan_pack(f):
+    """Build the level index of an open binary file: [[offset, length, title], ...]"""
+    index = []
+    offset = 0
+    start = None
+    comment = None
+    for line in f:
+        if is_level_line(line):
+            if start is None:
+                start = offset
+                index.append([start, 0, comment])
+                comment = None
+            index[-1][1] = offset + len(line) - start
+        else:
+            start = None
+            text = line.strip().decode('utf-8', 'replace')
+            if text.lower().startswith('title:'):
+                # Title line after the map names the previous level
+                if index:
+                    index[-1][2] = text[6:].strip()
+            elif text.startswith(';'):
+                comment = text.lstrip('; ').strip() or None
+        offset += len(line)
+
+    for number, entry in enumerate(index, 1):
+        if not entry[2]:
+            entry[2] = f"Level {number}"
+    return index
+
+
+class LevelPack:
+    """Sequence of levels from an XSB/SOK file, parsed on demand"""
+
+    def __init__(self, path, use_index_cache=True):
+        self.path = path
+        self.name = os.path.splitext(os.path.basename(path))[0]
+        self._parsed = {}
+        self.index = self._load_index() if use_index_cache else None
+        if self.index is None:
+            with open(path, 'rb') as f:
+                self.index = scan_pack(f)
+            if use_index_cache:
+                self._save_index()
+
+    # ----- index cache -------------------------------------------------
+
+    def _signature(self):
+        stat = os.stat(self.path)
+        return [INDEX_VERSION, stat.st_size, stat.st_mtime_ns]
+
+    def _index_paths(self):
+        """Preferred location (next to the pack) and the fallback cache path"""
+        fallback = cache_file('sokoban-packs', content_key(os.path.abspath(self.path)) + '.idx')
+        return [self.path + '.idx'] + ([fallback] if fallback else [])
+
+    def _load_index(self):
+        signature = self._signature()
+        for path in self._index_paths():
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if data.get('signature') == signature:
+                return data['levels']
+        return None
+
+    def _save_index(self):
+        payload = json.dumps({'signature': self._signature(), 'levels': self.index},
+                             separators=(',', ':')).encode('utf-8')
+        for path in self._index_paths():
+            try:
+                write_atomic(path, payload)
+                return path
+            except OSError:
+                continue
+        return None
+
+    # ----- level access ------------------------------------------------
+
+    def __len__(self):
+        return len(self.index)
+
+    def __getitem__(self, number):
+        """Level rows for a 0-based level number (parsed on first access)"""
+        if number < 0:
+            number += len(self.index)
+        if not 0 <= number < len(self.index):
+            raise IndexError(f"{self.name} has {len(self.index)} levels")
+        rows = self._parsed.get(number)
+        if rows is None:
+            rows = self._parse(number)
+            self._parsed[number] = rows
+        return rows
+
+    def __iter__(self):
+        for number in range(len(self.index)):
+            yield self[number]
+
+    def title(self, number):
+        return self.index[number][2]
+
+    def _parse(self, number):
+        offset, length, _ = self.index[number]
+        with open(self.path, 'rb') as f:
+            f.seek(offset)
+            raw = f.read(length)
+        rows = []
+        for line in raw.decode('utf-8', 'replace').splitlines():
+            rows.extend(decode_row(line))
+        return [row for row in rows if row]
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        print("Usage: game_010_sokoban_levels.py PACK [LEVEL]")
+        return
+    pack = LevelPack(argv[0])
+    if len(argv) > 1:
+        number = int(argv[1]) - 1
+        print(pack.title(number))
+        print("\n".join(pack[number]))
+    else:
+        for number in range(len(pack)):
+            print(f"{number + 1:5d}  {pack.title(number)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,513 @@
+#!/usr/bin/env python3
+"""
+Game 010: Sokoban - Solver
+Push-level A* / IDA* search for the levels in game_010_sokoban.LEVELS.
+
+The board is flattened to padded cell indexes (see LevelTables). A search state is the
+set of box cells plus the player's reachable region, represented by its
+smallest cell index. States are hashed with Zobrist keys that are updated
+incrementally on every push.
+
+Pruning:
+- simple deadlocks: a box is never pushed onto a cell from which no target
+  can be reached (found by pulling boxes backwards from every target)
+- freeze deadlocks: a pushed box that can no longer move on either axis
+  (walls, dead cells or other frozen boxes) while off a target
+Heuristic: minimum-cost matching of boxes to targets using push distances,
+which never overestimates the pushes left.
+Reuse: a solver keeps heuristic values by box set, and an A* search stopped
+by a time/node limit or cancel is saved under its start state, so asking
+again from that state continues the search instead of starting over.
+Dead cells and push distances come from the cached per-level tables in
+game_010_sokoban_tables.
+
+Usage:
+    python games/game_010_sokoban_solver.py            # solve all bundled levels
+    python games/game_010_sokoban_solver.py 3 --ida    # level 3 with IDA*
+"""
+
+import argparse
+import heapq
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from games.game_010_sokoban_tables import load_tables, UNREACHABLE
+
+# (dx, dy, move char) - pushes are written in upper case (LURD notation)
+DIRECTIONS = ((0, -1, 'u'), (0, 1, 'd'), (-1, 0, 'l'), (1, 0, 'r'))
+ZOBRIST_SEED = 0x50C0BA
+SAVED_SEARCHES = 4          # interrupted A* searches kept per solver
+HEURISTIC_MEMO_LIMIT = 2000000
+
+
+def min_cost_matching(cost):
+    """Hungarian algorithm: minimum total cost of assigning rows to columns"""
+    n = len(cost)
+    m = len(cost[0]) if n else 0
+    u = [0] * (n + 1)
+    v = [0] * (m + 1)
+    p = [0] * (m + 1)
+    way = [0] * (m + 1)
+    for i in range(1, n + 1):
+        p[0] = i
+        j0 = 0
+        minv = [UNREACHABLE * (n + 1)] * (m + 1)
+        used = [False] * (m + 1)
+        while True:
+            used[j0] = True
+            i0 = p[j0]
+            row = cost[i0 - 1]
+            delta = UNREACHABLE * (n + 1)
+            j1 = 0
+            for j in range(1, m + 1):
+                if not used[j]:
+                    cur = row[j - 1] - u[i0] - v[j]
+                    if cur < minv[j]:
+                        minv[j] = cur
+                        way[j] = j0
+                    if minv[j] < delta:
+                        delta = minv[j]
+                        j1 = j
+            for j in range(m + 1):
+                if used[j]:
+                    u[p[j]] += delta
+                    v[j] -= delta
+                else:
+                    minv[j] -= delta
+            j0 = j1
+            if p[j0] == 0:
+                break
+        while j0:
+            j1 = way[j0]
+            p[j0] = p[j1]
+            j0 = j1
+    return -v[0]
+
+
+class SolveResult:
+    """Outcome of a solver run"""
+
+    def __init__(self, solved, lurd='', nodes=0, elapsed=0.0, reason=''):
+        self.solved = solved
+        self.lurd = lurd
+        self.nodes = nodes
+        self.elapsed = elapsed
+        self.reason = reason
+
+    @property
+    def moves(self):
+        return len(self.lurd)
+
+    @property
+    def pushes(self):
+        return sum(1 for c in self.lurd if c.isupper())
+
+    def __repr__(self):
+        if not self.solved:
+            return f"SolveResult(unsolved: {self.reason}, nodes={self.nodes})"
+        return (f"SolveResult(pushes={self.pushes}, moves={self.moves}, "
+                f"nodes={self.nodes}, elapsed={self.elapsed:.3f}s)")
+
+
+class AStarSearch:
+    """Open list, closed set and parent links of one A* search
+
+    Kept when a search is interrupted so it can be resumed later.
+    """
+
+    def __init__(self, start_key, start_hash, boxes, player, h):
+        self.parents = {start_key: None}  # state key -> (parent key, box, direction)
+        self.best_g = {start_key: 0}
+        self.counter = 0
+        self.open_heap = [(h, h, 0, 0, start_key, start_hash, boxes, player)]
+        self.closed = set()
+
+
+class SokobanSolver:
+    """Solver for one level layout (walls and targets are fixed)"""
+
+    def __init__(self, rows, tables=None):
+        self.tables = tables or load_tables(rows)
+        tables = self.tables
+        self.width = tables.width
+        self.size = tables.size
+        self.offsets = tables.offsets
+        self.floor = tables.floor
+        self.dead = tables.dead
+        self.distances = tables.distances
+        self.targets = tables.target_set
+
+        boxes = []
+        player = None
+        for y, row in enumerate(rows):
+            for x, char in enumerate(row):
+                if char in '@+':
+                    player = tables.to_index(x, y)
+                if char in '$*':
+                    boxes.append(tables.to_index(x, y))
+        self.start_player = player
+        self.start_boxes = frozenset(boxes)
+
+        rng = random.Random(ZOBRIST_SEED)
+        self.box_keys = [rng.getrandbits(64) for _ in range(self.size)]
+        self.player_keys = [rng.getrandbits(64) for _ in range(self.size)]
+
+        # Shared by every search on this level: box hash -> heuristic, and
+        # interrupted A* searches by start state key (oldest first)
+        self.heuristic_memo = {}
+        self.saved_searches = {}
+
+    def to_index(self, x, y):
+        """Game (x, y) -> solver cell index"""
+        return self.tables.to_index(x, y)
+
+    def to_xy(self, pos):
+        """Solver cell index -> game (x, y)"""
+        return self.tables.to_xy(pos)
+
+    # ----- search helpers ----------------------------------------------
+
+    def reachable(self, player, boxes):
+        """Return (visited bytearray, normalized player cell)"""
+        floor = self.floor
+        offsets = self.offsets
+        visited = bytearray(self.size)
+        visited[player] = 1
+        stack = [player]
+        low = player
+        while stack:
+            pos = stack.pop()
+            for offset in offsets:
+                nxt = pos + offset
+                if floor[nxt] and not visited[nxt] and nxt not in boxes:
+                    visited[nxt] = 1
+                    if nxt < low:
+                        low = nxt
+                    stack.append(nxt)
+        return visited, low
+
+    def heuristic(self, boxes, box_hash=None):
+        """Admissible lower bound on pushes left (UNREACHABLE if hopeless)
+
+        With box_hash given the value is memoized for later searches.
+        """
+        if box_hash is not None:
+            h = self.heuristic_memo.get(box_hash)
+            if h is None:
+                if len(self.heuristic_memo) >= HEURISTIC_MEMO_LIMIT:
+                    self.heuristic_memo.clear()
+                h = self.heuristic_memo[box_hash] = self.heuristic(boxes)
+            return h
+        if len(boxes) == 1:
+            box = next(iter(boxes))
+            return min(dist[box] for dist in self.distances)
+        cost = [[dist[box] for dist in self.distances] for box in boxes]
+        return min_cost_matching(cost)
+
+    def boxes_hash(self, boxes):
+        h = 0
+        for box in boxes:
+            h ^= self.box_keys[box]
+        return h
+
+    def successors(self, boxes, player):
+        """Yield (box, direction index, new boxes) for every legal, live push"""
+        visited, _ = self.reachable(player, boxes)
+        floor = self.floor
+        dead = self.dead
+        for box in boxes:
+            for direction, offset in enumerate(self.offsets):
+                dest = box + offset
+                if (not visited[box - offset] or not floor[dest]
+                        or dead[dest] or dest in boxes):
+                    continue
+                new_boxes = (boxes - {box}) | {dest}
+                if dest not in self.targets and self.tables.is_freeze_deadlock(new_boxes, dest):
+                    continue
+                yield box, direction, new_boxes
+
+    # ----- search ------------------------------------------------------
+
+    def solve(self, boxes=None, player=None, algorithm='astar',
+              time_limit=None, max_nodes=None, cancel=None):
+        """Solve from the start position (or the given boxes/player cells)
+
+        The search gives up after time_limit seconds, max_nodes expanded
+        states, or as soon as cancel (a threading.Event) is set; an A*
+        search stopped that way is resumed by the next solve() from the same
+        state.
+        """
+        boxes = self.start_boxes if boxes is None else frozenset(boxes)
+        player = self.start_player if player is None else player
+        start = time.perf_counter()
+        self._deadline = start + time_limit if time_limit else None
+        self._max_nodes = max_nodes
+        self._cancel = cancel
+
+        if player is None:
+            return SolveResult(False, reason='no player')
+        if len(boxes) != len(self.targets):
+            return SolveResult(False, reason='box/target count mismatch')
+        if any(self.dead[box] for box in boxes):
+            return SolveResult(False, reason='deadlock')
+
+        if algorithm == 'ida':
+            pushes, nodes, reason = self._ida_star(boxes, player)
+        else:
+            pushes, nodes, reason = self._a_star(boxes, player)
+
+        elapsed = time.perf_counter() - start
+        if pushes is None:
+            return SolveResult(False, nodes=nodes, elapsed=elapsed, reason=reason)
+        return SolveResult(True, self.pushes_to_lurd(boxes, player, pushes), nodes, elapsed)
+
+    def _stop_reason(self, nodes):
+        """Why the search has to stop after this many nodes ('' = keep going)"""
+        if self._max_nodes and nodes >= self._max_nodes:
+            return 'node limit'
+        if (nodes & 0x3F) == 0:
+            if self._cancel is not None and self._cancel.is_set():
+                return 'cancelled'
+            if self._deadline and time.perf_counter() >= self._deadline:
+                return 'time limit'
+        return ''
+
+    def _a_star(self, boxes, player):
+        """A* over push states, returns (push list, nodes, reason)
+
+        nodes counts the states expanded by this call; an interrupted search
+        is saved and resumed by the next call from the same start state.
+        """
+        targets = self.targets
+        _, low = self.reachable(player, boxes)
+        start_hash = self.boxes_hash(boxes)
+        start_key = start_hash ^ self.player_keys[low]
+        search = self.saved_searches.pop(start_key, None)
+        if search is None:
+            h = self.heuristic(boxes, start_hash)
+            if h >= UNREACHABLE:
+                return None, 0, 'deadlock'
+            search = AStarSearch(start_key, start_hash, boxes, player, h)
+
+        parents = search.parents
+        best_g = search.best_g
+        open_heap = search.open_heap
+        closed = search.closed
+        nodes = 0
+
+        while open_heap:
+            _, _, _, g, key, box_hash, boxes, player = heapq.heappop(open_heap)
+            if key in closed:
+                continue
+            closed.add(key)
+            nodes += 1
+
+            if boxes == targets:
+                return self._collect_pushes(parents, key), nodes, ''
+
+            for box, direction, new_boxes in self.successors(boxes, player):
+                dest = box + self.offsets[direction]
+                new_hash = box_hash ^ self.box_keys[box] ^ self.box_keys[dest]
+                _, low = self.reachable(box, new_boxes)
+                new_key = new_hash ^ self.player_keys[low]
+                if new_key in closed:
+                    continue
+                new_g = g + 1
+                if new_g >= best_g.get(new_key, UNREACHABLE):
+                    continue
+                h = self.heuristic(new_boxes, new_hash)
+                if h >= UNREACHABLE:
+                    continue
+                best_g[new_key] = new_g
+                parents[new_key] = (key, box, direction)
+                search.counter += 1
+                heapq.heappush(open_heap, (new_g + h, h, search.counter, new_g, new_key,
+                                           new_hash, new_boxes, box))
+
+            # Checked once the state is fully expanded, so the saved search
+            # is consistent and resumes where it left off
+            reason = self._stop_reason(nodes)
+            if reason:
+                self._save_search(start_key, search)
+                return None, nodes, reason
+
+        return None, nodes, 'no solution'
+
+    def _save_search(self, start_key, search):
+        """Keep an interrupted search, dropping the oldest beyond SAVED_SEARCHES"""
+        self.saved_searches[start_key] = search
+        while len(self.saved_searches) > SAVED_SEARCHES:
+            del self.saved_searches[next(iter(self.saved_searches))]
+
+    def _collect_pushes(self, parents, key):
+        pushes = []
+        while parents[key] is not None:
+            key, box, direction = parents[key]
+            pushes.append((box, direction))
+        pushes.reverse()
+        return pushes
+
+    def _ida_star(self, boxes, player):
+        """IDA* over push states, returns (push list, nodes, reason)"""
+        targets = self.targets
+        h = self.heuristic(boxes)
+        if h >= UNREACHABLE:
+            return None, 0, 'deadlock'
+
+        threshold = h
+        nodes = 0
+        path = []
+
+        class Abort(Exception):
+            pass
+
+        def search(boxes, player, box_hash, g, seen):
+            nonlocal nodes
+            nodes += 1
+            reason = self._stop_reason(nodes)
+            if reason:
+                raise Abort(reason)
+
+            h = self.heuristic(boxes)
+            f = g + h
+            if f > threshold:
+                return f
+            if boxes == targets:
+                return True
+
+            _, low = self.reachable(player, boxes)
+            key = box_hash ^ self.player_keys[low]
+            if seen.get(key, UNREACHABLE) <= g:
+                return UNREACHABLE
+            seen[key] = g
+
+            minimum = UNREACHABLE
+            for box, direction, new_boxes in self.successors(boxes, player):
+                dest = box + self.offsets[direction]
+                new_hash = box_hash ^ self.box_keys[box] ^ self.box_keys[dest]
+                path.append((box, direction))
+                result = search(new_boxes, box, new_hash, g + 1, seen)
+                if result is True:
+                    return True
+                path.pop()
+                if result < minimum:
+                    minimum = result
+            return minimum
+
+        box_hash = self.boxes_hash(boxes)
+        try:
+            while True:
+                result = search(boxes, player, box_hash, 0, {})
+                if result is True:
+                    return list(path), nodes, ''
+                if result >= UNREACHABLE:
+                    return None, nodes, 'no solution'
+                threshold = result
+        except Abort as error:
+            return None, nodes, str(error)
+
+    # ----- solution output ---------------------------------------------
+
+    def walk_path(self, start, goal, boxes):
+        """Shortest player walk (lowercase LURD) from start to goal, or None"""
+        if start == goal:
+            return ''
+        floor = self.floor
+        came_from = {start: None}
+        queue = [start]
+        head = 0
+        while head < len(queue):
+            pos = queue[head]
+            head += 1
+            for direction, offset in enumerate(self.offsets):
+                nxt = pos + offset
+                if floor[nxt] and nxt not in boxes and nxt not in came_from:
+                    came_from[nxt] = (pos, direction)
+                    if nxt == goal:
+                        steps = []
+                        while came_from[nxt] is not None:
+                            nxt, step = came_from[nxt]
+                            steps.append(DIRECTIONS[step][2])
+                        return ''.join(reversed(steps))
+                    queue.append(nxt)
+        return None
+
+    def pushes_to_lurd(self, boxes, player, pushes):
+        """Expand a push list into a full LURD move string"""
+        boxes = set(boxes)
+        moves = []
+        for box, direction in pushes:
+            offset = self.offsets[direction]
+            moves.append(self.walk_path(player, box - offset, boxes))
+            moves.append(DIRECTIONS[direction][2].upper())
+            boxes.remove(box)
+            boxes.add(box + offset)
+            player = box
+        return ''.join(moves)
+
+
+class BackgroundSearch:
+    """Run SokobanSolver.solve in a daemon thread so a UI can keep polling
+
+    result stays None until the search finishes; cancel() makes it stop at
+    the next limit check and report reason 'cancelled'. cancel() waits
+    briefly for the thread so its partial search is saved before the solver
+    is used again.
+    """
+
+    def __init__(self, solver, boxes, player, time_limit=None, algorithm='astar'):
+        self.cancel_event = threading.Event()
+        self.result = None
+        self.thread = threading.Thread(
+            target=self._run, args=(solver, boxes, player, time_limit, algorithm), daemon=True)
+        self.thread.start()
+
+    def _run(self, solver, boxes, player, time_limit, algorithm):
+        self.result = solver.solve(boxes, player, algorithm=algorithm,
+                                   time_limit=time_limit, cancel=self.cancel_event)
+
+    @property
+    def done(self):
+        return self.result is not None
+
+    def cancel(self, wait=1.0):
+        self.cancel_event.set()
+        self.thread.join(wait)
+
+
+def solve_level(level, **kwargs):
+    """Solve one level (list of row strings)"""
+    return SokobanSolver(level).solve(**kwargs)
+
+
+def main(argv=None):
+    from games.game_010_sokoban import LEVELS
+
+    parser = argparse.ArgumentParser(description="Solve the bundled Sokoban levels")
+    parser.add_argument("levels", nargs="*", type=int, help="level numbers (1-based, default: all)")
+    parser.add_argument("--ida", action="store_true", help="use IDA* instead of A*")
+    parser.add_argument("--time-limit", type=float, default=None, help="seconds per level")
+    parser.add_argument("-v", "--verbose", action="store_true", help="print the LURD solutions")
+    args = parser.parse_args(argv)
+
+    numbers = args.levels or range(1, len(LEVELS) + 1)
+    algorithm = 'ida' if args.ida else 'astar'
+    print(f"{'Level':>5}  {'Pushes':>6}  {'Moves':>5}  {'Nodes':>7}  {'Time':>8}")
+    for number in numbers:
+        result = solve_level(LEVELS[number - 1], algorithm=algorithm, time_limit=args.time_limit)
+        if result.solved:
+            print(f"{number:5d}  {result.pushes:6d}  {result.moves:5d}  {result.nodes:7d}  "
+                  f"{result.elapsed * 1000:6.1f}ms")
+            if args.verbose:
+                print(f"       {result.lurd}")
+        else:
+            print(f"{number:5d}  unsolved ({result.reason}), {result.nodes} nodes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""
+Game 010: Sokoban - Level Tables
+Static per-level data shared by the game, the solver and the hint feature.
+
+For a level layout this computes, once:
+- floor: cells the player can ever stand on (outside-the-wall spaces excluded)
+- dead: floor cells from which a box can never be pushed onto any target
+- distances: for every target, the pull distance (in pushes) from every cell
+Cells are flat indexes into a grid padded by one wall cell on each side,
+so index = (y + 1) * width + (x + 1) and neighbours never wrap around.
+
+Tables are memoized in-process and cached on disk under .cache/sokoban,
+keyed by a hash of the level rows.
+"""
+
+import os
+import sys
+from array import array
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.cache import cache_file, content_key, load_pickle, save_pickle
+
+TABLES_VERSION = 1
+UNREACHABLE = 0xFFFF
+
+_memo = {}
+
+
+class LevelTables:
+    """Precomputed static analysis of one Sokoban level layout"""
+
+    def __init__(self, key, width, height, floor, dead, targets, distances):
+        self.key = key
+        self.width = width
+        self.height = height
+        self.size = len(floor)
+        self.floor = floor
+        self.dead = dead
+        self.targets = targets
+        self.target_set = frozenset(targets)
+        self.distances = distances
+        self.offsets = (-width, width, -1, 1)
+
+    @classmethod
+    def build(cls, rows, key=None):
+        """Analyse a level given as a list of row strings"""
+        height = len(rows)
+        width = max(len(row) for row in rows) + 2
+        size = width * (height + 2)
+        offsets = (-width, width, -1, 1)
+
+        walls = bytearray(b'\x01') * size
+        targets = []
+        player = None
+        for y, row in enumerate(rows):
+            for x, char in enumerate(row):
+                pos = (y + 1) * width + x + 1
+                if char != '#':
+                    walls[pos] = 0
+                if char in '@+':
+                    player = pos
+                if char in '.*+':
+                    targets.append(pos)
+
+        # Floor = cells reachable from the player ignoring boxes
+        floor = bytearray(size)
+        if player is not None:
+            floor[player] = 1
+            stack = [player]
+            while stack:
+                pos = stack.pop()
+                for offset in offsets:
+                    nxt = pos + offset
+                    if not walls[nxt] and not floor[nxt]:
+                        floor[nxt] = 1
+                        stack.append(nxt)
+
+        # Pull boxes backwards from every target: a box can be pulled from
+        # box to box+offset when the player has room at box+2*offset.
+        distances = []
+        for target in targets:
+            dist = array('H', [UNREACHABLE]) * size
+            dist[target] = 0
+            queue = [target]
+            head = 0
+            while head < len(queue):
+                box = queue[head]
+                head += 1
+                for offset in offsets:
+                    nxt = box + offset
+                    if floor[nxt] and floor[nxt + offset] and dist[nxt] == UNREACHABLE:
+                        dist[nxt] = dist[box] + 1
+                        queue.append(nxt)
+            distances.append(dist)
+
+        dead = bytearray(size)
+        for pos in range(size):
+            if floor[pos] and all(dist[pos] == UNREACHABLE for dist in distances):
+                dead[pos] = 1
+
+        return cls(key or layout_key(rows), width, height, floor, dead, targets, distances)
+
+    # ----- coordinates -------------------------------------------------
+
+    def to_index(self, x, y):
+        """Game (x, y) -> cell index"""
+        return (y + 1) * self.width + x + 1
+
+    def to_xy(self, pos):
+        """Cell index -> game (x, y)"""
+        return (pos % self.width - 1, pos // self.width - 1)
+
+    # ----- queries -----------------------------------------------------
+
+    def is_dead(self, x, y):
+        """True if a box on (x, y) can never reach any target"""
+        return bool(self.dead[self.to_index(x, y)])
+
+    def dead_cells(self):
+        """All dead floor cells as game (x, y) tuples"""
+        return {self.to_xy(pos) for pos in range(self.size) if self.dead[pos]}
+
+    def push_distance(self, x, y):
+        """Fewest pushes from (x, y) to the nearest target (ignoring other boxes)"""
+        pos = self.to_index(x, y)
+        return min((dist[pos] for dist in self.distances), default=UNREACHABLE)
+
+    def is_freeze_deadlock(self, boxes, box):
+        """True if box (a cell index, just pushed) is frozen together with a box off-target
+
+        boxes is a set of cell indexes including box. A box is frozen when it
+        is blocked on both axes by walls, by dead cells on both sides, or by
+        other frozen boxes (checked recursively, treating this box as a wall).
+        """
+        cluster = []
+        if not self._frozen(box, boxes, set(), cluster):
+            return False
+        return any(pos not in self.target_set for pos in cluster)
+
+    def is_fatal_push(self, boxes, box):
+        """True if a box just pushed onto cell index box can never be solved"""
+        return bool(self.dead[box]) or (box not in self.target_set
+                                        and self.is_freeze_deadlock(boxes, box))
+
+    def _frozen(self, pos, boxes, blocked, cluster):
+        blocked = blocked | {pos}
+        frozen = (self._axis_blocked(pos, 1, boxes, blocked, cluster)
+                  and self._axis_blocked(pos, self.width, boxes, blocked, cluster))
+        if frozen:
+            cluster.append(pos)
+        return frozen
+
+    def _axis_blocked(self, pos, step, boxes, blocked, cluster):
+        a = pos - step
+        b = pos + step
+        floor = self.floor
+        if not floor[a] or not floor[b] or a in blocked or b in blocked:
+            return True
+        if self.dead[a] and self.dead[b]:
+            return True
+        if a in boxes and self._frozen(a, boxes, blocked, cluster):
+            return True
+        if b in boxes and self._frozen(b, boxes, blocked, cluster):
+            return True
+        return False
+
+    # ----- persistence -------------------------------------------------
+
+    def to_dict(self):
+        return {
+            'version': TABLES_VERSION,
+            'key': self.key,
+            'width': self.width,
+            'height': self.height,
+            'floor': bytes(self.floor),
+            'dead': bytes(self.dead),
+            'targets': list(self.targets),
+            'distances': [dist.tobytes() for dist in self.distances],
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        distances = []
+        for raw in data['distances']:
+            dist = array('H')
+            dist.frombytes(raw)
+            distances.append(dist)
+        return cls(data['key'], data['width'], data['height'], bytearray(data['floor']),
+                   bytearray(data['dead']), data['targets'], distances)
+
+
+def layout_key(rows):
+    """Hash of a level layout (used for the memo and the cache file name)"""
+    return content_key(f"sokoban-tables-v{TABLES_VERSION}", *rows)
+
+
+def load_tables(rows, use_cache=True):
+    """Return LevelTables for a level, from memory, disk cache or a fresh build"""
+    key = layout_key(rows)
+    tables = _memo.get(key)
+    if tables is not None:
+        return tables
+
+    path = cache_file('sokoban', f"{key}.tables") if use_cache else None
+    data = load_pickle(path) if path else None
+    if data and data.get('version') == TABLES_VERSION and data.get('key') == key:
+        tables = LevelTables.from_dict(data)
+    else:
+        tables = LevelTables.build(rows, key)
+        if path:
+            save_pickle(path, tables.to_dict())
+
+    _memo[key] = tables
+    return tables
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Test script for the fixed-timestep game loop
+Uses a fake clock so the results do not depend on machine speed
+"""
+
+from utils.game_loop import GameLoop
+
+
+class FakeClock:
+    """Clock that only moves when the loop (or the fake renderer) sleeps"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def test_fixed_steps_ignore_render_cost():
+    """The update count follows simulated time, not the number of frames"""
+    for render_cost in (0.001, 0.05):
+        clock = FakeClock()
+        steps = []
+        loop = GameLoop(steps.append, render=lambda: clock.sleep(render_cost),
+                        step=0.1, fps=30, time_scale=1.0, clock=clock, sleep=clock.sleep)
+        loop.run(until=lambda: clock.now >= 2.0)
+        assert set(steps) == {0.1}
+        assert 19 <= len(steps) <= 20
+        assert 0.0 <= loop.alpha < 1.0
+
+
+def test_time_scale_and_headless():
+    """time_scale fast-forwards; headless runs updates back to back"""
+    clock = FakeClock()
+    loop = GameLoop(lambda dt: None, step=0.1, fps=10, time_scale=4.0,
+                    clock=clock, sleep=clock.sleep)
+    loop.run(until=lambda: clock.now >= 1.0)
+    assert 36 <= loop.updates <= 40
+
+    calls = []
+    loop = GameLoop(calls.append, render=lambda: 1 / 0, step=0.5, headless=True)
+    assert loop.run(max_updates=1000) == 1000
+    assert loop.sim_time == 500.0
+    loop = GameLoop(calls.append, step=1.0, headless=True)
+    loop.run(until=lambda: len(calls) >= 1005)
+    assert len(calls) == 1005
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Test script for Pac-Man mazes and ghost pathfinding
+Checks the compiled maze, the BFS distance table (including the tunnel)
+and that ghosts follow shortest paths
+"""
+
+from games.game_006_pacman_sim import Ghost, Maze, PacMan
+from games.game_006_pacman_mazes import MAZES, parse_mazes
+
+MAZE_LAYOUT = MAZES[0]
+
+
+def find(marker):
+    return [(x, y) for y, row in enumerate(MAZE_LAYOUT) for x, cell in enumerate(row)
+            if cell == marker]
+
+
+def test_distance_table():
+    """Distances are symmetric, use the tunnel and are shared per layout"""
+    maze = Maze(MAZE_LAYOUT)
+    assert maze.distance(1, 1, 1, 1) == 0
+    assert maze.distance(1, 1, 2, 1) == 1
+    assert maze.distance(1, 1, 18, 21) == maze.distance(18, 21, 1, 1)
+    # The tunnel row wraps: both ends are neighbours
+    assert maze.distance(0, 11, 19, 11) == 1
+    assert Maze(MAZE_LAYOUT).distances is maze.distances
+
+
+def test_long_paths():
+    """Distances past 255 steps are exact (serpentine 38x27 maze)"""
+    width, height = 38, 27
+    rows = ["#" * width]
+    for y in range(1, height - 1):
+        if y % 2:
+            rows.append("#" + "." * (width - 2) + "#")
+        else:
+            gap = width - 2 if y % 4 == 2 else 1  # alternate the turn side
+            rows.append("#" * gap + "." + "#" * (width - gap - 1))
+    rows.append("#" * width)
+    rows[1] = "#P" + rows[1][2:]
+    rows[-2] = rows[-2][:-2] + "G#"
+    maze = Maze(rows)
+    steps = maze.distance(1, 1, width - 2, height - 2)
+    assert steps == (width - 2) * ((height - 1) // 2) + (height - 3) // 2 - 1
+    assert steps > 255
+    assert maze.next_direction(width - 2, height - 2, 1, 1) is not None
+
+
+def test_ghosts_take_shortest_paths():
+    """An eaten ghost gets home and a chasing ghost closes in every step"""
+    maze = Maze(MAZE_LAYOUT)
+    home = find('G')[0]
+    ghost = Ghost("Blinky", 1, *home)
+    ghost.x, ghost.y = 1, 21
+    ghost.eaten = True
+    steps = maze.distance(1, 21, *home)
+    for _ in range(steps):
+        ghost.move_to_home(maze)
+    assert (ghost.x, ghost.y) == home
+    ghost.move_to_home(maze)
+    assert not ghost.eaten
+
+    pacman = PacMan(*find('P')[0])
+    ghost.reset()
+    distance = maze.distance(ghost.x, ghost.y, pacman.x, pacman.y)
+    while distance > 0:
+        ghost.chase(pacman, maze)
+        new_distance = maze.distance(ghost.x, ghost.y, pacman.x, pacman.y)
+        assert new_distance == distance - 1
+        distance = new_distance
+
+
+def test_ghost_targets_and_modes():
+    """Each ghost has its own target tile and the scheduler pauses while frightened"""
+    from games.game_006_pacman_sim import DIRECTIONS
+    from games.game_006_pacman_ghosts import (CHASE, FRIGHTENED, SCATTER, ModeScheduler,
+                                              target_tile)
+
+    maze = Maze(MAZE_LAYOUT)
+    pacman = PacMan(1, 4)
+    pacman.direction = DIRECTIONS['RIGHT']
+    blinky, pinky, inky, clyde = (Ghost(name, 1, 9, 11)
+                                  for name in ("Blinky", "Pinky", "Inky", "Clyde"))
+    assert target_tile(blinky, CHASE, pacman, maze) == (1, 4)
+    assert target_tile(pinky, CHASE, pacman, maze) == (5, 4)
+    blinky.x, blinky.y = 1, 1
+    assert target_tile(inky, CHASE, pacman, maze, blinky) == (4, 7)  # (5, 7) is a wall
+    # Clyde chases from afar and retreats to his corner up close
+    assert target_tile(clyde, CHASE, pacman, maze) == (1, 4)
+    clyde.x, clyde.y = 2, 4
+    assert target_tile(clyde, CHASE, pacman, maze) == target_tile(clyde, SCATTER, pacman, maze)
+    # Targets off the maze or inside walls snap to a walkable cell
+    corners = {target_tile(ghost, SCATTER, pacman, maze) for ghost in (blinky, pinky, inky, clyde)}
+    assert corners == {(18, 1), (1, 1), (18, 21), (1, 21)}
+
+    modes = ModeScheduler([(SCATTER, 1.0), (CHASE, None)])
+    assert modes.mode == SCATTER
+    modes.frighten(2.0)
+    assert modes.update(1.5) is None and modes.mode == FRIGHTENED
+    assert modes.update(1.0) == SCATTER
+    assert modes.update(1.0) == CHASE
+    assert modes.update(100.0) is None
+
+
+def test_compiled_maze():
+    """Walkability, dots and start positions come from the compiled bitsets"""
+    maze = Maze(MAZE_LAYOUT)
+    assert maze.is_walkable(-1, 11) and maze.is_walkable(20, 11)  # tunnel
+    assert not maze.is_walkable(0, 0) and not maze.is_walkable(5, -1)
+    assert maze.compiled.pacman_start == find('P')[0]
+    assert maze.compiled.ghost_starts == find('G')
+    dots = sum(row.count('.') + row.count('O') for row in MAZE_LAYOUT)
+    assert maze.dots_remaining == dots == len(list(maze.dot_cells()))
+
+    assert maze.get_cell(1, 3) == 'O'
+    assert maze.eat_dot(1, 3) == (50, True)
+    assert maze.eat_dot(1, 3) == (0, False)
+    assert maze.eat_dot(1, 1) == (10, False)
+    assert maze.get_cell(1, 3) == ' ' and maze.dots_remaining == dots - 2
+    # A fresh maze from the same layout starts full again
+    assert Maze(MAZE_LAYOUT).dots_remaining == dots
+
+    for layout in MAZES:
+        maze = Maze(layout)
+        start = maze.compiled.pacman_start
+        assert all(maze.distance(x, y, *start) < 255 for x, y, _ in maze.dot_cells())
+
+
+def test_parse_mazes():
+    """Maze files hold several mazes separated by blank lines"""
+    text = "; two tiny mazes\n#####\n#P.G#\n#####\n\n#####\n#.PG\n#####\n"
+    mazes = parse_mazes(text)
+    assert mazes == [["#####", "#P.G#", "#####"], ["#####", "#.PG#", "#####"]]
+    try:
+        parse_mazes("#####\n#..G#\n#####\n")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("a maze without 'P' must be rejected")
+    try:
+        parse_mazes("########\n#PGGGGG#\n########\n")
+    except ValueError as error:
+        assert "5 ghost starts" in str(error)
+    else:
+        raise AssertionError("more than 4 ghost starts must be rejected")
+
+
+def test_mazes_compiled_up_front():
+    """Every maze is compiled when the sim starts, not on level change"""
+    from games.game_006_pacman_mazes import _compiled
+    from games.game_006_pacman_sim import PacManSim
+
+    mazes = [["#######", "#P.G..#", "#######"], ["#######", "#..G.P#", "#######"]]
+    PacManSim(mazes)
+    assert all(tuple(layout) in _compiled for layout in mazes)
+
+
+def test_headless_sim_and_agents():
+    """step() is deterministic per seed and the agents beat random play"""
+    from games.game_006_pacman_agents import VectorSim, make_agent, run_episodes
+    from games.game_006_pacman_sim import PacManSim
+
+    def play(seed):
+        sim = PacManSim(seed=seed)
+        agent = make_agent('greedy')
+        observation = sim.observe()
+        while not observation['done'] and sim.steps < 3000:
+            observation = sim.step(agent.act(sim))
+        return observation
+
+    first = play(3)
+    assert first == play(3)
+    assert first['done'] and first['lives'] == 0 and first['score'] > 0
+
+    vec = VectorSim(4, seed=0, max_steps=50)
+    observations = vec.step(['LEFT', 'RIGHT', None, 'UP'])
+    assert len(observations) == 4 and all(o['pacman'] for o in observations)
+
+    means = {}
+    for agent in ('random', 'greedy', 'safe'):
+        results = list(run_episodes(8, agent, workers=1, batch=4, max_steps=1500))
+        assert sorted(r['episode'] for r in results) == list(range(8))
+        means[agent] = sum(r['score'] for r in results) / len(results)
+    assert means['random'] < means['greedy'] < means['safe']
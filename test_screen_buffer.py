@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test script for the dirty-region screen buffer
+Uses a fake window that records the addstr() calls reaching curses
+"""
+
+from utils.screen_buffer import ScreenBuffer
+
+
+class FakeWindow:
+    """Records addstr() calls instead of drawing"""
+
+    def __init__(self, height=5, width=20):
+        self.size = (height, width)
+        self.calls = []
+
+    def getmaxyx(self):
+        return self.size
+
+    def addstr(self, y, x, text, attr=0):
+        self.calls.append((y, x, text, attr))
+
+    def refresh(self):
+        pass
+
+    def noutrefresh(self):
+        pass
+
+
+def draw(screen, player_x):
+    screen.erase()
+    screen.addstr(0, 0, "Score: 10", 1)
+    screen.addstr(3, player_x, "/^\\", 2)
+    screen.refresh()
+
+
+def test_only_changed_cells_are_sent():
+    """An unchanged frame sends nothing; a moved sprite sends one short run"""
+    window = FakeWindow()
+    screen = ScreenBuffer(window)
+    draw(screen, 5)
+    assert window.calls, "first frame is drawn in full"
+
+    window.calls.clear()
+    draw(screen, 5)
+    assert window.calls == []
+
+    draw(screen, 6)
+    # Cells 5..8 change (old left edge blanked, sprite shifted) and share attr 0/2,
+    # so at most two runs are sent and nothing on row 0
+    assert all(y == 3 for y, _, _, _ in window.calls)
+    assert len(window.calls) <= 2
+    assert screen.chars[3][6:9] == ['/', '^', '\\']
+
+
+def test_clipping_and_wide_chars():
+    """Text is clipped at the edges and wide chars occupy two cells"""
+    window = FakeWindow(height=2, width=6)
+    screen = ScreenBuffer(window)
+    screen.addstr(0, -2, "abcdefgh")
+    screen.addstr(5, 0, "off screen")
+    screen.addstr(1, 0, "分數x")
+    screen.addstr(1, 5, "分")  # does not fit in the last cell
+    screen.refresh()
+
+    assert ''.join(screen.chars[0]) == "cdefgh"
+    assert screen.chars[1][:5] == ['分', '', '數', '', 'x']
+    assert screen.chars[1][5] == ' '
+    assert (1, 0, "分數x ", 0) in window.calls
+
+
+def test_static_layer_is_drawn_once():
+    """Static layers are cached and only redrawn on request"""
+    window = FakeWindow()
+    screen = ScreenBuffer(window)
+    drawn = []
+
+    def walls(canvas):
+        drawn.append(1)
+        canvas.addstr(4, 0, "#" * 20, 3)
+
+    screen.add_static_layer(walls)
+    draw(screen, 0)
+    window.calls.clear()
+    for x in range(1, 4):
+        draw(screen, x)
+    assert len(drawn) == 1
+    assert ''.join(screen.chars[4]) == "#" * 20
+    assert not any(y == 4 for y, _, _, _ in window.calls)
+
+    screen.redraw_static()
+    assert len(drawn) == 2
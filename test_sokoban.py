@@ -4,7 +4,22 @@ Test script for Sokoban levels
 Verifies each level is valid and provides solutions
 """
 
-from games.game_010_sokoban import LEVELS
+import random
+from collections import deque
+
+import pytest
+
+from games import game_010_sokoban_tables as tables_module
+from games.game_010_sokoban import LEVELS, Sokoban, STEP_DIRECTIONS
+from games.game_010_sokoban_solver import SokobanSolver
+from games.game_010_sokoban_tables import LevelTables, load_tables
+
+
+@pytest.fixture(autouse=True)
+def private_cache(tmp_path, monkeypatch):
+    """Keep level tables out of the project's .cache (and start each test cold)"""
+    monkeypatch.setenv('CLI_GAMES_CACHE', str(tmp_path / 'cache'))
+    monkeypatch.setattr(tables_module, '_memo', {})
 
 def test_level_validity():
     """Test that all levels have correct box/target counts"""
@@ -103,6 +118,189 @@ def analyze_level_playability(level_num):
     print("\n✅ Level appears playable (basic checks passed)")
     return True
 
+def replay_lurd(level, lurd):
+    """Replay a LURD solution on a level, return True if all boxes end on targets"""
+    walls, boxes, targets = set(), set(), set()
+    player = None
+    for y, row in enumerate(level):
+        for x, char in enumerate(row):
+            if char == '#':
+                walls.add((x, y))
+            if char in '@+':
+                player = (x, y)
+            if char in '$*':
+                boxes.add((x, y))
+            if char in '.*+':
+                targets.add((x, y))
+    
+    steps = {'u': (0, -1), 'd': (0, 1), 'l': (-1, 0), 'r': (1, 0)}
+    for move in lurd:
+        dx, dy = steps[move.lower()]
+        nxt = (player[0] + dx, player[1] + dy)
+        assert nxt not in walls, f"walked into a wall with '{move}'"
+        if nxt in boxes:
+            assert move.isupper(), f"push written as a plain move '{move}'"
+            dest = (nxt[0] + dx, nxt[1] + dy)
+            assert dest not in walls and dest not in boxes, f"blocked push '{move}'"
+            boxes.remove(nxt)
+            boxes.add(dest)
+        else:
+            assert move.islower(), f"plain move written as a push '{move}'"
+        player = nxt
+    return boxes == targets
+
+def test_solver_solves_all_levels():
+    """Every bundled level is solved quickly and the solution replays"""
+    for i, level in enumerate(LEVELS):
+        for algorithm in ('astar', 'ida'):
+            result = SokobanSolver(level).solve(algorithm=algorithm, time_limit=5)
+            assert result.solved, f"Level {i+1} ({algorithm}): {result.reason}"
+            assert result.nodes < 1000               # machine-independent "quickly"
+            assert replay_lurd(level, result.lurd), f"Level {i+1} ({algorithm}) replay failed"
+
+def test_solver_detects_deadlock():
+    """A box pushed into a corner off-target has no solution"""
+    level = [
+        "######",
+        "#$   #",
+        "# @ .#",
+        "######"
+    ]
+    result = SokobanSolver(level).solve()
+    assert not result.solved
+    assert result.reason == 'deadlock'
+
+def test_level_tables():
+    """Dead cells and push distances for level 1, and the disk cache round trip"""
+    tables = load_tables(LEVELS[0])
+    assert tables.is_dead(1, 3)          # against the left wall, target is at x=2
+    assert not tables.is_dead(2, 3)      # directly above the target
+    assert tables.push_distance(2, 3) == 1
+    assert tables.push_distance(2, 4) == 0
+    
+    restored = LevelTables.from_dict(tables.to_dict())
+    assert restored.dead == tables.dead
+    assert restored.distances == tables.distances
+    assert restored.dead_cells() == tables.dead_cells()
+
+def make_headless_game():
+    """Sokoban instance without a curses screen (only game state)"""
+    game = Sokoban.__new__(Sokoban)
+    game.levels = LEVELS
+    game.solver = None
+    game.solver_level = None
+    game.search = None
+    game.playback = deque()
+    game.status_message = ""
+    return game
+
+def test_undo_redo_log():
+    """Undo replays steps in reverse and redo restores them exactly"""
+    game = make_headless_game()
+    rng = random.Random(1)
+    for level_num in range(len(LEVELS)):
+        game.load_level(level_num)
+        snapshots = [(game.state_key(), game.moves, game.pushes)]
+        for _ in range(200):
+            if game.move_player(*rng.choice(STEP_DIRECTIONS)):
+                snapshots.append((game.state_key(), game.moves, game.pushes))
+        assert len(game.history) == len(snapshots) - 1
+        
+        for expected in reversed(snapshots[:-1]):
+            assert game.undo()
+            assert (game.state_key(), game.moves, game.pushes) == expected
+        assert not game.undo()
+        
+        for expected in snapshots[1:]:
+            assert game.redo()
+            assert (game.state_key(), game.moves, game.pushes) == expected
+        assert not game.redo()
+
+def test_level_pack(tmp_path):
+    """Packs are indexed once, cached next to the file and decode RLE rows"""
+    from games.game_010_sokoban_levels import LevelPack, decode_row
+    assert decode_row("4#|#-.#") == ["####", "# .#"]
+    path = tmp_path / "pack.xsb"
+    path.write_text("; First\n\n" + "\n".join(LEVELS[0]) + "\n\n"
+                    "4#|#.@#|#$-#|4#\nTitle: Tiny\n")
+    pack = LevelPack(str(path))
+    assert len(pack) == 2
+    assert pack.title(0) == "First" and pack.title(1) == "Tiny"
+    assert pack[0] == [row.rstrip() for row in LEVELS[0]]
+    assert pack[1] == ["####", "#.@#", "#$ #", "####"]
+    assert (tmp_path / "pack.xsb.idx").exists()
+    assert LevelPack(str(path)).index == pack.index
+
+def test_bench_flags_regressions():
+    """The benchmark solves the bundled levels and flags worse results"""
+    from games.game_010_sokoban_bench import level_tasks, run_bench, compare
+    rows = list(run_bench(level_tasks(levels=[1, 2], time_limit=5), workers=1))
+    assert all(row['solved'] for row in rows)
+    baseline = {(row['pack'], row['level']): dict(row) for row in rows}
+    assert compare(rows, baseline) == []
+    worse = dict(rows[0], solved=0, reason='time limit')
+    assert "no longer solved" in compare([worse], baseline)[0]
+
+def test_solver_resumes_interrupted_search():
+    """A search stopped by a limit continues where it left off"""
+    level = LEVELS[9]
+    fresh = SokobanSolver(level).solve()
+    solver = SokobanSolver(level)
+    calls = []
+    while True:
+        result = solver.solve(max_nodes=2)
+        calls.append(result)
+        if result.solved:
+            break
+        assert result.reason == 'node limit'
+        assert len(solver.saved_searches) == 1
+    assert len(calls) > 2
+    assert sum(result.nodes for result in calls) == fresh.nodes
+    assert result.lurd == fresh.lurd
+    assert not solver.saved_searches
+
+def test_hint_replay_and_solution_cache():
+    """Hints replay one push at a time; later hints come from the solution cache"""
+    game = make_headless_game()
+    game.load_level(9)
+    start = game.state_key()
+    game.request_solution('hint')
+    game.search.thread.join()
+    game.poll_search()
+    lurd = game.solution_cache[start]
+    assert replay_lurd(LEVELS[9], lurd)
+
+    done = ''
+    while not game.check_win():
+        hint = ''.join(game.playback)
+        assert hint == lurd[len(done):len(done) + len(hint)]
+        assert sum(move.isupper() for move in hint) == 1 and hint[-1].isupper()
+        while game.playback:
+            game.play_next_move()
+        done += hint
+        assert game.solution_cache[game.state_key()] == lurd[len(done):]
+        game.request_solution('hint')
+        assert game.search is None            # served from the cache
+    assert done == lurd
+
+    game.restart_level()
+    game.request_solution('solve')
+    assert game.search is None and ''.join(game.playback) == lurd
+
+def test_bench_survives_malformed_levels():
+    """A broken level gives an unsolved row with a reason; the run goes on"""
+    from games.game_010_sokoban_bench import bench_level, run_bench
+    no_player = ["#####", "#$ .#", "#####"]
+    row = bench_level(('pack', 1, 'No player', no_player, 'astar', 5, False))
+    assert row['solved'] == 0 and row['reason'] == 'no player'
+
+    ragged = ["####", "#@$.#", None]
+    tasks = [('pack', 1, 'Broken', ragged, 'astar', 5, False),
+             ('pack', 2, 'Level 1', LEVELS[0], 'astar', 5, False)]
+    rows = sorted(run_bench(tasks, workers=2), key=lambda row: row['level'])
+    assert rows[0]['solved'] == 0 and rows[0]['reason'].startswith('error: ')
+    assert rows[1]['solved'] == 1
+
 # Known solutions for first few levels (move sequences)
 SOLUTIONS = {
     1: "uurrdddlll",  # Example solution
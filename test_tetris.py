@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Test script for the Tetris bitmask board
+Checks mask collision, drop distance and line clears against the block grid
+"""
+
+import copy
+import random
+
+from games.game_005_tetris_engine import Board, Piece, SHAPES, BOARD_WIDTH, BOARD_HEIGHT
+
+
+def reference_is_valid(board, piece):
+    """Original block-by-block collision check on board.grid"""
+    for x, y in piece.get_blocks():
+        if x < 0 or x >= board.width or y >= board.height:
+            return False
+        if y >= 0 and board.grid[y][x] is not None:
+            return False
+    return True
+
+
+def random_board(rng):
+    board = Board()
+    for y in range(BOARD_HEIGHT // 2, BOARD_HEIGHT):
+        for x in range(BOARD_WIDTH):
+            if rng.random() < 0.5:
+                board.grid[y][x] = 'I'
+                board.rows[y] |= 1 << x
+    return board
+
+
+def test_masks_match_blocks():
+    """Bitmask collision and drop distance agree with the block grid"""
+    rng = random.Random(5)
+    for _ in range(200):
+        board = random_board(rng)
+        for shape_type, rotations in SHAPES.items():
+            piece = Piece(shape_type)
+            piece.rotation = rng.randrange(len(rotations))
+            piece.shape = rotations[piece.rotation]
+            piece.x = rng.randrange(-2, BOARD_WIDTH)
+            piece.y = rng.randrange(-2, BOARD_HEIGHT)
+            assert board.is_valid_position(piece) == reference_is_valid(board, piece)
+            if reference_is_valid(board, piece):
+                ghost = piece.copy()
+                while reference_is_valid(board, ghost):
+                    ghost.y += 1
+                assert board.drop_distance(piece) == ghost.y - 1 - piece.y
+
+
+def test_lock_and_clear_lines():
+    """Locked pieces update both views and full rows are removed"""
+    board = Board()
+    for x in range(0, BOARD_WIDTH - 1, 2):
+        piece = Piece('O')
+        piece.x = x
+        piece.y = board.drop_distance(piece)
+        board.lock_piece(piece)
+    assert board.rows[-1] == board.rows[-2] == board.full_row
+    assert board.clear_lines() == 2
+    assert board.rows == [0] * BOARD_HEIGHT
+    assert all(cell is None for row in board.grid for cell in row)
+
+
+def test_ai_clears_lines():
+    """The autoplayer places pieces legally and keeps the board alive"""
+    from games.game_005_tetris_ai import TetrisAI, board_features
+    assert board_features([0] * 17 + [0b1, 0b0, 0b1111111110], 10) == (12, 0, 2, 2, 0)
+
+    rng = random.Random(3)
+    types = sorted(SHAPES)
+    board = Board()
+    ai = TetrisAI()
+    current, upcoming = rng.choice(types), rng.choice(types)
+    lines = 0
+    for _ in range(300):
+        placement = ai.choose(board, current, upcoming, can_hold=False)
+        piece = Piece(current)
+        placement.apply(piece)
+        assert board.is_valid_position(piece)
+        piece.y += board.drop_distance(piece)
+        board.lock_piece(piece)
+        lines += board.clear_lines()
+        assert not board.is_game_over()
+        current, upcoming = upcoming, rng.choice(types)
+    assert lines >= 100
+
+
+def test_ai_takes_over_a_moved_piece():
+    """play() drops from the spawn row even after the player moved the piece"""
+    from games.game_005_tetris_ai import TetrisAI
+    from games.game_005_tetris_engine import TetrisEngine
+
+    ai = TetrisAI()
+    rng = random.Random(5)
+    for seed in range(40):
+        engine = TetrisEngine(seed)
+        for _ in range(20):
+            untouched = copy.deepcopy(engine)
+            while engine.soft_drop() and rng.random() < 0.95:
+                pass
+            engine.move_piece(rng.choice((-1, 1)), 0)
+            ai.play(engine)
+            ai.play(untouched)
+            assert engine.board.rows == untouched.board.rows
+            if engine.game_over:
+                break
+
+
+def test_auto_mode_ignores_movement_keys():
+    """While the AI plays, movement/rotate/drop/hold keys do nothing"""
+    import curses
+    from games.game_005_tetris import Tetris
+    from games.game_005_tetris_engine import TetrisEngine
+
+    class Keys:
+        def __init__(self, keys):
+            self.keys = list(keys)
+
+        def getch(self):
+            return self.keys.pop(0)
+
+    keys = [curses.KEY_LEFT, curses.KEY_RIGHT, curses.KEY_DOWN, curses.KEY_UP,
+            ord('z'), ord(' '), ord('c')]
+    game = Tetris.__new__(Tetris)                 # no curses screen needed
+    TetrisEngine.__init__(game, seed=1)
+    game.stdscr = Keys(keys)
+    game.auto = True
+    game.paused = False
+    piece = game.current_piece
+    before = (piece.x, piece.y, piece.rotation, game.pieces, game.hold_piece)
+    for _ in keys:
+        assert game.handle_input()
+    assert game.current_piece is piece
+    assert (piece.x, piece.y, piece.rotation, game.pieces, game.hold_piece) == before
+
+
+def test_headless_engine_and_tuner(tmp_path):
+    """Seeded headless games repeat exactly and the tuner checkpoint resumes"""
+    from games.game_005_tetris_ai import TetrisAI, play_game
+    from games.game_005_tetris_tune import Tuner, load_checkpoint, main
+
+    first = play_game(TetrisAI(), seed=7, max_pieces=120)
+    second = play_game(TetrisAI(), seed=7, max_pieces=120)
+    assert first.pieces == 120
+    assert (first.lines, first.score, first.board.rows) == (second.lines, second.score,
+                                                           second.board.rows)
+
+    tuner = Tuner(population=4, elite=2, games=1, max_pieces=40, seed=1)
+    tuner.step()
+    path = str(tmp_path / "tune.json")
+    tuner.save(path)
+    resumed = load_checkpoint(path)
+    assert resumed.generation == 1
+    assert resumed.mean == tuner.mean and resumed.best == tuner.best
+
+    # Settings that differ from the checkpoint are refused unless --fresh
+    main(["-g", "0", "-j", "1", "-c", path, "-p", "4", "--seed", "1"])
+    try:
+        main(["-g", "0", "-j", "1", "-c", path, "-p", "8"])
+        assert False, "conflicting --population was accepted"
+    except SystemExit as error:
+        assert "--population 8 (checkpoint: 4)" in str(error.code)
+    main(["-g", "0", "-j", "1", "-c", path, "-p", "8", "--fresh"])
+
+
+def test_piece_generators():
+    """Seeded generators repeat, 7-bag deals every piece once per bag"""
+    from games.game_005_tetris_pieces import GENERATORS, PieceQueue, make_generator
+    from games.game_005_tetris_engine import TetrisEngine
+
+    for name in GENERATORS:
+        stream_a = PieceQueue(make_generator(name, 11), 3)
+        stream_b = PieceQueue(make_generator(name, 11), 3)
+        pieces = [stream_a.pop() for _ in range(50)]
+        assert pieces == [stream_b.pop() for _ in range(50)]
+        assert set(pieces) <= set(SHAPES)
+
+    bag = make_generator('bag', 2)
+    for _ in range(5):
+        assert sorted(bag.next_type() for _ in range(7)) == sorted(SHAPES)
+
+    queue = PieceQueue(make_generator('history', 4), 4)
+    upcoming = queue.peek()
+    assert [queue.pop() for _ in range(4)] == upcoming
+
+    engine = TetrisEngine(seed=9, generator='bag')
+    expected = engine.preview(3)
+    engine.hard_drop()
+    assert [engine.next_piece.type] + engine.preview(2) == expected
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Test script for the Wordle word index
+Checks the word index (normalisation, membership, binary search, cache format)
+the precomputed feedback matrix and the entropy solver
+"""
+
+from games import game_009_wordle_feedback as feedback
+from games.game_009_wordle import Wordle
+from games.game_009_wordle_feedback import (bitset_columns, decode, encode, load_matrix, score,
+                                            solved_pattern, typecode)
+from games.game_009_wordle_solver import (MAX_GUESSES, MultiBoardSolver, WordleSolver, max_attempts,
+                                          opening_guess, parse_args, random_games, run_benchmark)
+from games.game_009_wordle_words import WORD_LENGTHS, WORD_LIST, WordIndex, load_index
+
+
+def test_word_index(tmp_path, monkeypatch):
+    """Answers are normalised 5-letter words and every answer is a valid guess"""
+    monkeypatch.setenv('CLI_GAMES_CACHE', str(tmp_path))
+    index = load_index()
+    assert index.answers == tuple(sorted(set(index.answers)))
+    assert all(len(word) == 5 for word in index.answers)
+    assert 'SPEED' in index.answers               # repeated letters are allowed
+    assert set(index.answers) <= index.allowed
+    assert 'CRANE' in index and 'crane' in index
+    assert 'ZZZZZ' not in index
+    assert 'ZAGGED' not in index          # wrong length in the raw list
+
+    position = index.index_of('crane')
+    assert index.word_at(position) == 'CRANE'
+    assert index.index_of('ZZZZZ') == -1
+    assert index.index_of('AB') == -1
+    assert load_index() is index          # memoized
+
+
+def test_custom_lists_and_cache_format(tmp_path, monkeypatch):
+    """Extra guesses are allowed but never chosen; to_bytes/from_bytes round-trips"""
+    monkeypatch.setenv('CLI_GAMES_CACHE', str(tmp_path))
+    index = WordIndex.build(['apple', 'Crane', 'crane', 'slate', 'x1yz2'], ['ABBEY'],
+                            distinct_answers=True)
+    assert index.answers == ('CRANE', 'SLATE')   # APPLE repeats a letter
+    assert sorted(index.allowed) == ['ABBEY', 'APPLE', 'CRANE', 'SLATE']
+    assert [index.word_at(i) for i in range(len(index))] == sorted(index.allowed)
+
+    restored = WordIndex.from_bytes(index.to_bytes())
+    assert restored.answers == index.answers
+    assert restored.allowed == index.allowed
+    assert WordIndex.from_bytes(b'junk') is None
+    assert WordIndex.from_bytes(index.to_bytes()[:-1]) is None
+
+    loaded = load_index(['crane', 'slate'], ['abbey'], use_cache=False)
+    assert 'ABBEY' in loaded and loaded.answers == ('CRANE', 'SLATE')
+    assert len(WORD_LIST) > len(load_index().answers)
+
+
+def test_unusable_cache_dir(tmp_path, monkeypatch):
+    """A cache root that cannot be created just disables the disk cache"""
+    blocker = tmp_path / 'not-a-dir'
+    blocker.write_text('')
+    monkeypatch.setenv('CLI_GAMES_CACHE', str(blocker))
+    index = load_index(['crane', 'slate', 'pious'], ['abbey'])
+    matrix = load_matrix(index)
+    assert matrix.pattern('CRANE', 'SLATE') == score('CRANE', 'SLATE')
+    assert opening_guess(WordleSolver(matrix)) in index.allowed
+    assert blocker.read_text() == ''
+
+
+def test_feedback_patterns():
+    """Base-3 patterns handle repeated letters like the two-pass check"""
+    assert decode(score('CRANE', 'CRANE'), 5) == ['green'] * 5
+    assert decode(score('SPEED', 'ABIDE'), 5) == ['gray', 'gray', 'yellow', 'gray', 'yellow']
+    assert decode(score('EERIE', 'SPEED'), 5) == ['yellow', 'yellow', 'gray', 'gray', 'gray']
+    assert decode(score('LLAMA', 'HELLO'), 5) == ['yellow', 'yellow', 'gray', 'gray', 'gray']
+    assert decode(score('ABBEY', 'BABES'), 5) == ['yellow', 'yellow', 'green', 'green', 'gray']
+    assert decode(score('EERIE', 'EERIE'), 5) == ['green'] * 5
+    assert score(b'SPEED', b'ABIDE') == score('SPEED', 'ABIDE')
+    assert encode(decode(200, 5)) == 200
+    assert typecode(5) == 'B' and typecode(6) == 'H'
+
+
+def test_feedback_matrix(tmp_path, monkeypatch):
+    """Matrix rows match score(), survive the disk cache, and agree across builds"""
+    monkeypatch.setenv('CLI_GAMES_CACHE', str(tmp_path))
+    index = WordIndex.build(WORD_LIST[:300], ['LLAMA', 'EERIE', 'SPEED'])
+    matrix = load_matrix(index)
+    assert list(tmp_path.glob('wordle/*.fbm'))
+    for guess in ('LLAMA', 'EERIE', index.guesses[7]):
+        row = matrix.row(matrix.guess_row[guess])
+        assert [int(p) for p in row] == [score(guess, answer) for answer in index.answers]
+
+    feedback._memo.clear()
+    reloaded = load_matrix(index)                 # memory-mapped from the cache file
+    assert reloaded is not matrix
+    assert reloaded.pattern('SPEED', index.answers[0]) == score('SPEED', index.answers[0])
+    answer = index.answers[-1]
+    assert reloaded.colors(answer, answer) == ['green'] * 5
+
+    rows = feedback.build_rows_python(index.guesses, index.answers)
+    assert b''.join(rows) == feedback.build_matrix_bytes(index)[feedback.HEADER.size:]
+
+
+def test_solver(tmp_path, monkeypatch):
+    """The solver keeps only consistent answers and solves every answer in <= 6"""
+    monkeypatch.setenv('CLI_GAMES_CACHE', str(tmp_path))
+    index = load_index()
+    solver = WordleSolver(load_matrix(index))
+    opener = solver.best_guess()
+    assert opener in index
+    assert opening_guess(solver) == opener        # cached
+
+    attempts = [('RAISE', decode(score('RAISE', 'CLOTH'), 5))]
+    solver.sync(attempts)
+    assert 'CLOTH' in solver.remaining()
+    assert all(score('RAISE', word) == score('RAISE', 'CLOTH') for word in solver.remaining())
+    solver.sync([])                               # new game
+    assert len(solver.candidates) == len(index.answers)
+
+    results = list(run_benchmark(solver, index.answers[::25]))
+    assert all(r['solved'] and r['guesses'] <= MAX_GUESSES for r in results)
+    assert sum(r['guesses'] for r in results) / len(results) < 4
+
+
+def test_keyboard_letter_counts(tmp_path, monkeypatch):
+    """Repeated letters raise the known minimum; a gray copy caps the count"""
+    monkeypatch.setenv('CLI_GAMES_CACHE', str(tmp_path))
+    game = Wordle.__new__(Wordle)                 # no curses screen needed
+    game.words = load_index()
+    game.word_length = 5
+    game.assist = False
+    game.num_boards = 1
+    game.reset_game()
+    game.target_word = 'SPEED'
+
+    result = game.check_guess('EERIE')
+    game.update_keyboard('EERIE', result)
+    e = ord('E') - ord('A')
+    assert game.min_counts[e] == 2 and game.max_counts[e] == 2
+    assert game.keyboard_state['E'] == 'yellow'
+    assert game.max_counts[ord('R') - ord('A')] == 0
+
+    result = game.check_guess('SPEED')
+    game.update_keyboard('SPEED', result)
+    assert game.keyboard_state['E'] == 'green'
+    assert game.min_counts[e] == 2
+
+
+def test_word_lengths_and_partitions(tmp_path, monkeypatch):
+    """4-8 letter dictionaries; partitions split the answers into disjoint bitsets"""
+    monkeypatch.setenv('CLI_GAMES_CACHE', str(tmp_path))
+    for length in WORD_LENGTHS:
+        index = load_index(length=length)
+        assert len(index.answers) > 300
+        assert all(len(word) == length for word in index.guesses)
+    try:
+        load_index(length=3)
+        assert False, "length 3 should be rejected"
+    except ValueError:
+        pass
+
+    matrix = load_matrix(load_index(length=7))
+    assert typecode(7) == 'H' and solved_pattern(7) == 3 ** 7 - 1
+    groups = matrix.partition('LEISURE')
+    union = 0
+    for pattern, bits in groups.items():
+        assert not union & bits
+        union |= bits
+        assert all(matrix.pattern('LEISURE', matrix.answers[c]) == pattern
+                   for c in bitset_columns(bits))
+    assert union == matrix.all_answers
+    assert bitset_columns(0b10110) == [1, 2, 4]
+
+
+def test_multi_board_solver(tmp_path, monkeypatch):
+    """Each board prunes its own bitset; all boards get solved within the limit"""
+    monkeypatch.setenv('CLI_GAMES_CACHE', str(tmp_path))
+    matrix = load_matrix(load_index())
+    solver = MultiBoardSolver(matrix, 4)
+    board_attempts = [[('RAISE', decode(score('RAISE', word), 5))]
+                      for word in ('CLOTH', 'RAISE', 'SPEED', 'ABBEY')]
+    solver.sync(board_attempts)
+    assert solver.boards[1].solved
+    assert [board.solved for board in solver.open_boards()] == [False] * 3
+    assert 'SPEED' in solver.boards[2].remaining()
+    assert solver.best_guess() in matrix.guess_row
+
+    games = random_games(matrix.answers, 5, 4, seed=1)
+    results = list(run_benchmark(solver, games))
+    assert all(r['solved'] and r['guesses'] <= max_attempts(4) for r in results)
+
+    for boards in ('0', '-1', '9'):
+        try:
+            parse_args(['--boards', boards])
+            assert False, f"--boards {boards} should be rejected"
+        except SystemExit:
+            pass
+    assert parse_args(['--boards', '8']).boards == 8
@@ -0,0 +1,68 @@
+"""
+Disk cache helpers
+Precomputed tables (level analysis, word indexes, ...) are stored under
+.cache/ in the project root, or under $CLI_GAMES_CACHE if it is set.
+"""
+import hashlib
+import os
+import pickle
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def cache_dir(*parts):
+    """Return (and create) a cache directory, e.g. cache_dir('sokoban')
+
+    Returns None if the directory cannot be created (read-only checkout, bad
+    $CLI_GAMES_CACHE, ...); callers then simply run without the cache.
+    """
+    root = os.environ.get('CLI_GAMES_CACHE') or os.path.join(PROJECT_ROOT, '.cache')
+    path = os.path.join(root, *parts)
+    try:
+        os.makedirs(path, exist_ok=True)
+    except OSError:
+        return None
+    return path
+
+
+def cache_file(part, name):
+    """Path of a file in cache_dir(part), or None if the cache is unavailable"""
+    directory = cache_dir(part)
+    return os.path.join(directory, name) if directory else None
+
+
+def content_key(*chunks):
+    """Stable hex digest of some strings/bytes (used as a cache file name)"""
+    digest = hashlib.sha1()
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode('utf-8')
+        digest.update(chunk)
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def write_atomic(path, data):
+    """Write bytes to path via a temp file so readers never see half a file"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def load_pickle(path):
+    """Load a pickled cache file, or None if it is missing or unreadable"""
+    try:
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ValueError):
+        return None
+
+
+def save_pickle(path, obj):
+    """Pickle obj to path; cache write failures are not fatal"""
+    try:
+        write_atomic(path, pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+        return True
+    except OSError:
+        return False
@@ -0,0 +1,122 @@
+"""
+Fixed-timestep game loop
+The simulation advances in fixed steps of `step` seconds no matter how long
+input and rendering take. Leftover time is kept in an accumulator and
+exposed as `alpha` (0..1, fraction of the next step) so render() can
+interpolate positions between updates.
+
+time_scale speeds the simulation up or slows it down (default taken from
+$CLI_GAMES_TIME_SCALE, e.g. 4 to fast-forward). Headless mode skips input,
+rendering and sleeping and calls update() back to back (tests, AI training).
+
+Usage:
+    loop = GameLoop(self.update, self.render, self.handle_input, step=1 / 30)
+    loop.run(until=lambda: self.game_over)
+"""
+import os
+import time
+
+DEFAULT_FPS = 30
+MAX_FRAME_TIME = 0.25  # real seconds; longer stalls are dropped, not caught up
+
+
+def env_time_scale():
+    """time_scale from $CLI_GAMES_TIME_SCALE (1.0 if unset or invalid)"""
+    try:
+        scale = float(os.environ.get('CLI_GAMES_TIME_SCALE', 1.0))
+    except ValueError:
+        return 1.0
+    return scale if scale > 0 else 1.0
+
+
+class GameLoop:
+    """Fixed-timestep update loop with a render-rate frame limiter
+
+    update(dt) is called with the fixed step, render() once per frame and
+    handle_input() once per frame before the updates (returning False stops
+    the loop). `step` may be changed between updates, e.g. when a game
+    speeds up.
+    """
+
+    def __init__(self, update, render=None, handle_input=None, step=1.0 / DEFAULT_FPS,
+                 fps=DEFAULT_FPS, time_scale=None, headless=False,
+                 clock=time.perf_counter, sleep=time.sleep):
+        self.update = update
+        self.render = render
+        self.handle_input = handle_input
+        self.step = step
+        self.frame_time = 1.0 / fps
+        self.time_scale = env_time_scale() if time_scale is None else time_scale
+        self.headless = headless
+        self.clock = clock
+        self.sleep = sleep
+
+        self.accumulator = 0.0
+        self.alpha = 0.0
+        self.sim_time = 0.0
+        self.updates = 0
+        self.frames = 0
+        self.running = False
+        self.until = None
+
+    def stop(self):
+        """Stop after the current update/frame"""
+        self.running = False
+
+    def _check_until(self):
+        if self.until is not None and self.until():
+            self.running = False
+        return self.running
+
+    def tick(self):
+        """Run one fixed update"""
+        self.update(self.step)
+        self.sim_time += self.step
+        self.updates += 1
+        return self._check_until()
+
+    def advance(self, elapsed):
+        """Add real elapsed seconds and run the fixed updates they cover"""
+        self.accumulator += min(elapsed, MAX_FRAME_TIME) * self.time_scale
+        count = 0
+        while self.running and self.accumulator >= self.step:
+            self.accumulator -= self.step
+            self.tick()
+            count += 1
+        self.alpha = min(self.accumulator / self.step, 1.0) if self.step else 0.0
+        return count
+
+    def run(self, until=None, max_updates=None):
+        """Run until stopped, until() is true or max_updates updates; return updates run"""
+        self.running = True
+        self.until = until
+        if not self._check_until():
+            return self.updates
+
+        if self.headless:
+            while self.running and (max_updates is None or self.updates < max_updates):
+                self.tick()
+            return self.updates
+
+        last = self.clock()
+        while self.running:
+            start = self.clock()
+            if self.handle_input is not None and self.handle_input() is False:
+                self.running = False
+                break
+            if not self._check_until():
+                break
+
+            self.advance(start - last)
+            last = start
+            if self.render is not None:
+                self.render()
+            self.frames += 1
+            if max_updates is not None and self.updates >= max_updates:
+                break
+
+            remaining = self.frame_time - (self.clock() - start)
+            if remaining > 0:
+                self.sleep(remaining)
+        self.running = False
+        return self.updates
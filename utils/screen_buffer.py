@@ -0,0 +1,236 @@
+"""
+Dirty-region screen buffer
+Games draw a full frame into a back buffer of (char, attr) cells with the
+same erase()/addstr()/refresh() calls they would make on stdscr. On
+refresh() the back buffer is diffed against the previous frame and only
+the changed cells are sent to curses, one addstr() per run of cells that
+share an attribute (short unchanged gaps are merged into the run, which is
+cheaper than moving the cursor).
+
+Wide characters (CJK, most emoji) take two cells; the second one holds an
+empty string placeholder so columns stay aligned.
+
+Static layers (maze walls, borders, help text) are drawn once into an
+off-screen Canvas; erase() starts every frame from a copy of them, so only
+the dynamic parts (actors, pieces, scores) are drawn per frame. Call
+redraw_static() when a static layer changes (e.g. a new level).
+
+Usage:
+    self.screen = ScreenBuffer(stdscr)
+    self.screen.add_static_layer(self.draw_walls)  # draw_walls(canvas)
+    self.screen.erase()
+    self.screen.addstr(y, x, "text", curses.color_pair(1))
+    self.screen.refresh()
+"""
+import curses
+import unicodedata
+
+MERGE_GAP = 3  # unchanged cells bridged inside a run
+UNKNOWN = '\0'  # front-buffer value that never matches a real cell
+
+NARROW_CACHE_SIZE = 4096
+
+_widths = {}
+_narrow = {}
+
+
+def char_width(char):
+    """Terminal cell width of one character (1 or 2, 0 for combining marks)"""
+    width = _widths.get(char)
+    if width is None:
+        if unicodedata.combining(char):
+            width = 0
+        elif unicodedata.east_asian_width(char) in ('W', 'F'):
+            width = 2
+        else:
+            width = 1
+        _widths[char] = width
+    return width
+
+
+def is_narrow(text):
+    """True if every character of text takes exactly one cell"""
+    if text.isascii():
+        return True
+    narrow = _narrow.get(text)
+    if narrow is None:
+        narrow = all(char_width(char) == 1 for char in text)
+        if len(_narrow) < NARROW_CACHE_SIZE:
+            _narrow[text] = narrow
+    return narrow
+
+
+class Canvas:
+    """Off-screen grid of (char, attr) cells with a curses-like addstr()"""
+
+    def __init__(self, height, width):
+        self.height = height
+        self.width = width
+        self.chars = [[' '] * width for _ in range(height)]
+        self.attrs = [[0] * width for _ in range(height)]
+
+    def getmaxyx(self):
+        return self.height, self.width
+
+    def clear(self):
+        for y in range(self.height):
+            self.chars[y] = [' '] * self.width
+            self.attrs[y] = [0] * self.width
+
+    def addstr(self, y, x, text, attr=0):
+        """Write text (clipped to the canvas)"""
+        if not 0 <= y < self.height:
+            return
+        if not text.isascii() and not _narrow.get(text, False) and not is_narrow(text):
+            self._addstr_wide(y, x, text, attr)
+            return
+
+        # Fast path: one cell per character, written with slice assignment
+        if x < 0:
+            text = text[-x:]
+            x = 0
+        end = x + len(text)
+        if end > self.width:
+            end = self.width
+        if end <= x:
+            return
+        chars = self.chars[y]
+        if chars[x] == '' and x > 0:
+            # Overwriting the right half of a wide char blanks its left half
+            chars[x - 1] = ' '
+        if end < self.width and chars[end] == '':
+            chars[end] = ' '
+        chars[x:end] = text[:end - x]
+        self.attrs[y][x:end] = [attr] * (end - x)
+
+    def _addstr_wide(self, y, x, text, attr):
+        chars = self.chars[y]
+        attrs = self.attrs[y]
+        width = self.width
+        for char in text:
+            w = char_width(char)
+            if w == 0:
+                continue
+            if x >= width:
+                break
+            if x >= 0:
+                if x + w > width:
+                    break
+                if chars[x] == '' and x > 0:
+                    chars[x - 1] = ' '
+                chars[x] = char
+                attrs[x] = attr
+                if w == 2:
+                    chars[x + 1] = ''
+                    attrs[x + 1] = attr
+                elif x + 1 < width and chars[x + 1] == '':
+                    chars[x + 1] = ' '
+            x += w
+
+    addch = addstr
+
+
+class ScreenBuffer(Canvas):
+    """Back/front cell buffers over a curses window, with cached static layers"""
+
+    def __init__(self, window):
+        self.window = window
+        self.static_layers = []
+        self.background = None
+        self.front_chars = []
+        self.front_attrs = []
+        self.calls = 0
+        self.cells = 0
+        self.resize()
+
+    def resize(self):
+        """Match the window size; everything is redrawn on the next refresh"""
+        height, width = self.window.getmaxyx()
+        Canvas.__init__(self, height, width)
+        self.redraw_static()
+        self.invalidate()
+
+    def invalidate(self):
+        """Forget what is on the terminal (after something else drew on it)"""
+        self.front_chars = [[UNKNOWN] * self.width for _ in range(self.height)]
+        self.front_attrs = [[0] * self.width for _ in range(self.height)]
+
+    # ----- static layers -----------------------------------------------
+
+    def add_static_layer(self, draw):
+        """Register draw(canvas) as a static layer, drawn below the per-frame content"""
+        self.static_layers.append(draw)
+        self.redraw_static()
+
+    def redraw_static(self):
+        """Redraw the static layers into the cached background"""
+        if not self.static_layers:
+            self.background = None
+            return
+        background = Canvas(self.height, self.width)
+        for draw in self.static_layers:
+            draw(background)
+        self.background = background
+
+    # ----- drawing (back buffer) ---------------------------------------
+
+    def erase(self):
+        """Reset the back buffer to the static layers (or blanks)"""
+        if self.window.getmaxyx() != (self.height, self.width):
+            self.resize()
+        if self.background is None:
+            self.clear()
+            return
+        chars = self.background.chars
+        attrs = self.background.attrs
+        for y in range(self.height):
+            self.chars[y] = chars[y][:]
+            self.attrs[y] = attrs[y][:]
+
+    # ----- output ------------------------------------------------------
+
+    def flush(self):
+        """Send the changed runs to the window (no terminal update yet)"""
+        window = self.window
+        width = self.width
+        for y in range(self.height):
+            chars = self.chars[y]
+            attrs = self.attrs[y]
+            front_chars = self.front_chars[y]
+            front_attrs = self.front_attrs[y]
+            if chars == front_chars and attrs == front_attrs:
+                continue
+
+            x = 0
+            while x < width:
+                if chars[x] == front_chars[x] and attrs[x] == front_attrs[x]:
+                    x += 1
+                    continue
+                start = x - 1 if chars[x] == '' and x > 0 else x
+                attr = attrs[start]
+                end = x + 1
+                scan = end
+                while scan < width and attrs[scan] == attr and scan - end <= MERGE_GAP:
+                    if chars[scan] != front_chars[scan] or attrs[scan] != front_attrs[scan]:
+                        end = scan + 1
+                    scan += 1
+                text = ''.join(chars[start:end])
+                try:
+                    window.addstr(y, start, text, attr)
+                except curses.error:
+                    # Writing the bottom-right cell moves the cursor off-screen
+                    pass
+                self.calls += 1
+                self.cells += end - start
+                x = end
+
+            self.front_chars[y] = list(chars)
+            self.front_attrs[y] = list(attrs)
+
+    def noutrefresh(self):
+        self.flush()
+        self.window.noutrefresh()
+
+    def refresh(self):
+        self.flush()
+        self.window.refresh()